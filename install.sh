@@ -476,6 +476,21 @@ install_lirc_configs() {
     show_random_tip
 }
 
+setup_early_splash_service() {
+    log_progress "Setting up early boot splash service..."
+    SPLASH_SERVICE_FILE="/etc/systemd/system/early_splash.service"
+    LOCAL_SPLASH_SERVICE="/home/volumio/CyFi/service/early_splash.service"
+    if [ -f "$LOCAL_SPLASH_SERVICE" ]; then
+        run_command "cp \"$LOCAL_SPLASH_SERVICE\" \"$SPLASH_SERVICE_FILE\""
+        run_command "systemctl daemon-reload"
+        run_command "systemctl enable early_splash.service"
+        log_message "success" "early_splash.service installed (active from next boot)."
+    else
+        log_message "error" "early_splash.service not found in /home/volumio/CyFi/service."
+        exit 1
+    fi
+}
+
 setup_ir_listener_service() {
     log_progress "Setting up IR Listener service..."
     IR_SERVICE_FILE="/etc/systemd/system/ir_listener.service"
@@ -542,6 +557,7 @@ main() {
     upgrade_pip
     install_python_dependencies
     setup_main_service
+    setup_early_splash_service
     configure_mpd
     install_cava_from_fork
     setup_cava_service
@@ -0,0 +1,141 @@
+# /home/volumio/CyFi/scripts/early_splash.py
+#
+# Puts the CyFi logo on the SSD1322 within a second of boot, long before
+# main.py has imported PIL, luma and socketio. It only needs spidev and
+# RPi.GPIO (for the D/C and reset lines) and a frame pre-packed by
+# DisplayManager.update_splash(), which is sent to the panel as is.
+#
+# Afterwards /tmp/cyfi_splash_shown holds this boot's id; DisplayManager
+# then takes the panel over without resetting or blanking it.
+
+import os
+import struct
+import sys
+import time
+
+import RPi.GPIO as GPIO
+import spidev
+
+SPLASH_PATH = "/home/volumio/CyFi/src/assets/images/splash.ssd1322"
+HANDOVER_PATH = "/tmp/cyfi_splash_shown"
+
+# Same layout as src/display/splash.py
+SPLASH_MAGIC = b"CYSPLSH1"
+SPLASH_HEADER = struct.Struct("<8sHHH")  # magic, width, height, column offset
+
+# Same wiring and bus speed as luma's spi() defaults used by DisplayManager
+SPI_PORT, SPI_DEVICE = 0, 0
+SPI_SPEED_HZ = 8000000
+GPIO_DC = 24
+GPIO_RST = 25
+
+# luma.oled ssd1322 initialisation, then contrast 0x7F as luma sets it
+INIT_SEQUENCE = (
+    (0xFD, 0x12),        # Unlock IC
+    (0xA4,),             # Display off (all pixels off)
+    (0xB3, 0xF2),        # Display divide clockratio/freq
+    (0xCA, 0x3F),        # Set MUX ratio
+    (0xA2, 0x00),        # Display offset
+    (0xA1, 0x00),        # Display start Line
+    (0xA0, 0x14, 0x11),  # Set remap & dual COM Line
+    (0xB5, 0x00),        # Set GPIO (disabled)
+    (0xAB, 0x01),        # Function select (internal Vdd)
+    (0xB4, 0xA0, 0xFD),  # Display enhancement A (External VSL)
+    (0xC7, 0x0F),        # Master contrast (reset)
+    (0xB9,),             # Set default greyscale table
+    (0xB1, 0xF0),        # Phase length
+    (0xD1, 0x82, 0x20),  # Display enhancement B (reset)
+    (0xBB, 0x0D),        # Pre-charge voltage
+    (0xB6, 0x08),        # 2nd precharge period
+    (0xBE, 0x00),        # Set VcomH
+    (0xA6,),             # Normal display (reset)
+    (0xA9,),             # Exit partial display
+    (0xC1, 0x7F),        # Contrast
+)
+
+
+def read_splash(path):
+    with open(path, "rb") as f:
+        magic, width, height, column_offset = SPLASH_HEADER.unpack(f.read(SPLASH_HEADER.size))
+        data = f.read()
+    if magic != SPLASH_MAGIC or len(data) != width * height // 2:
+        raise ValueError(f"{path} is not a splash file")
+    return width, height, column_offset, data
+
+
+def open_spi(timeout=3.0):
+    # spi-bcm2835 may still be loading this early in boot
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            bus = spidev.SpiDev()
+            bus.open(SPI_PORT, SPI_DEVICE)
+            bus.max_speed_hz = SPI_SPEED_HZ
+            return bus
+        except (IOError, OSError):
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.05)
+
+
+def send(bus, dc_level, payload):
+    GPIO.output(GPIO_DC, dc_level)
+    payload = bytes(payload)
+    for start in range(0, len(payload), 4096):
+        bus.writebytes(list(payload[start:start + 4096]))
+
+
+def command(bus, cmd, *args):
+    send(bus, GPIO.LOW, [cmd])
+    if args:
+        send(bus, GPIO.HIGH, args)
+
+
+def boot_id():
+    with open("/proc/sys/kernel/random/boot_id", "r") as f:
+        return f.read().strip()
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else SPLASH_PATH
+    try:
+        width, height, column_offset, data = read_splash(path)
+    except (OSError, ValueError, struct.error) as e:
+        # Nothing packed yet (first boot): main.py writes it once the logo is loaded
+        print(f"No early splash: {e}")
+        return 0
+
+    GPIO.setwarnings(False)
+    GPIO.setmode(GPIO.BCM)
+    GPIO.setup(GPIO_DC, GPIO.OUT)
+    GPIO.setup(GPIO_RST, GPIO.OUT)
+    bus = open_spi()
+
+    # Reset, then leave RST high: DisplayManager takes over without resetting
+    GPIO.output(GPIO_RST, GPIO.LOW)
+    time.sleep(0.001)
+    GPIO.output(GPIO_RST, GPIO.HIGH)
+    time.sleep(0.001)
+
+    for cmd in INIT_SEQUENCE:
+        command(bus, *cmd)
+
+    column_start = column_offset >> 2
+    column_end = ((column_offset + width) >> 2) - 1
+    command(bus, 0x15, column_start, column_end)  # Column address
+    command(bus, 0x75, 0, height - 1)             # Row address
+    command(bus, 0x5C)                            # Write RAM
+    send(bus, GPIO.HIGH, data)
+    command(bus, 0xAF)                            # Display on
+    bus.close()
+    # No GPIO.cleanup(): the pins must keep their levels for DisplayManager
+
+    with open(HANDOVER_PATH, "w") as f:
+        f.write(boot_id())
+    # main.py runs as volumio and empties the marker when it takes over
+    os.chmod(HANDOVER_PATH, 0o666)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,41 +1,157 @@
+import argparse
+import hashlib
+import io
+import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import cairosvg
 from PIL import Image
 
-def batch_convert_svg_to_png(input_directory, output_directory, size=35):
-    # Ensure the output directory exists
-    if not os.path.exists(output_directory):
-        os.makedirs(output_directory)
-    
-    # List all SVG files in the input directory
-    for filename in os.listdir(input_directory):
-        if filename.endswith(".svg"):
-            input_path = os.path.join(input_directory, filename)
-            output_filename = os.path.splitext(filename)[0] + ".png"
-            output_path = os.path.join(output_directory, output_filename)
-
-            try:
-                # Convert SVG to PNG
-                cairosvg.svg2png(url=input_path, write_to=output_path)
-                
-                # Load PNG image and resize
-                with Image.open(output_path) as png_image:
-                    resized_image = png_image.resize((size, size), Image.ANTIALIAS)
-                    resized_image.save(output_path, format="PNG")
-
-                print(f"Successfully converted and resized: {input_path} -> {output_path}")
-            except Exception as e:
-                print(f"Error converting {input_path}: {e}")
+# Every icon size CyFi draws: the 35 px base that DisplayManager loads, then
+# ModernScreen (10, 20), the menus (30) and AirPlayScreen (60)
+DEFAULT_SIZES = (35, 10, 20, 30, 60)
 
-if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python batch_convert_svg_to_png.py <input_directory> <output_directory> [size]")
-        print("Example: python batch_convert_svg_to_png.py ./svgs ./pngs 35")
-    else:
-        input_dir = sys.argv[1]
-        output_dir = sys.argv[2]
-        size = int(sys.argv[3]) if len(sys.argv) > 3 else 35
+MANIFEST_NAME = ".convert-manifest.json"
+
+
+def output_paths(output_directory, name, sizes):
+    """The first size goes to <output>/<name>.png, the others to <output>/<size>/<name>.png."""
+    paths = [os.path.join(output_directory, name + ".png")]
+    for size in sizes[1:]:
+        paths.append(os.path.join(output_directory, str(size), name + ".png"))
+    return paths
+
+
+def convert_one(input_path, output_directory, sizes, greyscale=False):
+    """
+    Rasterise one SVG once and write it at every size in `sizes`.
+    With `greyscale`, alpha is flattened onto black and the result is
+    quantised to the OLED's 16 grey levels, so the panel shows exactly
+    what the PNG holds.
+    """
+    name = os.path.splitext(os.path.basename(input_path))[0]
+    source = Image.open(io.BytesIO(cairosvg.svg2png(url=input_path)))
+    source.load()
+
+    if greyscale:
+        if source.mode != "RGBA":
+            source = source.convert("RGBA")
+        background = Image.new("RGB", source.size, (0, 0, 0))
+        background.paste(source, mask=source.split()[3])
+        source = background.convert("L")
+
+    paths = output_paths(output_directory, name, sizes)
+    for size, output_path in zip(sizes, paths):
+        image = source.resize((size, size), Image.LANCZOS)
+        if greyscale:
+            image = image.point(lambda p: p & 0xF0)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        image.save(output_path, format="PNG")
+    return paths
+
+
+def _file_hash(path, sizes, greyscale):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        digest.update(f.read())
+    digest.update(f"{list(sizes)}:{greyscale}".encode())
+    return digest.hexdigest()
+
+
+def _load_manifest(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-        batch_convert_svg_to_png(input_dir, output_dir, size)
 
+def batch_convert_svg_to_png(input_directory, output_directory, size=35, sizes=None,
+                             greyscale=False, workers=None, force=False):
+    """
+    Convert every SVG in `input_directory` into PNGs in `output_directory`.
+
+    Conversions run in a process pool. A manifest of content hashes (SVG
+    bytes plus sizes/greyscale options) is kept in the output directory,
+    and SVGs whose hash and outputs are unchanged are skipped, so a re-run
+    after editing a couple of icons only redoes those. Returns
+    (converted, skipped, failed) counts.
+    """
+    sizes = tuple(sizes) if sizes else (size,)
+    os.makedirs(output_directory, exist_ok=True)
+
+    manifest_path = os.path.join(output_directory, MANIFEST_NAME)
+    manifest = _load_manifest(manifest_path)
+
+    svgs = sorted(f for f in os.listdir(input_directory) if f.endswith(".svg"))
+    # Forget SVGs that have been removed since the last run
+    manifest = {filename: h for filename, h in manifest.items() if filename in svgs}
+
+    pending = {}
+    skipped = 0
+    for filename in svgs:
+        input_path = os.path.join(input_directory, filename)
+        file_hash = _file_hash(input_path, sizes, greyscale)
+        name = os.path.splitext(filename)[0]
+        up_to_date = (manifest.get(filename) == file_hash and
+                      all(os.path.exists(p) for p in output_paths(output_directory, name, sizes)))
+        if up_to_date and not force:
+            skipped += 1
+            continue
+        pending[input_path] = (filename, file_hash)
+
+    converted = failed = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(convert_one, input_path, output_directory, sizes, greyscale): input_path
+                for input_path in pending
+            }
+            for future in as_completed(futures):
+                input_path = futures[future]
+                filename, file_hash = pending[input_path]
+                try:
+                    paths = future.result()
+                except Exception as e:
+                    manifest.pop(filename, None)
+                    failed += 1
+                    print(f"Error converting {input_path}: {e}")
+                    continue
+                manifest[filename] = file_hash
+                converted += 1
+                print(f"Successfully converted and resized: {input_path} -> {', '.join(paths)}")
+
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    print(f"{converted} converted, {skipped} unchanged, {failed} failed.")
+    return converted, skipped, failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert SVG icons to PNG at every size CyFi uses.",
+        epilog="Example: python convert.py ./svgs ./pngs 35 10 20 30 60 --greyscale",
+    )
+    parser.add_argument("input_directory")
+    parser.add_argument("output_directory")
+    parser.add_argument("sizes", nargs="*", type=int,
+                        help=f"icon sizes in px, base size first (default: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument("--greyscale", action="store_true",
+                        help="flatten alpha and pre-quantise to the OLED's 16 grey levels")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="ignore the manifest and rebuild everything")
+    args = parser.parse_args()
+
+    _, _, failures = batch_convert_svg_to_png(
+        args.input_directory,
+        args.output_directory,
+        sizes=args.sizes or DEFAULT_SIZES,
+        greyscale=args.greyscale,
+        workers=args.workers,
+        force=args.force,
+    )
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,144 @@
+# src/boot/import_profiler.py
+
+import importlib.abc
+import logging
+import sys
+import threading
+import time
+
+
+class _TimedLoader:
+    """Wraps a module's loader so creating/executing it is timed by the profiler."""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        create = getattr(self._loader, "create_module", None)
+        if create is None:
+            return None
+        # Extension modules do their real work here
+        with self._profiler.timing(spec.name):
+            return create(spec)
+
+    def exec_module(self, module):
+        with self._profiler.timing(module.__name__):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, name):
+        # get_data, get_resource_reader, is_package, ... go to the real loader
+        return getattr(self._loader, name)
+
+
+class _Timer:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._enter(self.name)
+
+    def __exit__(self, *exc):
+        self.profiler._exit(self.name)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """
+    Per-module import cost, like `python -X importtime` but switchable at
+    runtime (main.py's --profile-imports) and readable from the log.
+
+    Installed first on sys.meta_path, it asks the remaining finders for
+    each module's spec and wraps the loader, so module creation/execution
+    is timed. Nested imports are tracked on a per-thread stack, giving both
+    cumulative time and self time (cumulative minus children) per module,
+    and which thread paid for it.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._finding = threading.local()
+        # name -> [cumulative, self, thread name]
+        self.timings = {}
+
+    @classmethod
+    def install(cls):
+        profiler = cls()
+        sys.meta_path.insert(0, profiler)
+        return profiler
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    # ------------------------------------------------------------------
+    #   Finder
+    # ------------------------------------------------------------------
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._finding, "active", False):
+            return None
+        self._finding.active = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding.active = False
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    # ------------------------------------------------------------------
+    #   Timing
+    # ------------------------------------------------------------------
+    def timing(self, name):
+        return _Timer(self, name)
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, name):
+        # [name, start, time spent in nested imports]
+        self._stack().append([name, time.perf_counter(), 0.0])
+
+    def _exit(self, name):
+        stack = self._stack()
+        entry_name, start, children = stack.pop()
+        elapsed = time.perf_counter() - start
+        if stack:
+            stack[-1][2] += elapsed
+        with self._lock:
+            # create_module + exec_module of the same module add up
+            record = self.timings.setdefault(entry_name, [0.0, 0.0, threading.current_thread().name])
+            record[0] += elapsed
+            record[1] += elapsed - children
+
+    # ------------------------------------------------------------------
+    #   Report
+    # ------------------------------------------------------------------
+    def report(self, limit=30, by="self"):
+        """Return the `limit` most expensive imports as text, sorted by self or cumulative time."""
+        index = 1 if by == "self" else 0
+        with self._lock:
+            rows = sorted(self.timings.items(), key=lambda item: item[1][index], reverse=True)
+            total = sum(record[1] for record in self.timings.values())
+        lines = [f"Import profile: {len(rows)} modules, {total * 1000:.1f} ms total (self time)",
+                 f"{'self ms':>9} {'cumul ms':>9}  {'thread':<16} module"]
+        for name, (cumulative, own, thread) in rows[:limit]:
+            lines.append(f"{own * 1000:9.1f} {cumulative * 1000:9.1f}  {thread:<16} {name}")
+        return "\n".join(lines)
+
+    def log_report(self, limit=30, by="self"):
+        self.logger.info("\n" + self.report(limit, by))
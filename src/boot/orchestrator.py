@@ -0,0 +1,139 @@
+# src/boot/orchestrator.py
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+
+class BootPhase:
+    """One unit of boot work: fn() run on its own thread once `after` phases are done."""
+
+    def __init__(self, name, fn, after=()):
+        self.name = name
+        self.fn = fn
+        self.after = tuple(after)
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+
+
+class BootOrchestrator:
+    """
+    Runs boot phases in parallel instead of strictly one after another.
+
+    Each phase is registered with add(name, fn, after=(...)) and, on
+    start(), gets its own daemon thread that waits for the phases it
+    depends on and then runs. The main thread stays free to play the boot
+    animations, which only ever poll done()/all_done() to decide when to
+    stop, and calls wait(name) at the point it really needs a phase's
+    result (re-raising whatever that phase raised).
+
+    Work done on the main thread itself (logo, loading GIF, ...) can be
+    wrapped in stage(name) so it shows up in the same timing log. Times
+    are relative to the orchestrator's creation, or to process start when
+    a BootTimeline is attached.
+    """
+
+    def __init__(self, timeline=None):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+        # With a BootTimeline, phases/stages are recorded there too, on its clock
+        self.timeline = timeline
+        self.t0 = timeline.t0 if timeline is not None else time.monotonic()
+        self._phases = {}
+        self._stages = []
+        self._lock = threading.Lock()
+
+    def elapsed(self):
+        return time.monotonic() - self.t0
+
+    # ------------------------------------------------------------------
+    #   Phases
+    # ------------------------------------------------------------------
+    def add(self, name, fn, after=()):
+        self._phases[name] = BootPhase(name, fn, after)
+        return self
+
+    def start(self):
+        for phase in self._phases.values():
+            threading.Thread(target=self._run, args=(phase,), name=f"boot-{phase.name}", daemon=True).start()
+        return self
+
+    def _run(self, phase):
+        for name in phase.after:
+            dependency = self._phases[name]
+            dependency.done.wait()
+            if dependency.error is not None:
+                phase.error = RuntimeError(f"boot phase '{name}' failed")
+                phase.done.set()
+                self.logger.error(f"BootOrchestrator: skipping '{phase.name}', '{name}' failed.")
+                return
+
+        phase.started_at = self.elapsed()
+        if self.timeline is not None:
+            self.timeline.begin(phase.name)
+        try:
+            phase.result = phase.fn()
+        except Exception as e:
+            phase.error = e
+            self.logger.error(f"BootOrchestrator: phase '{phase.name}' failed => {e}")
+        phase.finished_at = self.elapsed()
+        if self.timeline is not None:
+            self.timeline.end(phase.name)
+        phase.done.set()
+        self.logger.info(f"BootOrchestrator: phase '{phase.name}' took "
+                         f"{(phase.finished_at - phase.started_at) * 1000:.0f} ms "
+                         f"(done at +{phase.finished_at:.2f} s).")
+
+    def done(self, name):
+        return self._phases[name].done.is_set()
+
+    def all_done(self):
+        return all(phase.done.is_set() for phase in self._phases.values())
+
+    def wait(self, name, timeout=None):
+        """Block until phase `name` has finished and return its result (or raise its error)."""
+        phase = self._phases[name]
+        if not phase.done.wait(timeout):
+            raise TimeoutError(f"boot phase '{name}' still running after {timeout} s")
+        if phase.error is not None:
+            raise phase.error
+        return phase.result
+
+    # ------------------------------------------------------------------
+    #   Main-thread stages
+    # ------------------------------------------------------------------
+    @contextmanager
+    def stage(self, name):
+        start = self.elapsed()
+        if self.timeline is not None:
+            self.timeline.begin(name)
+        try:
+            yield
+        finally:
+            end = self.elapsed()
+            if self.timeline is not None:
+                self.timeline.end(name)
+            with self._lock:
+                self._stages.append((name, start, end))
+            self.logger.info(f"BootOrchestrator: stage '{name}' took {(end - start) * 1000:.0f} ms "
+                             f"(done at +{end:.2f} s).")
+
+    def get_timings(self):
+        """(name, start s, end s) for every phase and stage so far, in start order."""
+        with self._lock:
+            rows = list(self._stages)
+        for phase in self._phases.values():
+            if phase.started_at is not None:
+                rows.append((phase.name, phase.started_at, phase.finished_at))
+        return sorted(rows, key=lambda row: row[1])
+
+    def log_summary(self):
+        lines = [f"Boot finished at +{self.elapsed():.2f} s:"]
+        for name, start, end in self.get_timings():
+            end_text = f"{end:6.2f}" if end is not None else "   ..."
+            lines.append(f"  {name:<16} +{start:6.2f} s -> +{end_text} s")
+        self.logger.info("\n".join(lines))
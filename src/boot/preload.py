@@ -0,0 +1,51 @@
+# src/boot/preload.py
+
+import importlib
+import logging
+import threading
+import time
+
+
+class BackgroundImporter:
+    """
+    Imports modules on a daemon thread so their cost overlaps something the
+    main thread is already waiting on (the boot logo).
+
+    Nothing has to wait for it explicitly: Python's per-module import locks
+    mean a later `import x` on the main thread either finds x already in
+    sys.modules or blocks until the preloading thread has finished it.
+    A module that fails to import is logged and skipped; the real import
+    later will raise as usual.
+    """
+
+    def __init__(self, modules, name="BackgroundImporter"):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+        self.modules = list(modules)
+        self.timings = {}
+        self.failures = {}
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        start = time.perf_counter()
+        for name in self.modules:
+            t = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                self.failures[name] = e
+                self.logger.warning(f"BackgroundImporter: could not preload '{name}' => {e}")
+                continue
+            self.timings[name] = time.perf_counter() - t
+        self._done.set()
+        self.logger.info(f"BackgroundImporter: preloaded {len(self.timings)} modules in "
+                         f"{(time.perf_counter() - start) * 1000:.0f} ms.")
+
+    def wait(self, timeout=None):
+        """Block until every module has been attempted. Returns False on timeout."""
+        return self._done.wait(timeout)
@@ -0,0 +1,170 @@
+# src/boot/snapshot.py
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from PIL import Image
+
+_FORMAT_VERSION = 1
+
+
+def _boot_id():
+    """Kernel boot id (changes on every reboot), or None off Linux."""
+    try:
+        with open("/proc/sys/kernel/random/boot_id", "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _atomic_write(path, payload):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class BootSnapshot:
+    """
+    What the UI looked like a moment ago, kept so a restart can pick up
+    where the crashed process left off instead of replaying the boot GIFs.
+
+    Two files under `path` (a tmpfs directory, so nothing survives a
+    reboot): snapshot.json with the mode, last Volumio state, preferences
+    and frame geometry, and frame.raw with the raw pixels of the last frame
+    on the panel. The frame is written first and the JSON last, both
+    atomically, so a JSON on disk always describes a complete frame.
+
+    load() only returns a snapshot taken during this kernel boot and no
+    more than `max_age` seconds ago.
+    """
+
+    def __init__(self, mode, volumio_state, preferences, frame=None, saved_at=None):
+        self.mode = mode
+        self.volumio_state = volumio_state or {}
+        self.preferences = preferences or {}
+        self.frame = frame
+        self.saved_at = saved_at
+
+    @staticmethod
+    def _paths(path):
+        return os.path.join(path, "snapshot.json"), os.path.join(path, "frame.raw")
+
+    def save(self, path):
+        json_path, frame_path = self._paths(path)
+        meta = {
+            "version": _FORMAT_VERSION,
+            "boot_id": _boot_id(),
+            "saved_at": time.time(),
+            "mode": self.mode,
+            "volumio_state": self.volumio_state,
+            "preferences": self.preferences,
+            "frame": None,
+        }
+        if self.frame is not None:
+            # Pre-rendered uint8 arrays are (h, w) greyscale
+            mode = getattr(self.frame, "mode", "L")
+            size = self.frame.size if hasattr(self.frame, "mode") else self.frame.shape[::-1]
+            _atomic_write(frame_path, self.frame.tobytes())
+            meta["frame"] = {"mode": mode, "size": list(size)}
+        _atomic_write(json_path, json.dumps(meta).encode())
+
+    @classmethod
+    def load(cls, path, max_age):
+        """Return the snapshot in `path` if it is recent enough to resume from, else None."""
+        logger = logging.getLogger(cls.__name__)
+        json_path, frame_path = cls._paths(path)
+        try:
+            with open(json_path, "r") as f:
+                meta = json.load(f)
+            if meta.get("version") != _FORMAT_VERSION:
+                return None
+            if meta.get("boot_id") != _boot_id():
+                logger.info("BootSnapshot: snapshot is from a previous boot, ignoring.")
+                return None
+            age = time.time() - meta["saved_at"]
+            if not 0 <= age <= max_age:
+                logger.info(f"BootSnapshot: snapshot is {age:.0f} s old, ignoring.")
+                return None
+
+            frame = None
+            if meta.get("frame"):
+                with open(frame_path, "rb") as f:
+                    frame = Image.frombytes(meta["frame"]["mode"], tuple(meta["frame"]["size"]), f.read())
+            return cls(meta.get("mode"), meta.get("volumio_state"), meta.get("preferences"),
+                       frame, meta["saved_at"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"BootSnapshot: unreadable snapshot in '{path}' => {e}")
+            return None
+
+    @classmethod
+    def discard(cls, path):
+        """Remove the snapshot so the next start is a normal (cold) boot."""
+        for file_path in cls._paths(path):
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+
+
+class SnapshotWriter:
+    """
+    Saves a BootSnapshot every `interval` seconds on a daemon thread.
+
+    collect() returns (mode, volumio_state, preferences) and the frame
+    comes from the FrameWriter. Nothing is written while neither the
+    state nor the panel has changed since the last save.
+    """
+
+    def __init__(self, path, collect, writer, interval=5.0):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.path = path
+        self.collect = collect
+        self.writer = writer
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._last_key = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="SnapshotWriter", daemon=True)
+        self._thread.start()
+        self.logger.info(f"SnapshotWriter: saving to '{self.path}' every {self.interval} s.")
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def save_now(self):
+        mode, volumio_state, preferences = self.collect()
+        # A private copy: the writer may recycle its own frame at any moment
+        frames_written, frame = self.writer.snapshot_frame()
+        key = (frames_written, json.dumps([mode, volumio_state, preferences], sort_keys=True))
+        if key == self._last_key:
+            return False
+        BootSnapshot(mode, volumio_state, preferences, frame).save(self.path)
+        self._last_key = key
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.save_now()
+            except Exception as e:
+                self.logger.warning(f"SnapshotWriter: could not save snapshot => {e}")
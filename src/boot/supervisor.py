@@ -0,0 +1,174 @@
+# src/boot/supervisor.py
+
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+
+class Supervisor:
+    """
+    Runs CyFi as a child process and keeps a second, pre-warmed child parked
+    next to it (`main.py --supervise`).
+
+    The spare is a full interpreter started with --spare: it has already
+    imported the heavy stack (PIL, luma, socketio, transitions, the
+    screens) and read the fonts/assets into the page cache, and is blocked
+    reading its stdin. When the active process exits, or is restarted
+    because config.yaml changed (or the supervisor got SIGHUP), the spare
+    is told "go" and runs main() straight away. Together with the
+    warm-restart snapshot that puts the UI back within a fraction of a
+    second. A new spare is started right after, in the background.
+
+    The supervisor itself only imports the standard library. If the active
+    process keeps dying right after taking over, takeovers are spaced out
+    (exponential backoff up to `max_backoff` seconds).
+    """
+
+    def __init__(self, script, args=(), config_path=None, poll_interval=1.0,
+                 min_uptime=10.0, max_backoff=30.0):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.script = script
+        self.args = [arg for arg in args if arg != "--supervise"]
+        self.config_path = config_path
+        self.poll_interval = poll_interval
+        self.min_uptime = min_uptime
+        self.max_backoff = max_backoff
+
+        self.active = None
+        self.spare = None
+        self._stopping = threading.Event()
+        self._restart = threading.Event()
+        self.restarts = 0
+
+    # ------------------------------------------------------------------
+    #   Children
+    # ------------------------------------------------------------------
+    def _spawn_spare(self):
+        spare = subprocess.Popen([sys.executable, self.script, "--spare"] + self.args,
+                                 stdin=subprocess.PIPE)
+        self.logger.info(f"Supervisor: spare warming up (pid {spare.pid}).")
+        return spare
+
+    def _activate(self, process):
+        try:
+            process.stdin.write(b"go\n")
+            process.stdin.flush()
+            process.stdin.close()
+            return True
+        except (OSError, ValueError):
+            # The spare died while parked; the caller starts another one
+            return False
+
+    def _stop_child(self, process, sig, timeout=5.0):
+        if process is None or process.poll() is not None:
+            return
+        process.send_signal(sig)
+        try:
+            process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    # ------------------------------------------------------------------
+    #   Main loop
+    # ------------------------------------------------------------------
+    def _config_mtime(self):
+        try:
+            return os.path.getmtime(self.config_path) if self.config_path else None
+        except OSError:
+            return None
+
+    def _handle_signal(self, signum, frame):
+        if signum == signal.SIGHUP:
+            self._restart.set()
+        else:
+            self._stopping.set()
+
+    def run(self):
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            signal.signal(sig, self._handle_signal)
+
+        backoff = 0.0
+        config_mtime = self._config_mtime()
+        self.spare = self._spawn_spare()
+
+        while not self._stopping.is_set():
+            # --- Hand over to the spare, start the next one ---
+            self.active, self.spare = self.spare, None
+            if not self._activate(self.active):
+                self.logger.error("Supervisor: spare exited before takeover, starting another.")
+                self.spare = self._spawn_spare()
+                self._stopping.wait(1.0)
+                continue
+            activated_at = time.monotonic()
+            self.logger.info(f"Supervisor: pid {self.active.pid} is now active.")
+            self.spare = self._spawn_spare()
+
+            # --- Watch the active process ---
+            requested = False
+            while not self._stopping.is_set() and self.active.poll() is None:
+                mtime = self._config_mtime()
+                if mtime != config_mtime:
+                    config_mtime = mtime
+                    self.logger.info("Supervisor: config.yaml changed, restarting.")
+                    self._restart.set()
+                if self._restart.is_set():
+                    self._restart.clear()
+                    # SIGTERM (not SIGINT): the snapshot is kept so the spare resumes warm
+                    self._stop_child(self.active, signal.SIGTERM)
+                    requested = True
+                    break
+                self._stopping.wait(self.poll_interval)
+
+            if self._stopping.is_set():
+                break
+
+            code = self.active.wait()
+            self.restarts += 1
+            uptime = time.monotonic() - activated_at
+            self.logger.warning(f"Supervisor: pid {self.active.pid} exited with {code} "
+                                f"after {uptime:.1f} s, spare taking over.")
+            if uptime < self.min_uptime and not requested:
+                backoff = min(max(backoff * 2, 1.0), self.max_backoff)
+                self.logger.warning(f"Supervisor: exited quickly, waiting {backoff:.0f} s.")
+                self._stopping.wait(backoff)
+            else:
+                backoff = 0.0
+
+        # A deliberate stop: SIGINT lets the active process shut down cleanly
+        self._stop_child(self.spare, signal.SIGTERM)
+        self._stop_child(self.active, signal.SIGINT)
+        self.logger.info("Supervisor: stopped.")
+        return 0
+
+
+def park_as_spare(modules, warm_paths=()):
+    """
+    Run in a `--spare` child: import `modules`, read `warm_paths` into the
+    page cache, then block until the supervisor says "go". Returns True to
+    carry on into main(), False if the supervisor went away.
+    """
+    logger = logging.getLogger("Spare")
+    start = time.perf_counter()
+    for name in modules:
+        try:
+            __import__(name)
+        except Exception as e:
+            logger.warning(f"Spare: could not preload '{name}' => {e}")
+    for path in warm_paths:
+        try:
+            with open(path, "rb") as f:
+                while f.read(1 << 20):
+                    pass
+        except OSError:
+            pass
+    logger.info(f"Spare: ready in {(time.perf_counter() - start) * 1000:.0f} ms, waiting for takeover.")
+
+    line = sys.stdin.readline()
+    return line.strip() == "go"
@@ -0,0 +1,183 @@
+# src/boot/timeline.py
+
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+
+
+def _seconds_since_process_start():
+    """How long this process has been running (Linux /proc), or None elsewhere."""
+    try:
+        with open("/proc/self/stat", "r") as f:
+            # Field 22 (starttime), counted after the ")" closing the command name
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _system_uptime():
+    try:
+        with open("/proc/uptime", "r") as f:
+            return float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class _Span:
+    def __init__(self, timeline, name):
+        self.timeline = timeline
+        self.name = name
+
+    def __enter__(self):
+        self.timeline.begin(self.name)
+
+    def __exit__(self, *exc):
+        self.timeline.end(self.name)
+
+
+class BootTimeline:
+    """
+    Timestamps for every step of boot, relative to process start.
+
+    Create it as early as possible in main.py. mark(name) records an
+    instant, span(name) a start/end pair (BootOrchestrator feeds its
+    phases and stages in here). Two derived metrics are reported:
+      - time_to_first_frame: first frame the FrameWriter put on the panel
+      - time_to_interactive: UI handed over to ModeManager
+
+    Each timestamp also carries the system uptime at that moment, so
+    "seconds after power-on" can be compared across the fleet. The
+    timeline is rewritten as JSON to `path` after every event and can be
+    fetched with the "boot_timeline" command on the command socket.
+    """
+
+    def __init__(self, path=None):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        now = time.monotonic()
+        since_start = _seconds_since_process_start()
+        # t0 is process start (not this constructor) so interpreter start-up is counted
+        self.t0 = now - since_start if since_start is not None else now
+        uptime = _system_uptime()
+        self.uptime_at_t0 = uptime - (now - self.t0) if uptime is not None else None
+
+        self.path = path
+        self.host = socket.gethostname()
+        self.started_at = time.time() - (now - self.t0)
+        self._events = []
+        self._spans = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Start over from now, e.g. when a parked spare process takes over."""
+        now = time.monotonic()
+        uptime = _system_uptime()
+        with self._lock:
+            self.t0 = now
+            self.uptime_at_t0 = uptime
+            self.started_at = time.time()
+            self._events = []
+            self._spans = {}
+
+    # ------------------------------------------------------------------
+    #   Recording
+    # ------------------------------------------------------------------
+    def _offset(self, at=None):
+        return (at if at is not None else time.monotonic()) - self.t0
+
+    def mark(self, name, at=None):
+        """Record instant `name` now (or at monotonic time `at`)."""
+        offset = self._offset(at)
+        with self._lock:
+            self._events.append((name, offset))
+        self.logger.info(f"BootTimeline: {name} at +{offset:.3f} s.")
+        self.save()
+
+    def mark_once(self, name, at=None):
+        """Like mark(), but only the first call for `name` counts."""
+        with self._lock:
+            if any(event == name for event, _ in self._events):
+                return
+        self.mark(name, at)
+
+    def has(self, name):
+        with self._lock:
+            return any(event == name for event, _ in self._events)
+
+    def begin(self, name, at=None):
+        with self._lock:
+            self._spans[name] = [self._offset(at), None]
+
+    def end(self, name, at=None):
+        with self._lock:
+            span = self._spans.setdefault(name, [self._offset(at), None])
+            span[1] = self._offset(at)
+        self.save()
+
+    def span(self, name):
+        """Context manager recording a begin()/end() pair for `name`."""
+        return _Span(self, name)
+
+    # ------------------------------------------------------------------
+    #   Output
+    # ------------------------------------------------------------------
+    def _event_time(self, name):
+        for event, offset in self._events:
+            if event == name:
+                return round(offset, 3)
+        return None
+
+    def to_dict(self):
+        with self._lock:
+            events = sorted(self._events, key=lambda event: event[1])
+            spans = sorted(self._spans.items(), key=lambda item: item[1][0])
+
+            def uptime(offset):
+                if offset is None or self.uptime_at_t0 is None:
+                    return None
+                return round(self.uptime_at_t0 + offset, 3)
+
+            return {
+                "host": self.host,
+                "pid": os.getpid(),
+                "started_at": self.started_at,
+                "uptime_at_process_start": uptime(0.0),
+                "metrics": {
+                    "time_to_first_frame": self._event_time("first_frame"),
+                    "time_to_interactive": self._event_time("interactive"),
+                },
+                "events": [
+                    {"name": name, "t": round(offset, 3), "uptime": uptime(offset)}
+                    for name, offset in events
+                ],
+                "spans": [
+                    {"name": name, "start": round(start, 3),
+                     "end": round(end, 3) if end is not None else None,
+                     "duration": round(end - start, 3) if end is not None else None}
+                    for name, (start, end) in spans
+                ],
+            }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+    def save(self):
+        """Atomically rewrite the timeline file (no-op without a path)."""
+        if not self.path:
+            return
+        try:
+            directory = os.path.dirname(self.path) or "."
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(self.to_json())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"BootTimeline: could not write '{self.path}' => {e}")
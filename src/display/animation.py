@@ -0,0 +1,318 @@
+# src/display/animation.py
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import time
+from PIL import Image, ImageSequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ----------------------------------------------------------------------
+#   On-disk format
+# ----------------------------------------------------------------------
+# header:    magic, width, height, frame count
+# durations: one uint16 (ms) per frame
+# frames:    width*height bytes per frame, 8-bit grey already quantised to
+#            the panel's 16 levels, logical orientation, back to back
+_MAGIC = b"CYANIM1\0"
+_HEADER = struct.Struct("<8sHHI")
+_FALLBACK_DIR = os.path.join(tempfile.gettempdir(), "cyfi-anim")
+
+
+class FramePacer:
+    """
+    Holds a steady frame rate against fixed deadlines on a monotonic clock.
+
+    wait(duration) sleeps until the previous deadline plus `duration`, so
+    the time spent rendering and handing the frame over is absorbed rather
+    than added on top. If we fall more than `max_lag` behind (e.g. the box
+    was busy booting), the schedule restarts from now instead of rushing
+    through frames to catch up.
+    """
+
+    def __init__(self, max_lag=0.25):
+        self.max_lag = max_lag
+        self.deadline = time.monotonic()
+        self.late_frames = 0
+
+    def wait(self, duration):
+        self.deadline += duration
+        remaining = self.deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        else:
+            self.late_frames += 1
+            if -remaining > self.max_lag:
+                self.deadline = time.monotonic()
+
+
+class AnimationClock:
+    """
+    The time base for everything that moves on screen.
+
+    Motion is computed from monotonic elapsed time rather than counted in
+    frames, so a scroll, screensaver or slide covers the same distance per
+    second whether it gets 30 frames or 5: under load frames are dropped,
+    never slowed down. DisplayManager owns one clock that every screen
+    shares; time_source can be swapped (e.g. for a slowed-down preview).
+    """
+
+    def __init__(self, time_source=time.monotonic):
+        self._time = time_source
+
+    def now(self):
+        return self._time()
+
+    def stopwatch(self, max_step=0.25):
+        """A Stopwatch on this clock, started now."""
+        return Stopwatch(self, max_step)
+
+    def transition(self, duration, draw_frame, fps=30):
+        """
+        Run a one-shot transition: call draw_frame(progress) with progress
+        going from 0.0 to 1.0 over `duration` seconds, at most `fps` times a
+        second. The last call is always exactly 1.0, so the transition lands
+        where it should however many frames were dropped. Returns the number
+        of frames drawn.
+        """
+        watch = self.stopwatch()
+        pacer = FramePacer()
+        frames = 0
+        while True:
+            progress = watch.progress(duration)
+            draw_frame(progress)
+            frames += 1
+            if progress >= 1.0:
+                return frames
+            pacer.wait(1.0 / fps)
+
+
+class Stopwatch:
+    """
+    Elapsed time on an AnimationClock since start (or the last restart()).
+
+    elapsed() drives positions that are a function of time (offset = speed
+    * elapsed); step() returns the time since the previous step() for
+    motion that integrates velocity, capped at `max_step` so a long stall
+    (boot, a blocking SPI write) doesn't teleport things across the screen.
+    """
+
+    def __init__(self, clock, max_step=0.25):
+        self.clock = clock
+        self.max_step = max_step
+        self.restart()
+
+    def restart(self):
+        self.start = self._last = self.clock.now()
+
+    def elapsed(self):
+        return self.clock.now() - self.start
+
+    def step(self):
+        now = self.clock.now()
+        dt = now - self._last
+        self._last = now
+        return min(max(dt, 0.0), self.max_step)
+
+    def progress(self, duration):
+        """Fraction of `duration` elapsed, clamped to [0, 1]."""
+        if duration <= 0:
+            return 1.0
+        return min(1.0, max(0.0, self.elapsed() / duration))
+
+
+class Animation:
+    """
+    A GIF decoded once into panel-ready greyscale frames.
+
+    The first load() of a GIF decodes every frame, resizes it to the panel,
+    converts and quantises it to the panel's 16 grey levels, and writes the
+    result next to the GIF as "<gif>.<size>-<fit>.<hash>.anim" (or under a
+    temp directory if that isn't writable). The hash covers the GIF's bytes
+    and the target size, so an edited GIF or a different panel simply gets
+    a new file.
+    Every later load just memory-maps that file: no decoding, no resampling.
+
+    Frames come back as (height, width) uint8 arrays straight out of the
+    mapping when NumPy is there (GreyscaleSSD1322 packs those directly),
+    otherwise as "L" images.
+    """
+
+    def __init__(self, path, size, durations, data, offset=0):
+        self.path = path
+        self.size = size
+        self.durations = durations
+        # mmap of the cache file (or plain bytes), frames start at `offset`
+        self._mm = data
+        self._offset = offset
+        self._frames = None
+
+    # ------------------------------------------------------------------
+    #   Loading / building
+    # ------------------------------------------------------------------
+    @classmethod
+    def load(cls, gif_path, size, fit="resize"):
+        """
+        Return the Animation for `gif_path` at `size`, building its cache file
+        if needed. fit="resize" scales frames to the panel (LANCZOS);
+        fit="crop" pastes them at (0, 0) on black, cropping or padding.
+        """
+        logger = logging.getLogger(cls.__name__)
+        with open(gif_path, "rb") as f:
+            source = f.read()
+        digest = hashlib.blake2b(source, digest_size=8)
+        variant = f"{size[0]}x{size[1]}-{fit}"
+        digest.update(variant.encode())
+        name = f"{os.path.basename(gif_path)}.{variant}.{digest.hexdigest()}.anim"
+
+        candidates = [os.path.join(os.path.dirname(os.path.abspath(gif_path)), name),
+                      os.path.join(_FALLBACK_DIR, name)]
+        for cache_path in candidates:
+            if os.path.isfile(cache_path):
+                try:
+                    return cls._open(cache_path, size)
+                except (OSError, ValueError, struct.error) as e:
+                    logger.warning(f"Animation: ignoring unreadable cache '{cache_path}' => {e}")
+
+        durations, frames = cls._decode(gif_path, size, fit)
+        for cache_path in candidates:
+            try:
+                cls._write(cache_path, size, durations, frames)
+            except OSError as e:
+                logger.debug(f"Animation: cannot write '{cache_path}' => {e}")
+                continue
+            logger.info(f"Animation: cached {len(durations)} frames of '{gif_path}' in '{cache_path}'.")
+            return cls._open(cache_path, size)
+
+        # Nowhere to write: keep the decoded frames in memory instead
+        logger.warning(f"Animation: no writable cache location for '{gif_path}', keeping frames in memory.")
+        return cls(gif_path, size, durations, b"".join(frames))
+
+    @staticmethod
+    def _decode(gif_path, size, fit):
+        image = Image.open(gif_path)
+        durations, frames = [], []
+        for frame in ImageSequence.Iterator(image):
+            grey = frame.convert("L")
+            if grey.size != size:
+                if fit == "resize":
+                    grey = grey.resize(size, Image.LANCZOS)
+                else:
+                    background = Image.new("L", size, 0)
+                    background.paste(grey, (0, 0))
+                    grey = background
+            # Drop to the panel's 4-bit levels now so identical-looking frames hash the same
+            frames.append(grey.point(lambda p: p & 0xF0).tobytes())
+            durations.append(min(0xFFFF, max(0, int(frame.info.get("duration", 100)))))
+        return durations, frames
+
+    @staticmethod
+    def _write(cache_path, size, durations, frames):
+        directory = os.path.dirname(cache_path)
+        os.makedirs(directory, exist_ok=True)
+
+        # Older caches of the same GIF at this size/fit are stale now
+        prefix = os.path.basename(cache_path).rsplit(".", 2)[0] + "."
+        for entry in os.listdir(directory):
+            if entry.startswith(prefix) and entry.endswith(".anim"):
+                try:
+                    os.remove(os.path.join(directory, entry))
+                except OSError:
+                    pass
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, size[0], size[1], len(durations)))
+                f.write(struct.pack(f"<{len(durations)}H", *durations))
+                for frame in frames:
+                    f.write(frame)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def _open(cls, cache_path, size):
+        with open(cache_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, width, height, count = _HEADER.unpack_from(mm, 0)
+        frame_bytes = width * height
+        expected = _HEADER.size + 2 * count + count * frame_bytes
+        if magic != _MAGIC or (width, height) != tuple(size) or count == 0 or len(mm) != expected:
+            mm.close()
+            raise ValueError("bad animation header")
+        durations = list(struct.unpack_from(f"<{count}H", mm, _HEADER.size))
+        return cls(cache_path, (width, height), durations, mm, _HEADER.size + 2 * count)
+
+    # ------------------------------------------------------------------
+    #   Frames
+    # ------------------------------------------------------------------
+    @property
+    def frame_count(self):
+        return len(self.durations)
+
+    @property
+    def is_animated(self):
+        return len(self.durations) > 1
+
+    @property
+    def frames(self):
+        if self._frames is None:
+            width, height = self.size
+            frame_bytes = width * height
+            if np is not None:
+                data = np.frombuffer(self._mm, dtype=np.uint8, count=self.frame_count * frame_bytes,
+                                     offset=self._offset)
+                self._frames = list(data.reshape(self.frame_count, height, width))
+            else:
+                self._frames = [
+                    Image.frombytes("L", self.size,
+                                    bytes(self._mm[self._offset + i * frame_bytes:
+                                                   self._offset + (i + 1) * frame_bytes]))
+                    for i in range(self.frame_count)
+                ]
+        return self._frames
+
+    def play(self, show, stop_condition=None, duration=None, loop=True):
+        """
+        Push frames to `show` on a FramePacer until `stop_condition()` is true,
+        `duration` seconds have passed, or (with loop=False) the last frame
+        has been shown. A single-frame animation is shown once and held.
+        """
+        frames = self.frames
+        start = time.monotonic()
+        pacer = FramePacer()
+
+        def finished():
+            if stop_condition is not None and stop_condition():
+                return True
+            return duration is not None and time.monotonic() - start >= duration
+
+        if not self.is_animated:
+            show(frames[0])
+            if stop_condition is None and duration is None:
+                return
+            while not finished():
+                pacer.wait(0.1)
+            return
+
+        while not finished():
+            for frame, frame_ms in zip(frames, self.durations):
+                if finished():
+                    return
+                show(frame)
+                pacer.wait(frame_ms / 1000.0)
+            if not loop:
+                return
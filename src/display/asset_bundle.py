@@ -0,0 +1,180 @@
+# src/display/asset_bundle.py
+
+import json
+import logging
+import mmap
+import os
+import tempfile
+from PIL import Image
+
+_FORMAT_VERSION = 1
+_FALLBACK_DIR = os.path.join(tempfile.gettempdir(), "cyfi-assets")
+
+
+class AssetBundle:
+    """
+    Every icon the UI uses, at every size it uses, in one display-native file.
+
+    The bundle is two files in `bundle_dir` (the icon directory by default,
+    or a temp directory if that isn't writable):
+      - icons.<mode>.atlas: raw pixel data in the panel's mode, back to back
+      - icons.<mode>.index.json: where each (name, size) lives in the atlas,
+        plus the size/mtime of every source PNG it was built from
+
+    load() checks the index against the source files and rebuilds if any
+    PNG was added, removed or changed (or the requested sizes changed);
+    otherwise startup is one small JSON read and a single mmap. Images
+    returned by get() share the mapping and are read-only.
+
+    Variants are produced exactly the way DisplayManager always built icons:
+    alpha flattened onto black, LANCZOS to the base size, converted to the
+    panel mode, and only then LANCZOS to each smaller/larger size.
+    """
+
+    def __init__(self, mode, entries, atlas):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.mode = mode
+        self._entries = entries
+        self._atlas = atlas
+        self._images = {}
+
+    # ------------------------------------------------------------------
+    #   Loading / building
+    # ------------------------------------------------------------------
+    @classmethod
+    def load(cls, icon_dir, names, sizes, mode, bundle_dir=None):
+        """Return the bundle for `names` x `sizes` in `mode`, rebuilding it if stale."""
+        logger = logging.getLogger(cls.__name__)
+        sizes = [tuple(size) for size in sizes]
+        sources = cls._scan_sources(icon_dir, names)
+        wanted = {
+            "version": _FORMAT_VERSION,
+            "mode": mode,
+            "sizes": [list(size) for size in sizes],
+            "sources": sources,
+        }
+
+        candidates = [bundle_dir or icon_dir, _FALLBACK_DIR]
+        for directory in candidates:
+            bundle = cls._open(directory, mode, wanted)
+            if bundle is not None:
+                logger.info(f"AssetBundle: loaded {len(bundle._entries)} icons from '{directory}'.")
+                return bundle
+
+        atlas, entries = cls._build(icon_dir, sources, sizes, mode)
+        for directory in candidates:
+            try:
+                cls._write(directory, mode, wanted, entries, atlas)
+            except OSError as e:
+                logger.debug(f"AssetBundle: cannot write bundle to '{directory}' => {e}")
+                continue
+            logger.info(f"AssetBundle: rebuilt {len(entries)} icons into '{directory}'.")
+            bundle = cls._open(directory, mode, wanted)
+            if bundle is not None:
+                return bundle
+
+        logger.warning("AssetBundle: no writable bundle location, keeping icons in memory.")
+        return cls(mode, entries, atlas)
+
+    @staticmethod
+    def _paths(directory, mode):
+        return (os.path.join(directory, f"icons.{mode}.atlas"),
+                os.path.join(directory, f"icons.{mode}.index.json"))
+
+    @staticmethod
+    def _scan_sources(icon_dir, names):
+        """(size, mtime_ns) of each source PNG that exists, keyed by icon name."""
+        sources = {}
+        for name in names:
+            try:
+                st = os.stat(os.path.join(icon_dir, f"{name}.png"))
+            except OSError:
+                continue
+            sources[name] = [st.st_size, st.st_mtime_ns]
+        return sources
+
+    @staticmethod
+    def _render(path, sizes, mode):
+        icon = Image.open(path)
+        if icon.mode == "RGBA":
+            background = Image.new("RGB", icon.size, (0, 0, 0))
+            background.paste(icon, mask=icon.split()[3])
+            icon = background
+        base = icon.resize(sizes[0], Image.LANCZOS).convert(mode)
+        variants = {sizes[0]: base}
+        for size in sizes[1:]:
+            variant = base.resize(size, Image.LANCZOS)
+            if variant.mode != mode:
+                variant = variant.convert(mode)
+            variants[size] = variant
+        return variants
+
+    @classmethod
+    def _build(cls, icon_dir, sources, sizes, mode):
+        logger = logging.getLogger(cls.__name__)
+        chunks, entries, offset = [], {}, 0
+        for name in sources:
+            try:
+                variants = cls._render(os.path.join(icon_dir, f"{name}.png"), sizes, mode)
+            except (IOError, ValueError) as e:
+                logger.warning(f"AssetBundle: skipping icon '{name}' => {e}")
+                continue
+            for size, image in variants.items():
+                data = image.tobytes()
+                entries[f"{name}@{size[0]}x{size[1]}"] = [offset, len(data)]
+                chunks.append(data)
+                offset += len(data)
+        return b"".join(chunks), entries
+
+    @staticmethod
+    def _write(directory, mode, wanted, entries, atlas):
+        os.makedirs(directory, exist_ok=True)
+        atlas_path, index_path = AssetBundle._paths(directory, mode)
+        index = dict(wanted, atlas_size=len(atlas), entries=entries)
+
+        # Atlas first, index last: an index on disk always describes a complete atlas
+        for path, payload in ((atlas_path, atlas), (index_path, json.dumps(index).encode())):
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except OSError:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+    @classmethod
+    def _open(cls, directory, mode, wanted):
+        atlas_path, index_path = cls._paths(directory, mode)
+        try:
+            with open(index_path, "r") as f:
+                index = json.load(f)
+            if any(index.get(key) != value for key, value in wanted.items()):
+                return None
+            with open(atlas_path, "rb") as f:
+                atlas = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if index["atlas_size"] else b""
+            if len(atlas) != index["atlas_size"]:
+                return None
+            return cls(mode, index["entries"], atlas)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    # ------------------------------------------------------------------
+    #   Lookup
+    # ------------------------------------------------------------------
+    def get(self, name, size):
+        """Return icon `name` at `size` (w, h) as a read-only image, or None if not bundled."""
+        key = f"{name}@{size[0]}x{size[1]}"
+        image = self._images.get(key)
+        if image is None:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            offset, length = entry
+            buf = memoryview(self._atlas)[offset:offset + length]
+            image = Image.frombuffer(self.mode, tuple(size), buf, "raw", self.mode, 0, 1)
+            self._images[key] = image
+        return image
@@ -0,0 +1,76 @@
+# src/display/canvas_pool.py
+
+import threading
+import weakref
+from PIL import Image
+
+
+class CanvasPool:
+    """
+    Reusable full-screen canvases, so screens don't allocate a new image
+    for every frame.
+
+    acquire() hands out a canvas cleared to black (in place); the screen
+    draws on it and passes it to DisplayManager.show(). The FrameWriter
+    gives it back with release() once it no longer needs it (the frame was
+    dropped, skipped as unchanged, or replaced on the panel by a newer one).
+    A canvas that is never released is simply garbage collected, and
+    release() ignores anything that didn't come from the pool, so callers
+    that keep their image are unaffected.
+
+    At most `max_free` canvases per mode are kept; that bounds memory even
+    after a burst of frames from several threads.
+    """
+
+    def __init__(self, mode, size, max_free=4):
+        self.mode = mode
+        self.size = tuple(size)
+        self.max_free = max_free
+        self._lock = threading.Lock()
+        self._free = {}   # mode -> [canvas, ...]
+        # id -> canvas for every canvas handed out (images aren't hashable)
+        self._owned = weakref.WeakValueDictionary()
+
+        # Stats
+        self.allocated = 0
+        self.reused = 0
+
+    def acquire(self, mode=None):
+        """A black canvas of the pool's size in `mode` (the display mode by default)."""
+        mode = mode or self.mode
+        with self._lock:
+            free = self._free.get(mode)
+            canvas = free.pop() if free else None
+            if canvas is None:
+                self.allocated += 1
+            else:
+                self.reused += 1
+
+        if canvas is None:
+            canvas = Image.new(mode, self.size, "black")
+            with self._lock:
+                self._owned[id(canvas)] = canvas
+        else:
+            canvas.paste("black", (0, 0) + self.size)
+        return canvas
+
+    def release(self, canvas):
+        """Return `canvas` to the pool. No-op for images (or arrays) the pool didn't create."""
+        if not isinstance(canvas, Image.Image):
+            return
+        with self._lock:
+            if self._owned.get(id(canvas)) is not canvas:
+                return
+            free = self._free.setdefault(canvas.mode, [])
+            if len(free) >= self.max_free or any(c is canvas for c in free):
+                return
+            free.append(canvas)
+
+    def get_stats(self):
+        """Return allocation vs reuse counts."""
+        with self._lock:
+            return {
+                "allocated": self.allocated,
+                "reused": self.reused,
+                "free": {mode: len(free) for mode, free in self._free.items()},
+            }
@@ -0,0 +1,96 @@
+# src/display/compositor.py
+
+import logging
+from PIL import Image, ImageChops, ImageDraw
+
+
+class LayerCompositor:
+    """
+    Builds a screen's frame from a cached static layer plus small dynamic layers.
+
+    A screen describes its frame as:
+      - a static layer: everything that only changes with service/track/layout
+        (separators, progress-bar track, icons, labels). It is drawn onto a
+        transparent layer by build_static(draw, layer) and cached under a key
+        chosen by the screen; it is only rebuilt when that key changes.
+      - "under" layers: dynamic drawing that sits behind the static layer
+        (e.g. spectrum bars), each called as fn(draw, image).
+      - "over" layers: dynamic drawing on top (scrolling text, progress
+        indicator, elapsed time), called the same way.
+
+    The static layer is kept premultiplied (colour channel already blended
+    against black, plus inverted alpha), so compositing it over the under
+    layers is two C-level ImageChops passes instead of re-drawing it.
+    """
+
+    def __init__(self, size, mode="L", draw_factory=ImageDraw.Draw):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.WARNING)
+
+        self.size = size
+        self.mode = mode
+        # Used for the per-frame layers (e.g. DisplayManager.get_draw for cached text)
+        self.draw_factory = draw_factory
+        # Transparent layer mode matching the output: "LA" for "L", else "RGBA"
+        self.layer_mode = "LA" if mode in ("1", "L") else "RGBA"
+
+        self._static_key = None
+        self._static_colour = None
+        self._static_inv_alpha = None
+
+        # Stats
+        self.frames = 0
+        self.static_rebuilds = 0
+
+    def invalidate(self):
+        """Drop the cached static layer so the next compose() rebuilds it."""
+        self._static_key = None
+
+    def _build_static(self, key, build_static):
+        layer = Image.new(self.layer_mode, self.size, 0)
+        build_static(ImageDraw.Draw(layer), layer)
+
+        alpha = layer.getchannel("A")
+        colour = layer.convert("RGB" if self.layer_mode == "RGBA" else "L")
+        if self.mode != colour.mode:
+            colour = colour.convert(self.mode)
+            alpha = alpha.convert(self.mode)
+        elif colour.mode == "RGB":
+            alpha = alpha.convert("RGB")
+
+        # Pillow keeps RGBA/LA colour un-premultiplied; premultiply once here
+        self._static_colour = ImageChops.multiply(colour, alpha)
+        self._static_inv_alpha = ImageChops.invert(alpha)
+        self._static_key = key
+        self.static_rebuilds += 1
+        self.logger.debug(f"LayerCompositor: rebuilt static layer for key={key!r}")
+
+    def compose(self, static_key, build_static, under=(), over=()):
+        """
+        Return a new frame in self.mode: under layers, then the (cached)
+        static layer, then over layers.
+        """
+        if static_key != self._static_key or self._static_colour is None:
+            self._build_static(static_key, build_static)
+
+        if under:
+            frame = Image.new(self.mode, self.size, "black")
+            draw = self.draw_factory(frame)
+            for layer_fn in under:
+                layer_fn(draw, frame)
+            # frame * (1 - alpha) + premultiplied static colour
+            frame = ImageChops.add(ImageChops.multiply(frame, self._static_inv_alpha), self._static_colour)
+        else:
+            frame = self._static_colour.copy()
+
+        if over:
+            draw = self.draw_factory(frame)
+            for layer_fn in over:
+                layer_fn(draw, frame)
+
+        self.frames += 1
+        return frame
+
+    def get_stats(self):
+        """Return how often the static layer had to be rebuilt."""
+        return {"frames": self.frames, "static_rebuilds": self.static_rebuilds}
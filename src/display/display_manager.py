@@ -1,20 +1,69 @@
 import logging
-from PIL import Image, ImageDraw, ImageFont, ImageSequence
+from PIL import Image, ImageDraw, ImageFont
 from luma.core.interface.serial import spi
+from luma.core.framebuffer import full_frame
 from luma.oled.device import ssd1322
+from display.framebuffer import DirtyRectFramebuffer
+from display.ssd1322 import GreyscaleSSD1322
+from display.frame_writer import FrameWriter
+from display.render_scheduler import RenderScheduler
+from display.text_renderer import TextRenderer
+from display.animation import Animation, AnimationClock
+from display.asset_bundle import AssetBundle
+from display.font_registry import FontRegistry
+from display.canvas_pool import CanvasPool
+from display.splash import read_splash, take_handover, write_splash
 import threading
 import os
 import time
 
 class DisplayManager:
+    # Icon sizes baked into the asset bundle: the base size first, then
+    # ModernScreen (10, 20), the menus (30) and AirPlayScreen (60)
+    ICON_SIZES = ((35, 35), (10, 10), (20, 20), (30, 30), (60, 60))
+
     def __init__(self, config):
+        self.config = config
+
+        # Partial refresh: only the changed column/row window is sent over SPI
+        if self.config.get('partial_refresh', True):
+            self.framebuffer = DirtyRectFramebuffer()
+        else:
+            self.framebuffer = full_frame()
+
+        # Taking over a panel lit by scripts/early_splash.py: skip the reset
+        # pulse (it would blank the panel) and redraw the splash where luma
+        # would draw a blank frame, so the logo follows it without going dark
+        render_greyscale = self.config.get('render_mode', 'L') == 'L'
+        splash_packed = None
+        if render_greyscale and take_handover():
+            splash_packed = read_splash(self.config.get('splash_path'), 256, 64)
+
         # Initialize SPI connection for the SSD1322 OLED display
-        self.serial = spi(device=0, port=0)  # Default SPI device
-        self.oled = ssd1322(self.serial, width=256, height=64, rotate=2)
+        if splash_packed is not None:
+            self.serial = spi(device=0, port=0, gpio_RST=None)
+        else:
+            self.serial = spi(device=0, port=0)  # Default SPI device
+        # "L" (default) lets screens draw 8-bit greys directly; "RGB" keeps luma's stock path
+        if render_greyscale:
+            self.oled = GreyscaleSSD1322(self.serial, width=256, height=64, rotate=2,
+                                         framebuffer=self.framebuffer, initial_packed=splash_packed)
+        else:
+            self.oled = ssd1322(self.serial, width=256, height=64, rotate=2, framebuffer=self.framebuffer)
 
-        self.config = config
         self.lock = threading.Lock()
 
+        # Screens draw on pooled canvases; the writer hands each back once it's off the panel
+        self.canvases = CanvasPool(self.oled.mode, self.oled.size)
+
+        # Every frame goes through one writer thread; renderers never touch SPI directly
+        self.writer = FrameWriter(self.oled, release=self.canvases.release)
+        self.writer.start()
+
+        # One render thread ticks whichever screen is active (see RenderScheduler)
+        self.scheduler = RenderScheduler()
+        self.scheduler.start()
+
         # Initialize logger
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.WARNING)
@@ -33,10 +82,19 @@ class DisplayManager:
 
         self.logger.info("DisplayManager initialized.")
 
-        # Load fonts and icons
-        self.fonts = {}
-        self._load_fonts()
+        # Text runs are rasterised once and blitted afterwards (see TextRenderer)
+        self.text = TextRenderer()
+
+        # Shared time base for scrolling, screensavers and slides (see AnimationClock)
+        self.animation_clock = AnimationClock()
+
+        # Fonts: each file read once, faces built on first use (see FontRegistry)
+        self.fonts = FontRegistry(self.config.get('fonts', {}))
+
+        # Icons
         self.icons = {}
+        self._icon_cache = {}
+        self._animations = {}
 
         # Define the services and load their corresponding icons
         services = ["stream", "library", "playlists", "qobuz", "tidal", "airplay", "spop", "spotify", 
@@ -45,40 +103,24 @@ class DisplayManager:
         "systeminfo", "systemupdate"]
         icon_dir = self.config.get('icon_dir', "/home/volumio/CyFi/src/assets/images/menus")
 
-        for service in services:
-            icon_path = os.path.join(icon_dir, f"{service}.png")
-            try:
-                # Load the specific icon for each service
-                icon = Image.open(icon_path)
-
-                # Handle transparency (if icon has an alpha channel)
-                if icon.mode == "RGBA":
-                    # Create a new black background image
-                    background = Image.new("RGB", icon.size, (0, 0, 0))
-                    # Paste the icon onto the background using the alpha channel as mask
-                    background.paste(icon, mask=icon.split()[3])
-                    icon = background
-                    self.logger.info(f"Handled transparency for icon '{service}'.")
-
-                # Resize the icon to fit and convert to RGB mode
-                icon = icon.resize((35, 35), Image.LANCZOS).convert("RGB")
-                self.icons[service] = icon
-                self.logger.info(f"Loaded icon for '{service}' from '{icon_path}'.")
-
-            except IOError:
-                self.logger.warning(f"Icon for '{service}' not found at '{icon_path}', using default icon.")
-                # Fallback to the default icon in case the specific icon is missing
-                self.icons[service] = self.default_icon  # Use the pre-loaded default_icon
+        # Every icon at every size the UI asks for comes from one prebuilt,
+        # memory-mapped bundle, rebuilt only when a source PNG changes
+        self.assets = AssetBundle.load(icon_dir, services, self.ICON_SIZES, self.oled.mode,
+                                       bundle_dir=self.config.get('asset_bundle_dir'))
+        base_size = self.ICON_SIZES[0]
 
-
-        # Load the default icon separately, if needed
-        default_icon_path = os.path.join(icon_dir, "default.png")
-        try:
-            self.default_icon = Image.open(default_icon_path).resize((35, 35), Image.ANTIALIAS).convert("RGB")
-            self.logger.info(f"Loaded default icon from '{default_icon_path}'.")
-        except IOError:
+        self.default_icon = self.assets.get("default", base_size)
+        if self.default_icon is None:
             self.logger.warning("Default icon not found. Creating grey placeholder.")
-            self.default_icon = Image.new("RGB", (35, 35), "grey")
+            self.default_icon = Image.new(self.oled.mode, base_size, "grey")
+
+        for service in services:
+            icon = self.assets.get(service, base_size)
+            if icon is None:
+                self.logger.warning(f"Icon for '{service}' not found in '{icon_dir}', using default icon.")
+                # Fallback to the default icon in case the specific icon is missing
+                icon = self.default_icon
+            self.icons[service] = icon
 
         # Callback list for mode changes
         self.on_mode_change_callbacks = []
@@ -101,117 +143,219 @@ class DisplayManager:
             except Exception as e:
                 self.logger.error(f"Error in callback {callback}: {e}")
 
-    def _load_fonts(self):
-        fonts_config = self.config.get('fonts', {})
-        default_font = ImageFont.load_default()
-        
-        for key, font_info in fonts_config.items():
-            path = font_info.get('path')
-            size = font_info.get('size', 12)
-            if path and os.path.isfile(path):
-                try:
-                    self.fonts[key] = ImageFont.truetype(path, size=size)
-                    self.logger.info(f"Loaded font '{key}' from '{path}' with size {size}.")
-                except IOError as e:
-                    self.logger.error(f"Error loading font '{key}' from '{path}'. Exception: {e}")
-                    self.fonts[key] = default_font
-            else:
-                self.logger.warning(f"Font file not found for '{key}' at '{path}'. Falling back to default font.")
-                self.fonts[key] = default_font
-
-        self.logger.info(f"Available fonts after loading: {list(self.fonts.keys())}")
+    def get_icon(self, name, size=None, mode=None):
+        """
+        Return icon `name` resized to `size` (w, h) and converted to `mode`
+        (the panel's mode by default), with any alpha flattened onto black.
+        Sizes in ICON_SIZES come straight from the asset bundle; any other
+        variant is resampled once and cached, so callers can ask for it
+        every frame. Unknown names (or None) get the default icon.
+        Treat the result as read-only: it is shared.
+        """
+        mode = mode or self.oled.mode
+        size = tuple(size) if size else None
+        key = (name, size, mode)
+        icon = self._icon_cache.get(key)
+        if icon is None and mode == self.oled.mode and name in self.icons:
+            icon = self.assets.get(name, size or self.ICON_SIZES[0])
+        if icon is None:
+            icon = self.icons.get(name) or self.default_icon
+            if icon.mode == "RGBA":
+                background = Image.new("RGB", icon.size, (0, 0, 0))
+                background.paste(icon, mask=icon.split()[3])
+                icon = background
+            if size and icon.size != size:
+                icon = icon.resize(size, Image.LANCZOS)
+            if icon.mode != mode:
+                icon = icon.convert(mode)
+            self._icon_cache[key] = icon
+            self.logger.debug(f"Cached icon variant {key}.")
+        return icon
+
+    def get_draw(self, image):
+        """ImageDraw for `image` whose text()/textsize() use the shared text atlas."""
+        return self.text.get_draw(image)
+
+    def text_size(self, font, text):
+        """Memoised font.getsize(text)."""
+        return self.text.text_size(font, text)
+
+    def acquire_canvas(self, mode=None):
+        """
+        A black full-screen canvas from the pool (display mode unless `mode`
+        is given). Pass it to show(), which returns it to the pool once it
+        has been written, or give it back with release_canvas(). Don't keep
+        using it afterwards.
+        """
+        return self.canvases.acquire(mode)
+
+    def release_canvas(self, canvas):
+        """Return a canvas that won't be shown to the pool (no-op for other images)."""
+        self.canvases.release(canvas)
+
+    def get_canvas_stats(self):
+        """Return canvas pool allocation/reuse counters."""
+        return self.canvases.get_stats()
+
+    def show(self, image):
+        """
+        Submit a finished frame to the display writer (non-blocking, latest frame wins).
+        With render_mode "L" and NumPy installed, a (64, 256) uint8 greyscale array
+        is accepted too and packed straight into SSD1322 nibbles.
+        """
+        self.writer.submit(image)
+
+    def flush(self, timeout=1.0):
+        """Wait until the last submitted frame has actually reached the panel."""
+        return self.writer.flush(timeout)
+
+    def set_contrast(self, level):
+        """Change panel contrast without racing the writer thread."""
+        with self.writer.device_lock:
+            self.oled.contrast(level)
+
+    def get_writer_stats(self):
+        """Return frame counts (submitted/written/dropped/skipped) and per-frame SPI timings."""
+        return self.writer.get_stats()
+
+    def get_scheduler_stats(self):
+        """Return the render scheduler's tick counters and timings for the active screen."""
+        return self.scheduler.get_stats()
+
+    def get_font_stats(self):
+        """Return how many font files and faces are loaded."""
+        return self.fonts.get_stats()
+
+    def get_text_stats(self):
+        """Return text atlas / measurement cache hit counters."""
+        return self.text.get_stats()
+
+    def force_full_refresh(self):
+        """Make the next frame repaint the whole panel (e.g. after something else wrote to it)."""
+        self.writer.invalidate()
+        if isinstance(self.framebuffer, DirtyRectFramebuffer):
+            self.framebuffer.invalidate()
+
+    def get_refresh_stats(self):
+        """Return partial-refresh counters (frames, unchanged frames, fraction of pixels sent)."""
+        if isinstance(self.framebuffer, DirtyRectFramebuffer):
+            return self.framebuffer.get_stats()
+        return {}
 
     def clear_screen(self):
         """Clears the OLED screen by displaying a blank image."""
-        with self.lock:
-            blank_image = Image.new("RGB", self.oled.size, "black").convert(self.oled.mode)
-            self.oled.display(blank_image)
-            self.logger.info("Screen cleared.")
+        self.show(self.acquire_canvas())
+        self.logger.info("Screen cleared.")
 
     def display_image(self, image_path, resize=True, timeout=None):
         """Displays an image or animates a GIF if it's an animated file."""
-        with self.lock:
-            try:
-                # Load the image
-                image = Image.open(image_path)
-
-                # Handle transparency (if needed)
-                if image.mode == "RGBA":
-                    background = Image.new("RGB", image.size, (0, 0, 0))
-                    background.paste(image, mask=image.split()[3])
-                    image = background
-
-                # Resize and convert as needed
-                if resize:
-                    image = image.resize(self.oled.size, Image.ANTIALIAS)
-
-                # Convert to match the OLED's mode
-                image = image.convert(self.oled.mode)
-                self.oled.display(image)
-                self.logger.info(f"Displayed image from '{image_path}'.")
-
-                # Set timeout for the image if provided
-                if timeout:
-                    timer = threading.Timer(timeout, self.clear_screen)
-                    timer.start()
-                    self.logger.info(f"Set timeout to clear screen after {timeout} seconds.")
-            except IOError:
-                self.logger.error(f"Failed to load image '{image_path}'.")
+        try:
+            # Load the image
+            image = Image.open(image_path)
+
+            # Handle transparency (if needed)
+            if image.mode == "RGBA":
+                background = Image.new("RGB", image.size, (0, 0, 0))
+                background.paste(image, mask=image.split()[3])
+                image = background
+
+            # Resize and convert as needed
+            if resize:
+                image = image.resize(self.oled.size, Image.ANTIALIAS)
+
+            # Convert to match the OLED's mode
+            image = image.convert(self.oled.mode)
+            self.show(image)
+            self.logger.info(f"Displayed image from '{image_path}'.")
+
+            # Set timeout for the image if provided
+            if timeout:
+                timer = threading.Timer(timeout, self.clear_screen)
+                timer.start()
+                self.logger.info(f"Set timeout to clear screen after {timeout} seconds.")
+        except IOError:
+            self.logger.error(f"Failed to load image '{image_path}'.")
 
     def display_text(self, text, position, font_key='default', fill="white"):
         """Displays text at a specified position using a specified font."""
-        with self.lock:
-            image = Image.new("RGB", self.oled.size, "black")
-            draw = ImageDraw.Draw(image)
-            font = self.fonts.get(font_key, ImageFont.load_default())
-            draw.text(position, text, font=font, fill=fill)
+        image = self.acquire_canvas()
+        draw = self.get_draw(image)
+        font = self.fonts.get(font_key)
+        draw.text(position, text, font=font, fill=fill)
 
-            # Convert to match the OLED mode before displaying
-            image = image.convert(self.oled.mode)
-            self.oled.display(image)
-            self.logger.info(f"Displayed text '{text}' at {position} with font '{font_key}'.")
+        self.show(image)
+        self.logger.info(f"Displayed text '{text}' at {position} with font '{font_key}'.")
 
     def draw_custom(self, draw_function):
         """Executes a custom drawing function onto the OLED."""
-        with self.lock:
-            image = Image.new("RGB", self.oled.size, "black")
-            draw = ImageDraw.Draw(image)
-            draw_function(draw)
-
-            # Convert to match the OLED mode before displaying
-            image = image.convert(self.oled.mode)
-            self.oled.display(image)
-            self.logger.info("Executed custom draw function.")
-
-    def show_logo(self, duration=5):
+        image = self.acquire_canvas()
+        draw = self.get_draw(image)
+        draw_function(draw)
+
+        self.show(image)
+        self.logger.info("Executed custom draw function.")
+
+    def load_animation(self, path, fit="resize"):
+        """
+        Return the pre-decoded Animation for a GIF at panel size (see
+        display.animation), or None if it can't be read. Kept for reuse.
+        """
+        key = (path, fit)
+        animation = self._animations.get(key)
+        if animation is None:
+            try:
+                animation = Animation.load(path, self.oled.size, fit)
+            except Exception as e:
+                self.logger.error(f"Could not load animation '{path}': {e}")
+                return None
+            self._animations[key] = animation
+        return animation
+
+    def play_animation(self, path, stop_condition=None, duration=None, fit="resize", loop=True):
+        """Play a GIF from its frame cache on a steady pacer. Returns False if it can't be loaded."""
+        animation = self.load_animation(path, fit)
+        if animation is None:
+            return False
+        show = self.show
+        if not isinstance(self.oled, GreyscaleSSD1322):
+            # luma's stock driver only takes images, not the cached uint8 arrays
+            show = lambda frame: self.show(frame if hasattr(frame, "mode") else Image.fromarray(frame))
+        animation.play(show, stop_condition=stop_condition, duration=duration, loop=loop)
+        return True
+
+    def show_logo(self, duration=5, stop_condition=None):
+        """Play the logo for up to `duration` seconds, or until `stop_condition()` is true."""
         logo_path = self.config.get('logo_path')
         if not logo_path:
             self.logger.warning("No logo path configured.")
             return
 
-        try:
-            image = Image.open(logo_path)
-        except IOError:
+        if not self.play_animation(logo_path, stop_condition=stop_condition, duration=duration):
             self.logger.error(f"Could not load logo from '{logo_path}'.")
-            return
-
-        start_time = time.time()
-        if getattr(image, "is_animated", False):
-            while time.time() - start_time < duration:
-                for frame in ImageSequence.Iterator(image):
-                    if time.time() - start_time >= duration:
-                        break
-                    # --- Resize frame if needed ---
-                    resized_frame = frame.convert("RGB").resize(self.oled.size, Image.LANCZOS).convert(self.oled.mode)
-                    self.oled.display(resized_frame)
-                    frame_duration = frame.info.get('duration', 100) / 1000.0
-                    time.sleep(frame_duration)
-        else:
-            img = image.convert(self.oled.mode).resize(self.oled.size, Image.LANCZOS)
-            self.oled.display(img)
-            time.sleep(duration)
 
+    def update_splash(self):
+        """
+        Rewrite the early splash file from the logo's first frame when it is
+        missing or older than the logo, so the next boot starts on that frame.
+        """
+        splash_path = self.config.get('splash_path')
+        logo_path = self.config.get('logo_path')
+        if not splash_path or not logo_path or not hasattr(self.oled, "pack"):
+            return
+        try:
+            if os.path.getmtime(splash_path) >= os.path.getmtime(logo_path):
+                return
+        except OSError:
+            pass  # no splash yet (or no logo, which load_animation reports)
 
+        animation = self.load_animation(logo_path)
+        if animation is None:
+            return
+        try:
+            if write_splash(splash_path, self.oled, animation.frames[0]):
+                self.logger.info(f"Early splash written to '{splash_path}'.")
+        except OSError as e:
+            self.logger.warning(f"Could not write early splash '{splash_path}' => {e}")
 
     def stop_mode(self):
         """Stops any active mode and clears the display."""
@@ -221,43 +365,27 @@ class DisplayManager:
 
     def slide_clock_to_menu(display_manager, clock, menu, duration=0.4, fps=60):
         width = display_manager.oled.width
-        frames = int(duration * fps)
-        for step in range(frames + 1):
-            progress = int((width * step) / frames)
-            base_image = Image.new("RGB", display_manager.oled.size, "black")
+
+        def draw_frame(fraction):
+            progress = int(width * fraction)
+            base_image = display_manager.acquire_canvas()
             # Draw clock sliding out left
             clock_img = clock.render_to_image(offset_x=-progress)
             base_image.paste(clock_img, (0, 0), clock_img if clock_img.mode == "RGBA" else None)
+            display_manager.release_canvas(clock_img)
             # Draw menu sliding in right
             menu_img = menu.render_to_image(offset_x=width - progress)
             base_image.paste(menu_img, (0, 0), menu_img if menu_img.mode == "RGBA" else None)
-            frame_start = time.time()
-            display_manager.oled.display(base_image)
-            frame_drawn = time.time()
-            elapsed = frame_drawn - frame_start
-            remaining = (duration / frames) - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
-            print(f"Frame {step}: drew in {elapsed:.3f} sec, slept for {max(remaining,0):.3f} sec")
+            display_manager.show(base_image)
+
+        # Positions follow elapsed time, so a slow frame is skipped, not stretched
+        frames = display_manager.animation_clock.transition(duration, draw_frame, fps)
+        display_manager.logger.debug(f"DisplayManager: clock-to-menu slide drew {frames} frames in {duration}s.")
         menu.display_menu()
 
 
     def show_ready_gif_until_event(self, stop_event):
         ready_gif_path = self.config.get('ready_gif_path')
-        try:
-            image = Image.open(ready_gif_path)
-        except Exception as e:
-            self.logger.error(f"Could not load ready.gif: {e}")
-            return
-
         self.logger.info("Displaying ready.gif in a loop until event set.")
-
-        while not stop_event.is_set():
-            for frame in ImageSequence.Iterator(image):
-                if stop_event.is_set():
-                    self.logger.info("Ready GIF display stopped by event.")
-                    return
-                frame_resized = frame.convert("RGB").resize(self.oled.size, Image.LANCZOS).convert(self.oled.mode)
-                self.oled.display(frame_resized)
-                frame_duration = frame.info.get('duration', 100) / 1000.0
-                time.sleep(frame_duration)
+        if self.play_animation(ready_gif_path, stop_condition=stop_event.is_set):
+            self.logger.info("Ready GIF display stopped by event.")
@@ -0,0 +1,126 @@
+# src/display/font_registry.py
+
+import io
+import logging
+import os
+import threading
+from PIL import ImageFont
+
+# Marks "no default given" in FontRegistry.get(), which then returns the fallback font
+_FALLBACK = object()
+
+
+class FontRegistry:
+    """
+    Every configured font, with each TTF read once and faces built on demand.
+
+    Behaves like the dict DisplayManager used to fill up front
+    (`fonts[key]`, `fonts.get(key)`, `key in fonts`), but:
+      - each font file is read from disk once and its bytes are shared by
+        every face made from it (OpenSans backs a dozen keys);
+      - a face is only built when a key is first asked for, and keys with
+        the same file and size share one face object (which also lets
+        TextRenderer's caches, keyed by font, share entries);
+      - get(key) without a default returns one shared fallback font
+        instead of callers building ImageFont.load_default() every call;
+      - variant(key, delta=3) hands out derived sizes from the same cache.
+
+    A key whose file is missing or unreadable resolves to the fallback
+    font, as before.
+    """
+
+    def __init__(self, fonts_config):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.WARNING)
+
+        self._specs = {}
+        for key, font_info in (fonts_config or {}).items():
+            self._specs[key] = (font_info.get('path'), font_info.get('size', 12))
+
+        self._lock = threading.Lock()
+        self._data = {}    # path -> file bytes (None if unreadable)
+        self._faces = {}   # (path, size) -> FreeTypeFont
+        self._default = None
+
+    # ------------------------------------------------------------------
+    #   Faces
+    # ------------------------------------------------------------------
+    @property
+    def default(self):
+        if self._default is None:
+            self._default = ImageFont.load_default()
+        return self._default
+
+    def _font_data(self, path):
+        if path not in self._data:
+            data = None
+            if path and os.path.isfile(path):
+                try:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                except IOError as e:
+                    self.logger.error(f"FontRegistry: error reading font file '{path}' => {e}")
+            else:
+                self.logger.warning(f"FontRegistry: font file not found at '{path}', using default font.")
+            self._data[path] = data
+        return self._data[path]
+
+    def face(self, path, size):
+        """The face for `path` at `size`, built once and shared (fallback font on error)."""
+        key = (path, size)
+        with self._lock:
+            face = self._faces.get(key)
+            if face is None:
+                data = self._font_data(path)
+                face = self.default
+                if data is not None:
+                    try:
+                        # A fresh BytesIO over the same bytes object hands FreeType the
+                        # shared buffer rather than a copy
+                        face = ImageFont.truetype(io.BytesIO(data), size=size)
+                        self.logger.info(f"FontRegistry: built '{os.path.basename(path)}' at size {size}.")
+                    except (IOError, OSError) as e:
+                        self.logger.error(f"FontRegistry: error loading '{path}' at size {size} => {e}")
+                self._faces[key] = face
+            return face
+
+    # ------------------------------------------------------------------
+    #   dict-style access by config key
+    # ------------------------------------------------------------------
+    def __getitem__(self, key):
+        path, size = self._specs[key]
+        return self.face(path, size)
+
+    def get(self, key, default=_FALLBACK):
+        if key not in self._specs:
+            return self.default if default is _FALLBACK else default
+        return self[key]
+
+    def __contains__(self, key):
+        return key in self._specs
+
+    def __iter__(self):
+        return iter(self._specs)
+
+    def __len__(self):
+        return len(self._specs)
+
+    def keys(self):
+        return self._specs.keys()
+
+    def variant(self, key, size=None, delta=0):
+        """Font `key` at `size` (or its configured size + `delta`), cached like any other face."""
+        if key not in self._specs:
+            return self.default
+        path, base_size = self._specs[key]
+        return self.face(path, (size or base_size) + delta)
+
+    def get_stats(self):
+        """How many font files were read and faces built, for how many keys."""
+        with self._lock:
+            return {
+                "keys": len(self._specs),
+                "files_read": sum(1 for data in self._data.values() if data is not None),
+                "file_bytes": sum(len(data) for data in self._data.values() if data is not None),
+                "faces": len(self._faces),
+            }
@@ -0,0 +1,183 @@
+# src/display/frame_writer.py
+
+import hashlib
+import logging
+import threading
+import time
+
+
+class FrameWriter:
+    """
+    Single display-writer thread fed by a one-slot "latest frame wins" mailbox.
+
+    Renderers call submit() and return immediately. If the writer is still busy
+    pushing the previous frame over SPI, whatever was waiting in the slot is
+    replaced (and counted as dropped) rather than queued, so the panel always
+    shows the most recent frame and no producer ever blocks on the bus.
+
+    Each frame is fingerprinted before it goes near the device; if it is
+    byte-identical to the last frame written, the transfer is skipped.
+
+    `release(frame)` is called for every submitted frame the writer is done
+    with: dropped, skipped, failed, or replaced on the panel by a newer
+    one. DisplayManager uses it to return pooled canvases.
+    """
+
+    def __init__(self, device, name="FrameWriter", release=None):
+        self.device = device
+        self.release = release
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.WARNING)
+
+        # Serialises every access to the panel (frame writes, contrast, ...)
+        self.device_lock = threading.Lock()
+
+        self._cond = threading.Condition()
+        self._pending = None
+        self._busy = False
+        self._running = False
+        self._thread = None
+        self._name = name
+        self._last_digest = None
+        self.last_frame = None  # last frame written to the panel (warm-restart snapshots)
+        # Guards last_frame/frames_written against snapshot_frame() readers
+        self._frame_lock = threading.Lock()
+
+        # Stats
+        self.frames_submitted = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.frames_skipped = 0
+        self.first_write_time = None  # time.monotonic() of the first frame on the panel
+        self.last_spi_time = 0.0
+        self.max_spi_time = 0.0
+        self.total_spi_time = 0.0
+
+    def start(self):
+        """Start the writer thread (no-op if already running)."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        self.logger.info("FrameWriter: started.")
+
+    def stop(self, timeout=1.0):
+        """Flush whatever is pending, then stop the writer thread."""
+        self.flush(timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.logger.info("FrameWriter: stopped.")
+
+    def submit(self, image):
+        """Hand a frame to the writer without blocking. A frame still waiting is dropped."""
+        with self._cond:
+            dropped = self._pending
+            if dropped is not None:
+                self.frames_dropped += 1
+            self._pending = image
+            self.frames_submitted += 1
+            self._cond.notify_all()
+        if dropped is not None and dropped is not image:
+            self._release(dropped)
+
+    def snapshot_frame(self):
+        """
+        Return (frames_written, copy of the frame on the panel), read
+        together under the writer's lock. The copy is the caller's to keep:
+        the original goes back to the canvas pool (and is cleared for
+        reuse) as soon as the next frame replaces it.
+        """
+        with self._frame_lock:
+            frame = self.last_frame
+            return self.frames_written, (frame.copy() if frame is not None else None)
+
+    def _release(self, frame):
+        if self.release is not None and frame is not None and frame is not self.last_frame:
+            self.release(frame)
+
+    def invalidate(self):
+        """Forget the last frame fingerprint so the next frame is always written."""
+        self._last_digest = None
+
+    def flush(self, timeout=1.0):
+        """Block until the mailbox is empty and the current write has finished."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._running and (self._pending is not None or self._busy):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and self._pending is None:
+                    self._cond.wait()
+                if not self._running and self._pending is None:
+                    return
+                frame = self._pending
+                self._pending = None
+                self._busy = True
+
+            try:
+                self._write(frame)
+            except Exception as e:
+                self.logger.error(f"FrameWriter: failed to write frame => {e}")
+            finally:
+                # Still needed only if it is what the panel now shows
+                self._release(frame)
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _write(self, image):
+        # Pre-rendered uint8 arrays (no .mode) go to the device untouched
+        mode = getattr(image, "mode", self.device.mode)
+        if mode != self.device.mode:
+            image = image.convert(self.device.mode)
+
+        # Skip the transfer entirely if nothing visible changed
+        digest = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+        if digest == self._last_digest:
+            self.frames_skipped += 1
+            return
+
+        with self.device_lock:
+            start = time.perf_counter()
+            self.device.display(image)
+            elapsed = time.perf_counter() - start
+        # Only now is it on the panel: after a failed write the retry must go out
+        self._last_digest = digest
+
+        with self._frame_lock:
+            previous, self.last_frame = self.last_frame, image
+            self.frames_written += 1
+        if previous is not image:
+            self._release(previous)
+        if self.first_write_time is None:
+            self.first_write_time = time.monotonic()
+        self.last_spi_time = elapsed
+        self.total_spi_time += elapsed
+        if elapsed > self.max_spi_time:
+            self.max_spi_time = elapsed
+
+    def get_stats(self):
+        """Return submit/write/drop/skip counters and per-frame SPI timings (ms)."""
+        avg = (self.total_spi_time / self.frames_written) if self.frames_written else 0.0
+        return {
+            "submitted": self.frames_submitted,
+            "written": self.frames_written,
+            "dropped": self.frames_dropped,
+            "skipped": self.frames_skipped,
+            "last_spi_ms": round(self.last_spi_time * 1000, 2),
+            "avg_spi_ms": round(avg * 1000, 2),
+            "max_spi_ms": round(self.max_spi_time * 1000, 2),
+        }
@@ -0,0 +1,95 @@
+# src/display/framebuffer.py
+
+from PIL import ImageChops
+
+
+class DirtyRectFramebuffer:
+    """
+    Framebuffer strategy for luma's ssd1322 driver that keeps the last frame
+    sent to the panel and diffs every new frame against it.
+
+    Instead of luma's fixed 2x2 segment grid, a single bounding box covering
+    every changed pixel is yielded. luma inflates that box to the SSD1322's
+    4-pixel column groups and issues set-column (0x15) / set-row (0x75) before
+    the data write, so only the dirty window crosses the SPI bus. Identical
+    frames yield nothing at all.
+    """
+
+    def __init__(self):
+        self.prev_image = None
+        self.prev_packed = None
+
+        # Simple counters so DisplayManager can report how much we save
+        self.frames = 0
+        self.unchanged_frames = 0
+        self.pixels_sent = 0
+        self.pixels_total = 0
+
+    def invalidate(self):
+        """Forget the previous frame so the next redraw sends the full panel."""
+        self.prev_image = None
+        self.prev_packed = None
+
+    def redraw(self, image):
+        """
+        Yields (image, bounding_box) for the changed window, or nothing if
+        the frame is identical to the previous one. The first frame (and any
+        frame after invalidate()) is always sent in full.
+        """
+        width, height = image.size
+        self.frames += 1
+        self.pixels_total += width * height
+
+        prev = self.prev_image
+        if prev is None or prev.size != image.size or prev.mode != image.mode:
+            bbox = (0, 0, width, height)
+        else:
+            bbox = ImageChops.difference(prev, image).getbbox()
+            if bbox is None:
+                self.unchanged_frames += 1
+                return
+
+        left, top, right, bottom = bbox
+        self.pixels_sent += (right - left) * (bottom - top)
+        self.prev_image = image.copy()
+        yield image.crop(bbox), bbox
+
+    def redraw_packed(self, packed):
+        """
+        Same as redraw(), but for an already packed 4bpp NumPy array
+        (rows x width/2 bytes). Yields (window, bounding_box) where window
+        is the packed slice to send and bounding_box is in pixels. Comparing
+        packed nibbles means changes below the panel's 16 grey levels are
+        never sent at all.
+        """
+        height, row_bytes = packed.shape
+        self.frames += 1
+        self.pixels_total += row_bytes * 2 * height
+
+        prev = self.prev_packed
+        if prev is None or prev.shape != packed.shape:
+            top, bottom, left, right = 0, height, 0, row_bytes
+        else:
+            changed = packed != prev
+            rows = changed.any(axis=1).nonzero()[0]
+            if rows.size == 0:
+                self.unchanged_frames += 1
+                return
+            cols = changed.any(axis=0).nonzero()[0]
+            top, bottom = int(rows[0]), int(rows[-1]) + 1
+            # Two bytes per SSD1322 column address (4 pixels)
+            left = int(cols[0]) & ~1
+            right = (int(cols[-1]) + 2) & ~1
+
+        self.pixels_sent += (right - left) * 2 * (bottom - top)
+        self.prev_packed = packed
+        yield packed[top:bottom, left:right], (left * 2, top, right * 2, bottom)
+
+    def get_stats(self):
+        """Return a small dict describing partial-refresh efficiency."""
+        sent_ratio = (self.pixels_sent / self.pixels_total) if self.pixels_total else 0.0
+        return {
+            "frames": self.frames,
+            "unchanged_frames": self.unchanged_frames,
+            "sent_ratio": round(sent_ratio, 3),
+        }
@@ -0,0 +1,52 @@
+# src/display/marquee.py
+
+from PIL import Image, ImageDraw
+
+
+class Marquee:
+    """
+    A scrolling string rendered once into a wide coverage strip.
+
+    The strip holds `start_x` blank pixels, then the text repeated every
+    `period` (text width + wrap gap) pixels, wide enough that any window of
+    `width` pixels can be cut straight out of it. A frame just crops that
+    window at the current offset and pastes it as a mask, so the cost of
+    scrolling no longer depends on the string's length or the font.
+
+    Offsets start at 0 with the text's left edge at `start_x`, scroll left
+    by one pixel per unit of offset, and after the first pass wrap around
+    with `gap` pixels between the end of the text and its next repeat.
+    """
+
+    def __init__(self, text, font, width, start_x=0, gap=40):
+        self.text = text
+        self.font = font
+        self.width = width
+        self.start_x = start_x
+
+        text_width = font.getsize(text)[0]
+        self.period = text_width + gap
+
+        left, top, right, bottom = font.getbbox(text)
+        self.top = top
+        height = max(1, bottom - top)
+
+        strip_width = start_x + self.period + width
+        self.strip = Image.new("L", (strip_width, height), 0)
+        draw = ImageDraw.Draw(self.strip)
+        x = start_x
+        while x + left < strip_width:
+            draw.text((x, -top), text, font=font, fill=255)
+            x += self.period
+
+    def wrap(self, offset):
+        """Fold an ever-growing offset back into [0, start_x + period)."""
+        if offset >= self.start_x + self.period:
+            offset = self.start_x + (offset - self.start_x) % self.period
+        return offset
+
+    def draw(self, image, x, y, offset, fill="white"):
+        """Paste the window for `offset` at (x, y); y is the text's draw position."""
+        start = self.wrap(offset)
+        window = self.strip.crop((start, 0, start + self.width, self.strip.height))
+        image.paste(fill, (x, y + self.top), window)
@@ -0,0 +1,190 @@
+# src/display/render_scheduler.py
+
+import logging
+import threading
+import time
+
+
+class RenderScheduler:
+    """
+    One render thread for the whole UI, owned by DisplayManager.
+
+    Only the active screen is ticked. A screen registers itself with
+    activate(screen, fps) from its start_mode() and calls deactivate(screen)
+    from stop_mode(); in between, the scheduler calls screen.render_tick()
+    on fixed deadlines of a monotonic clock (so a slow frame doesn't push
+    every later frame back). fps=0 means purely event-driven: the screen is
+    only ticked when request_tick() is called, e.g. on a new Volumio state.
+    With no active screen the thread sleeps until something activates.
+    """
+
+    def __init__(self, name="RenderScheduler"):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.WARNING)
+
+        self._cond = threading.Condition()
+        self._screen = None
+        self._period = 0.0
+        self._deadline = None
+        self._tick_requested = False
+        self._ticking = None
+        self._running = False
+        self._thread = None
+        self._name = name
+
+        # Stats (reset on every activate)
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.ticks = 0
+        self.requested_ticks = 0
+        self.overruns = 0
+        self.total_tick_time = 0.0
+        self.max_tick_time = 0.0
+        self.max_lateness = 0.0
+
+    # ------------------------------------------------------------------
+    #   Lifecycle
+    # ------------------------------------------------------------------
+    def start(self):
+        """Start the render thread (no-op if already running)."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        self.logger.info("RenderScheduler: started.")
+
+    def stop(self, timeout=1.0):
+        """Stop the render thread after the current tick (if any) finishes."""
+        with self._cond:
+            self._running = False
+            self._screen = None
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        self.logger.info("RenderScheduler: stopped.")
+
+    # ------------------------------------------------------------------
+    #   Screen registration
+    # ------------------------------------------------------------------
+    def activate(self, screen, fps=0):
+        """
+        Make `screen` the one being ticked, at `fps` frames per second
+        (0 = only on request_tick()). The first tick happens straight away.
+        """
+        with self._cond:
+            self._screen = screen
+            self._period = (1.0 / fps) if fps else 0.0
+            self._deadline = time.monotonic()
+            self._tick_requested = True
+            self._reset_stats()
+            self._cond.notify_all()
+        self.logger.info(f"RenderScheduler: activated {screen.__class__.__name__} at {fps} fps.")
+
+    def deactivate(self, screen=None, timeout=1.0):
+        """
+        Stop ticking `screen` (or whatever is active if None). Blocks until a
+        tick already in progress for it has finished, so callers can safely
+        clear the display afterwards.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if screen is None:
+                screen = self._screen
+            if screen is not None and self._screen is screen:
+                self._screen = None
+                self._cond.notify_all()
+                self.logger.info(f"RenderScheduler: deactivated {screen.__class__.__name__}.")
+
+            if self._thread is threading.current_thread():
+                return
+            while screen is not None and self._ticking is screen:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.logger.warning("RenderScheduler: timed out waiting for tick to finish.")
+                    return
+                self._cond.wait(remaining)
+
+    def is_active(self, screen):
+        return self._screen is screen
+
+    def request_tick(self, screen=None):
+        """
+        Ask for an extra tick as soon as possible (e.g. new state arrived).
+        Ignored unless `screen` is the active one (or None is passed).
+        """
+        with self._cond:
+            if self._screen is None or (screen is not None and screen is not self._screen):
+                return
+            self._tick_requested = True
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    #   Render loop
+    # ------------------------------------------------------------------
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running:
+                    if self._screen is not None:
+                        if self._tick_requested:
+                            break
+                        if self._period:
+                            wait = self._deadline - time.monotonic()
+                            if wait <= 0:
+                                break
+                            self._cond.wait(wait)
+                            continue
+                    self._cond.wait()
+                if not self._running:
+                    return
+
+                screen = self._screen
+                requested = self._tick_requested
+                self._tick_requested = False
+                self._ticking = screen
+
+                now = time.monotonic()
+                if self._period and now >= self._deadline:
+                    lateness = now - self._deadline
+                    if lateness > self.max_lateness:
+                        self.max_lateness = lateness
+                    # Next deadline on the fixed grid; skip (and count) any we missed
+                    missed = int(lateness / self._period)
+                    self.overruns += missed
+                    self._deadline += (missed + 1) * self._period
+                elif requested:
+                    self.requested_ticks += 1
+
+            start = time.perf_counter()
+            try:
+                screen.render_tick()
+            except Exception as e:
+                self.logger.error(f"RenderScheduler: {screen.__class__.__name__}.render_tick failed => {e}")
+            elapsed = time.perf_counter() - start
+
+            with self._cond:
+                self._ticking = None
+                self.ticks += 1
+                self.total_tick_time += elapsed
+                if elapsed > self.max_tick_time:
+                    self.max_tick_time = elapsed
+                self._cond.notify_all()
+
+    def get_stats(self):
+        """Return tick counters and timings (ms) for the active screen."""
+        screen = self._screen
+        avg = (self.total_tick_time / self.ticks) if self.ticks else 0.0
+        return {
+            "screen": screen.__class__.__name__ if screen is not None else None,
+            "fps": round(1.0 / self._period, 2) if self._period else 0,
+            "ticks": self.ticks,
+            "requested_ticks": self.requested_ticks,
+            "overruns": self.overruns,
+            "avg_tick_ms": round(avg * 1000, 2),
+            "max_tick_ms": round(self.max_tick_time * 1000, 2),
+            "max_late_ms": round(self.max_lateness * 1000, 2),
+        }
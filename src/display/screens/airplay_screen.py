@@ -16,6 +16,9 @@ class AirPlayScreen:
     Instead of trying to download album art (which for AirPlay is not valid), it uses
     a static AirPlay icon (preloaded in DisplayManager).
     """
+    # Event-driven: only redrawn when a new state arrives
+    render_fps = 0
+
     def __init__(self, display_manager, volumio_listener, mode_manager):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
@@ -29,18 +32,11 @@ class AirPlayScreen:
         self.latest_state = None
         self.current_state = None
         self.state_lock = threading.Lock()
-        self.update_event = threading.Event()
-        self.stop_event = threading.Event()
 
         # Fonts (use the same keys as in WebRadioScreen or adjust as desired)
-        self.font_title = display_manager.fonts.get('radio_title', ImageFont.load_default())
-        self.font_small = display_manager.fonts.get('radio_small', ImageFont.load_default())
-        self.font_label = display_manager.fonts.get('radio_bitrate', ImageFont.load_default())
-
-        # Background update thread
-        self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-        self.update_thread.start()
-        self.logger.info("AirPlayScreen: Started background update thread.")
+        self.font_title = display_manager.fonts.get('radio_title')
+        self.font_small = display_manager.fonts.get('radio_small')
+        self.font_label = display_manager.fonts.get('radio_bitrate')
 
         # Connect to Volumio state changes
         if self.volumio_listener:
@@ -82,19 +78,16 @@ class AirPlayScreen:
             state["timestamp"] = current_time
             self.last_state = state.copy()
             self.latest_state = state.copy()
-        self.update_event.set()
-
-    def update_display_loop(self):
-        """Wait for state updates (or timeout) and then redraw the screen."""
-        while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
-            with self.state_lock:
-                if triggered and self.latest_state:
-                    self.current_state = self.latest_state.copy()
-                    self.latest_state = None
-                    self.update_event.clear()
-            if self.is_active and self.mode_manager.get_mode() == "airplay" and self.current_state:
-                self.draw_display(self.current_state)
+        self.display_manager.scheduler.request_tick(self)
+
+    def render_tick(self):
+        """Called by the display's RenderScheduler when a new state is queued; redraws the screen."""
+        with self.state_lock:
+            if self.latest_state:
+                self.current_state = self.latest_state.copy()
+                self.latest_state = None
+        if self.is_active and self.mode_manager.get_mode() == "airplay" and self.current_state:
+            self.draw_display(self.current_state)
 
     def start_mode(self):
         if self.mode_manager.get_mode() != "airplay":
@@ -102,17 +95,12 @@ class AirPlayScreen:
             # Optionally, you can force the state here:
             # self.mode_manager.machine.set_state("airplay")
         self.is_active = True
-        try:
-            if self.volumio_listener and self.volumio_listener.socketIO:
-                self.logger.debug("AirPlayScreen: Forcing getState from Volumio.")
-                self.volumio_listener.socketIO.emit("getState", {})
-        except Exception as e:
-            self.logger.warning(f"AirPlayScreen: Failed to emit 'getState'. Error => {e}")
-        if not self.update_thread.is_alive():
-            self.stop_event.clear()
-            self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-            self.update_thread.start()
-            self.logger.debug("AirPlayScreen: Display update thread restarted.")
+        # Draw from the state we already have (getState only if there is none yet)
+        if self.volumio_listener:
+            state = self.volumio_listener.get_or_request_state()
+            if state:
+                self.on_volumio_state_change(self.volumio_listener, state)
+        self.display_manager.scheduler.activate(self, self.render_fps)
 
     def stop_mode(self):
         """
@@ -123,12 +111,7 @@ class AirPlayScreen:
             return
 
         self.is_active = False
-        self.stop_event.set()
-        self.update_event.set()
-
-        if self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
-            self.logger.debug("AirPlayScreen: Display update thread stopped.")
+        self.display_manager.scheduler.deactivate(self)
 
         self.display_manager.clear_screen()
         self.logger.info("AirPlayScreen: Stopped mode and cleared screen.")
@@ -150,8 +133,8 @@ class AirPlayScreen:
          - Service info (or stream) and quality info (bitdepth/samplerate)
          - Instead of album art, use the preloaded 'airplay' icon.
         """
-        base_image = Image.new("RGB", self.display_manager.oled.size, "black")
-        draw = ImageDraw.Draw(base_image)
+        base_image = self.display_manager.acquire_canvas()
+        draw = self.display_manager.get_draw(base_image)
         margin = 5
 
         screen_width, screen_height = self.display_manager.oled.size
@@ -186,16 +169,15 @@ class AirPlayScreen:
         draw.text((margin, quality_y), quality, font=self.font_label, fill="white")
 
         # Instead of downloading album art, use a static AirPlay icon.
-        airplay_icon = self.display_manager.icons.get("airplay")
-        if airplay_icon:
+        if self.display_manager.icons.get("airplay"):
             icon_size = (60, 60)
-            airplay_icon = airplay_icon.resize(icon_size, Image.LANCZOS)
+            airplay_icon = self.display_manager.get_icon("airplay", icon_size)
             art_x = screen_width - icon_size[0] - margin
             art_y = margin
             base_image.paste(airplay_icon, (art_x, art_y))
 
         # Finally, update the OLED.
-        self.display_manager.oled.display(base_image)
+        self.display_manager.show(base_image)
         self.logger.debug("AirPlayScreen: Display updated.")
 
     def adjust_volume(self, volume_change):
@@ -1,5 +1,4 @@
 import time
-import threading
 from PIL import Image, ImageDraw
 
 class Clock:
@@ -8,7 +7,6 @@ class Clock:
         self.volumio_listener = volumio_listener
         self.config = config
         self.running = False
-        self.thread = None
 
         self.font_y_offsets = {
             "clock_sans":    -15,
@@ -45,8 +43,8 @@ class Clock:
         w = self.display_manager.oled.width
         h = self.display_manager.oled.height
 
-        img = Image.new("RGB", (w, h), "black")
-        draw = ImageDraw.Draw(img)
+        img = self.display_manager.acquire_canvas()
+        draw = self.display_manager.get_draw(img)
         time_font = self.display_manager.fonts[time_font_key]
         date_font = self.display_manager.fonts.get(date_font_key, time_font)
 
@@ -82,31 +80,31 @@ class Clock:
 
     def draw_clock(self, offset_x=0):
         """Draw the clock at a specified horizontal offset (for animation)."""
-        img = self.render_clock_image(offset_x)
-        final_img = img.convert(self.display_manager.oled.mode)
-        self.display_manager.oled.display(final_img)
+        self.display_manager.show(self.render_clock_image(offset_x))
+
+    @property
+    def render_fps(self):
+        # Twice a second when showing seconds so none get skipped; else once a second
+        return 2 if self.config.get("show_seconds", False) else 1
 
     def start(self):
-        """Start continuous clock updates."""
+        """Start continuous clock updates (ticked by the display's RenderScheduler)."""
         if not self.running:
             self.running = True
-            self.thread = threading.Thread(target=self.update_clock, daemon=True)
-            self.thread.start()
+            self.display_manager.scheduler.activate(self, self.render_fps)
             print("Clock: Started.")
 
     def stop(self):
         """Stop continuous clock updates and clear the display."""
         if self.running:
             self.running = False
-            self.thread.join()
+            self.display_manager.scheduler.deactivate(self)
             self.display_manager.clear_screen()
             print("Clock: Stopped.")
 
-    def update_clock(self):
-        """Threaded loop: updates the clock display every second."""
-        while self.running:
-            self.draw_clock()
-            time.sleep(1)
+    def render_tick(self):
+        """Called by the RenderScheduler: redraw the clock."""
+        self.draw_clock()
 
     def toggle_play_pause(self):
         """Send toggle command to Volumio (if connected)."""
@@ -120,11 +118,8 @@ class Clock:
     def slide_out_left(self, duration=0.5, fps=30):
         """Animate the clock sliding out left (for transitions)."""
         w = self.display_manager.oled.width
-        frames = int(duration * fps)
-        for step in range(frames + 1):
-            offset = -int((w * step) / frames)
-            self.draw_clock(offset_x=offset)
-            time.sleep(duration / frames)
+        self.display_manager.animation_clock.transition(
+            duration, lambda progress: self.draw_clock(offset_x=-int(w * progress)), fps)
 
     def render_to_image(self, offset_x=0):
         """Render the clock to an image (for transition blending)."""
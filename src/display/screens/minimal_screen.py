@@ -14,6 +14,10 @@ class MinimalScreen(BaseManager):
       - Very minimal, white-on-black layout
     """
 
+    # Ticks per second while active (only the progress circle/time moves);
+    # a tick only redraws when something visible changed
+    render_fps = 2
+
     def __init__(self, display_manager, volumio_listener, mode_manager):
         super().__init__(display_manager, volumio_listener, mode_manager)
 
@@ -27,25 +31,19 @@ class MinimalScreen(BaseManager):
         #   minimal_volume   => Montserrat-Bold,   size=27
         #   minimal_service  => Montserrat-Regular, size=18
         #   minimal_data     => Montserrat-Regular, size=5
-        self.font_volume  = display_manager.fonts.get('minimal_volume', ImageFont.load_default())
-        self.font_service = display_manager.fonts.get('minimal_service', ImageFont.load_default())
-        self.font_data    = display_manager.fonts.get('minimal_data', ImageFont.load_default())
+        self.font_volume  = display_manager.fonts.get('minimal_volume')
+        self.font_service = display_manager.fonts.get('minimal_service')
+        self.font_data    = display_manager.fonts.get('minimal_data')
+
+        # Larger variant of the data font for the duration text (shared via the font registry)
+        self.font_duration = display_manager.fonts.variant('minimal_data', delta=3)
 
-        # State & threading
+        # State (rendered by display_manager.scheduler while active)
         self.latest_state  = None
         self.current_state = None
         self.state_lock    = threading.Lock()
-        self.update_event  = threading.Event()
-        self.stop_event    = threading.Event()
         self.is_active     = False
-
-        # Initialize a variable to track the last update time for progress simulation
-        self.last_update_time = time.time()
-
-        # Display update thread
-        self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-        self.update_thread.start()
-        self.logger.info("MinimalScreen: Started background update thread.")
+        self.last_visible_key = None  # inputs of the frame on screen
 
         # Connect Volumio state listener
         if self.volumio_listener:
@@ -65,31 +63,44 @@ class MinimalScreen(BaseManager):
             if "volume" in state:
                 self.current_volume = state["volume"]
             self.latest_state = state
-        self.update_event.set()
+        self.display_manager.scheduler.request_tick(self)
 
     # ------------------------------------------------------------------
-    #   Background Update Loop
+    #   Render Tick
     # ------------------------------------------------------------------
-    def update_display_loop(self):
+    def render_tick(self):
+        """
+        Called by the display's RenderScheduler while active; picks up a new
+        state, and redraws only when the time (projected by the shared
+        PlaybackClock), progress circle, volume or service would look different.
+        """
+        with self.state_lock:
+            if self.latest_state:
+                self.current_state = self.latest_state.copy()
+                self.latest_state = None
+        if self.is_active and self.mode_manager.get_mode() == 'minimal' and self.current_state:
+            key = self.visible_key(self.current_state)
+            if key == self.last_visible_key:
+                return
+            self.draw_display(self.current_state)
+            self.last_visible_key = key
+
+    def visible_key(self, state):
         """
-        Runs in the background, waits on update_event or times out,
-        and simulates progress update so the duration circle refreshes.
+        What the next frame would show: displayed m:ss, the progress arc (to
+        the degree), volume, service and sample text. Equal keys mean an
+        identical frame.
         """
-        while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
-            with self.state_lock:
-                if triggered and self.latest_state:
-                    self.current_state = self.latest_state.copy()
-                    self.latest_state = None
-                    self.last_update_time = time.time()
-                    self.update_event.clear()
-                elif self.current_state and "seek" in self.current_state and "duration" in self.current_state:
-                    # Simulate progress based on elapsed time
-                    elapsed = time.time() - self.last_update_time
-                    self.current_state["seek"] = self.current_state.get("seek", 0) + int(elapsed * 1000)
-                    self.last_update_time = time.time()
-            if self.is_active and self.mode_manager.get_mode() == 'minimal' and self.current_state:
-                self.draw_display(self.current_state)
+        seek_s = max(0, self.playback_seek_ms(state) / 1000)
+        duration_s = state.get("duration", 1)
+        progress = max(0.0, min(seek_s / duration_s, 1.0)) if duration_s else 0.0
+        return (
+            f"{int(seek_s // 60)}:{int(seek_s % 60):02d}",
+            int(progress * 360),
+            state.get("volume", 0),
+            state.get("service"), state.get("trackType"),
+            state.get("samplerate"), state.get("bitdepth"),
+        )
 
     # ------------------------------------------------------------------
     #   Start / Stop
@@ -103,21 +114,16 @@ class MinimalScreen(BaseManager):
             return
 
         self.is_active = True
+        self.last_visible_key = None
 
-        # Force immediate getState (optional) so we’re not waiting on pushState
-        try:
-            if self.volumio_listener and self.volumio_listener.socketIO:
-                self.logger.debug("MinimalScreen: Forcing getState from Volumio.")
-                self.volumio_listener.socketIO.emit("getState", {})
-        except Exception as e:
-            self.logger.warning(f"MinimalScreen: Failed to emit 'getState'. Error => {e}")
+        # Draw from the state we already have (getState only if there is none yet)
+        if self.volumio_listener:
+            state = self.volumio_listener.get_or_request_state()
+            if state:
+                self.on_volumio_state_change(self.volumio_listener, state)
 
-        # If update_thread is dead, restart it
-        if not self.update_thread.is_alive():
-            self.stop_event.clear()
-            self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-            self.update_thread.start()
-            self.logger.debug("MinimalScreen: display update thread restarted.")
+        # Let the render scheduler tick us
+        self.display_manager.scheduler.activate(self, self.render_fps)
 
     def stop_mode(self):
         """
@@ -128,12 +134,7 @@ class MinimalScreen(BaseManager):
             return
 
         self.is_active = False
-        self.stop_event.set()
-        self.update_event.set()
-
-        if self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
-            self.logger.debug("MinimalScreen: display update thread stopped.")
+        self.display_manager.scheduler.deactivate(self)
 
         self.display_manager.clear_screen()
         self.logger.info("MinimalScreen: Stopped mode and cleared screen.")
@@ -170,8 +171,8 @@ class MinimalScreen(BaseManager):
         - Bottom-right: circular progress indicator with larger duration text.
         """
         # Create base image at target resolution
-        base_image = Image.new("RGB", self.display_manager.oled.size, "black")
-        draw = ImageDraw.Draw(base_image)
+        base_image = self.display_manager.acquire_canvas()
+        draw = self.display_manager.get_draw(base_image)
         width, height = self.display_manager.oled.size
 
         # ------------------------------------------------------------------
@@ -220,7 +221,7 @@ class MinimalScreen(BaseManager):
         # 4) Draw anti-aliased round progress indicator in bottom-right
         # ------------------------------------------------------------------
         # Retrieve playback position and duration
-        seek_ms = state.get("seek", 0)
+        seek_ms = self.playback_seek_ms(state)
         duration_s = state.get("duration", 1)  # Avoid division by zero
         seek_s = max(0, seek_ms / 1000)
         progress = max(0.0, min(seek_s / duration_s, 1.0))
@@ -262,12 +263,8 @@ class MinimalScreen(BaseManager):
         cur_min = int(seek_s // 60)
         cur_sec = int(seek_s % 60)
         current_time = f"{cur_min}:{cur_sec:02d}"
-        # Attempt to create a larger variant of the duration font.
-        try:
-            duration_font = self.font_data.font_variant(size=self.font_data.size + 3)
-        except Exception:
-            duration_font = self.font_data
-        text_w, text_h = duration_font.getsize(current_time)
+        duration_font = self.font_duration
+        text_w, text_h = self.display_manager.text_size(duration_font, current_time)
         text_x = circle_x + (circle_radius * 2 - text_w) // 2
         text_y = circle_y + (circle_radius * 2 - text_h) // 2
         draw.text((text_x, text_y), current_time, font=duration_font, fill="white")
@@ -275,7 +272,7 @@ class MinimalScreen(BaseManager):
         # ------------------------------------------------------------------
         # 6) Display the final image
         # ------------------------------------------------------------------
-        self.display_manager.oled.display(base_image)
+        self.display_manager.show(base_image)
         self.logger.debug("MinimalScreen: Display updated with minimal UI including updated progress indicator.")
 
     def display_playback_info(self):
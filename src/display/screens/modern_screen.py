@@ -7,6 +7,8 @@ import threading
 import time
 from PIL import Image, ImageDraw, ImageFont, ImageSequence
 from managers.menus.base_manager import BaseManager
+from display.compositor import LayerCompositor
+from display.marquee import Marquee
 
 FIFO_PATH = "/tmp/display.fifo"  # Path to the FIFO for CAVA data
 
@@ -20,6 +22,13 @@ class ModernScreen(BaseManager):
       - Service icon (Tidal, Qobuz, etc.)
     """
 
+    # Ticks per second while active (scrolling text, spectrum, progress);
+    # a tick only redraws when something visible changed
+    render_fps = 20
+
+    # Progress bar width as a fraction of the screen width
+    progress_ratio = 0.7
+
     def __init__(self, display_manager, volumio_listener, mode_manager):
         super().__init__(display_manager, volumio_listener, mode_manager)
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -32,33 +41,34 @@ class ModernScreen(BaseManager):
         self.running_spectrum = False
         self.spectrum_thread  = None
         self.spectrum_bars    = []
+        self.spectrum_frame   = 0  # bumped whenever the bars change
 
         # Font references
-        self.font_title    = display_manager.fonts.get('song_font', ImageFont.load_default())
-        self.font_artist   = display_manager.fonts.get('artist_font', ImageFont.load_default())
-        self.font_info     = display_manager.fonts.get('data_font',   ImageFont.load_default())
-        self.font_progress = display_manager.fonts.get('progress_bar',ImageFont.load_default())
+        self.font_title    = display_manager.fonts.get('song_font')
+        self.font_artist   = display_manager.fonts.get('artist_font')
+        self.font_info     = display_manager.fonts.get('data_font')
+        self.font_progress = display_manager.fonts.get('progress_bar')
 
         # Scrolling
         self.scroll_offset_title  = 0
         self.scroll_offset_artist = 0
-        self.scroll_speed         = 2  # Adjust for faster or slower horizontal scrolling
+        self.scroll_speed         = 20  # Pixels per second, independent of render_fps; adjust for faster or slower scrolling
+        self.scroll_watch         = display_manager.animation_clock.stopwatch()
+        self.marquees             = {}  # (text, font) => pre-rendered Marquee strip
 
-        # State & threads
+        # State (rendered by display_manager.scheduler while active)
         self.latest_state    = None
         self.current_state   = None
         self.state_lock      = threading.Lock()
-        self.update_event    = threading.Event()
-        self.stop_event      = threading.Event()
         self.is_active       = False
+        self.last_visible_key = None  # inputs of the frame on screen
 
         # Keep track of the last-known service so if we pause/stop, we can still show the same icon
         self.previous_service = None
 
-        # Display update thread
-        self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-        self.update_thread.start()
-        self.logger.info("ModernScreen: Started background update thread.")
+        # Static parts of the frame are cached and only redrawn when they change
+        self.compositor = LayerCompositor(display_manager.oled.size, display_manager.oled.mode,
+                                          draw_factory=display_manager.get_draw)
 
         # Connect to Volumio listener
         if self.volumio_listener:
@@ -83,36 +93,33 @@ class ModernScreen(BaseManager):
         self.logger.debug(f"ModernScreen: state changed => {state}")
         with self.state_lock:
             self.latest_state = state
-        self.update_event.set()
+        self.display_manager.scheduler.request_tick(self)
 
     # ------------------------------------------------------------------
-    #   Background Update Loop
+    #   Render Tick
     # ------------------------------------------------------------------
-    def update_display_loop(self):
+    def render_tick(self):
         """
-        Runs in the background to handle display updates. Waits on update_event
-        or times out, so we can animate the progress bar or scrolling text.
+        Called by the display's RenderScheduler at render_fps while active,
+        and straight away when a new state arrives. Picks up the latest state,
+        advances the scrolling text and redraws only if that (or the playback
+        position, see playback_seek_ms) changed something on screen.
         """
-        last_update_time = time.time()
-        while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
-            with self.state_lock:
-                if triggered and self.latest_state:
-                    # We got a new state from Volumio
-                    self.current_state = self.latest_state.copy()
-                    self.latest_state  = None
-                    self.update_event.clear()
-                    last_update_time = time.time()
-                elif self.current_state and "seek" in self.current_state and "duration" in self.current_state:
-                    # If we have a playing track, let's simulate progress
-                    elapsed = time.time() - last_update_time
-                    self.current_state["seek"] = self.current_state.get("seek", 0) + int(elapsed * 1000)
-                    last_update_time = time.time()
-
-            # If active & mode == 'modern' and we have a current state, let's draw
-            if self.is_active and self.mode_manager.get_mode() == 'modern' and self.current_state:
-                self.logger.debug("ModernScreen: drawing updated display.")
-                self.draw_display(self.current_state)
+        with self.state_lock:
+            if self.latest_state:
+                # We got a new state from Volumio
+                self.current_state = self.latest_state.copy()
+                self.latest_state  = None
+
+        # If active & mode == 'modern' and we have a current state, let's draw
+        if self.is_active and self.mode_manager.get_mode() == 'modern' and self.current_state:
+            self.advance_scroll(self.current_state)
+            key = self.visible_key(self.current_state)
+            if key == self.last_visible_key:
+                return
+            self.logger.debug("ModernScreen: drawing updated display.")
+            self.draw_display(self.current_state)
+            self.last_visible_key = key
 
     # ------------------------------------------------------------------
     #   Start/Stop
@@ -126,15 +133,14 @@ class ModernScreen(BaseManager):
             return
 
         self.is_active = True
+        self.last_visible_key = None
         self.reset_scrolling()
 
-        # 1) Force an immediate getState
-        try:
-            if self.volumio_listener and self.volumio_listener.socketIO:
-                self.logger.debug("ModernScreen: Forcing getState from Volumio.")
-                self.volumio_listener.socketIO.emit("getState", {})
-        except Exception as e:
-            self.logger.warning(f"ModernScreen: Failed to emit 'getState'. Error => {e}")
+        # 1) Draw from the state we already have (getState only if there is none yet)
+        if self.volumio_listener:
+            state = self.volumio_listener.get_or_request_state()
+            if state:
+                self.on_volumio_state_change(self.volumio_listener, state)
 
         # 2) Start the spectrum reading thread if not already running
         if not self.spectrum_thread or not self.spectrum_thread.is_alive():
@@ -143,12 +149,8 @@ class ModernScreen(BaseManager):
             self.spectrum_thread.start()
             self.logger.info("ModernScreen: Spectrum reading thread started.")
 
-        # 3) If the update_thread is not alive, restart it
-        if not self.update_thread.is_alive():
-            self.stop_event.clear()
-            self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-            self.update_thread.start()
-            self.logger.debug("ModernScreen: display update thread restarted.")
+        # 3) Let the render scheduler tick us
+        self.display_manager.scheduler.activate(self, self.render_fps)
 
 
     def stop_mode(self):
@@ -160,8 +162,7 @@ class ModernScreen(BaseManager):
             return
 
         self.is_active = False
-        self.stop_event.set()
-        self.update_event.set()
+        self.display_manager.scheduler.deactivate(self)
 
         # Stop spectrum thread
         self.running_spectrum = False
@@ -169,11 +170,6 @@ class ModernScreen(BaseManager):
             self.spectrum_thread.join(timeout=1)
             self.logger.info("ModernScreen: Spectrum thread stopped.")
 
-        # Stop update thread
-        if self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
-            self.logger.debug("ModernScreen: display update thread stopped.")
-
         self.display_manager.clear_screen()
         self.logger.info("ModernScreen: Stopped mode and cleared screen.")
 
@@ -196,7 +192,9 @@ class ModernScreen(BaseManager):
                     line = fifo.readline().strip()
                     if line:
                         bars = [int(x) for x in line.split(";") if x.isdigit()]
-                        self.spectrum_bars = bars
+                        if bars != self.spectrum_bars:
+                            self.spectrum_bars = bars
+                            self.spectrum_frame += 1
         except Exception as e:
             self.logger.error(f"ModernScreen: error reading FIFO => {e}")
 
@@ -208,23 +206,76 @@ class ModernScreen(BaseManager):
         self.logger.debug("ModernScreen: resetting scroll offsets.")
         self.scroll_offset_title  = 0
         self.scroll_offset_artist = 0
-
-    def update_scroll(self, text, font, max_width, scroll_offset):
+        self.scroll_watch.restart()
+
+    def get_marquee(self, text, font):
+        """Return the pre-rendered strip for a scrolling string (built once per track)."""
+        key = (text, font)
+        marquee = self.marquees.get(key)
+        if marquee is None:
+            screen_width = self.display_manager.oled.width
+            # Only artist & title scroll; drop strips from previous tracks
+            if len(self.marquees) >= 4:
+                self.marquees.clear()
+            marquee = Marquee(text, font, screen_width, start_x=screen_width // 2)
+            self.marquees[key] = marquee
+        return marquee
+
+    def text_overflows(self, text, font, max_width):
+        """True if `text` is wider than `max_width` and therefore scrolls."""
+        text_width, _ = self.display_manager.text_size(font, text)
+        return text_width > max_width
+
+    def update_scroll(self, text, font, max_width):
         """
         Basic continuous scrolling logic:
           - If text fits in max_width => no scroll
-          - Else increment scroll_offset => wrap around
+          - Else the offset is scroll_speed x time since reset_scrolling(),
+            wrapped around with a gap by the marquee, so the text moves at
+            the same speed however often we get to draw it
         """
-        text_width, _ = font.getsize(text)
+        text_width, _ = self.display_manager.text_size(font, text)
         if text_width <= max_width:
             return text, 0, False
 
-        scroll_offset += self.scroll_speed
-        if scroll_offset > text_width:
-            scroll_offset = 0
-
+        distance = int(self.scroll_watch.elapsed() * self.scroll_speed)
+        scroll_offset = self.get_marquee(text, font).wrap(distance)
         return text, scroll_offset, True
 
+    def advance_scroll(self, data):
+        """Bring the artist/title marquee offsets up to date (once per render tick)."""
+        max_text_width = self.display_manager.oled.width - 10
+        _, self.scroll_offset_artist, _ = self.update_scroll(
+            data.get("artist", "Unknown Artist"), self.font_artist, max_text_width
+        )
+        _, self.scroll_offset_title, _ = self.update_scroll(
+            data.get("title", "Unknown Title"), self.font_title, max_text_width
+        )
+
+    def visible_key(self, data):
+        """
+        Everything the next frame would show, reduced to what is visible:
+        the displayed m:ss, the progress indicator's pixel, scroll offsets,
+        spectrum frame, volume, service and the track text. Two equal keys
+        mean identical frames, so render_tick can skip the redraw.
+        """
+        seek_s = max(0, self.playback_seek_ms(data) / 1000)
+        duration_s = data.get("duration", 1)
+        progress = max(0.0, min(seek_s / duration_s, 1.0)) if duration_s else 0.0
+        progress_width = int(self.display_manager.oled.width * self.progress_ratio)
+
+        spectrum_enabled = self.running_spectrum and self.mode_manager.config.get("cava_enabled", False)
+        return (
+            f"{int(seek_s // 60)}:{int(seek_s % 60):02d}",
+            int(progress_width * progress),
+            self.scroll_offset_artist, self.scroll_offset_title,
+            self.spectrum_frame if spectrum_enabled else None,
+            data.get("volume", 50),
+            data.get("service"), data.get("trackType"), data.get("status"),
+            data.get("title"), data.get("artist"),
+            data.get("samplerate"), data.get("bitdepth"), duration_s,
+        )
+
     def adjust_volume(self, volume_change):
         """
         Adjust volume from an external call (e.g. rotary). This
@@ -264,10 +315,11 @@ class ModernScreen(BaseManager):
         - Progress bar
         - Volume & track info
         - Smaller service icon at bottom-right, near total duration
-        """
-        base_image = Image.new("RGB", self.display_manager.oled.size, "black")
-        draw = ImageDraw.Draw(base_image)
 
+        Everything that only changes with track/service/volume goes into the
+        compositor's cached static layer; per frame we only draw the spectrum,
+        scrolling text and progress, and blend the static layer over them.
+        """
         # Check if spectrum is actually enabled (both thread running & config set)
         spectrum_enabled = (
             self.running_spectrum and
@@ -292,16 +344,11 @@ class ModernScreen(BaseManager):
             self.previous_service = service or self.previous_service or "default"
 
         #
-        # 2) Draw the spectrum (if enabled)
-        #
-        self._draw_spectrum(draw)
-
-        #
-        # 3) Data from Volumio state
+        # 2) Data from Volumio state
         #
         song_title = data.get("title",  "Unknown Title")
         artist_name= data.get("artist", "Unknown Artist")
-        seek_ms    = data.get("seek",   0)
+        seek_ms    = self.playback_seek_ms(data)
         duration_s = data.get("duration", 1)
         samplerate = data.get("samplerate", "N/A")
         bitdepth   = data.get("bitdepth",   "N/A")
@@ -320,7 +367,7 @@ class ModernScreen(BaseManager):
         total_duration = f"{tot_min}:{tot_sec:02d}"
 
         #
-        # 4) Artist/title scrolling
+        # 3) Layout & artist/title scrolling
         #
         screen_width, screen_height = self.display_manager.oled.size
         margin        = 5
@@ -329,122 +376,123 @@ class ModernScreen(BaseManager):
         # We'll shift the TITLE and INFO text if the spectrum is OFF
         line_shift = 4 if not spectrum_enabled else 0
 
-        # Artist (no shift)
-        artist_disp, self.scroll_offset_artist, artist_scrolling = self.update_scroll(
-            artist_name, self.font_artist, max_text_width, self.scroll_offset_artist
-        )
-        if artist_scrolling:
-            artist_x = (screen_width // 2) - self.scroll_offset_artist
-        else:
-            text_w, _ = self.font_artist.getsize(artist_disp)
-            artist_x = (screen_width - text_w) // 2
-
-        artist_y = margin - 8
-        draw.text((artist_x, artist_y), artist_disp, font=self.font_artist, fill="white")
-
-        # Title (shift if no spectrum)
-        title_disp, self.scroll_offset_title, title_scrolling = self.update_scroll(
-            song_title, self.font_title, max_text_width, self.scroll_offset_title
-        )
-        if title_scrolling:
-            title_x = (screen_width // 2) - self.scroll_offset_title
-        else:
-            text_w, _ = self.font_title.getsize(title_disp)
-            title_x = (screen_width - text_w) // 2
-
-        title_y = (margin + 6) + line_shift
-        draw.text((title_x, title_y), title_disp, font=self.font_title, fill="white")
-
-        #
-        # 5) Info text: e.g. "48kHz / 16bit" (also shifted if no spectrum)
-        #
-        info_text = f"{samplerate} / {bitdepth}"
-        info_w, info_h = self.font_info.getsize(info_text)
-        info_x = (screen_width - info_w) // 2
-        info_y = (margin + 25) + line_shift
-        draw.text((info_x, info_y), info_text, font=self.font_info, fill="white")
+        # Offsets are advanced by render_tick (advance_scroll), not per draw
+        artist_disp, title_disp = artist_name, song_title
+        artist_scrolling = self.text_overflows(artist_name, self.font_artist, max_text_width)
+        title_scrolling  = self.text_overflows(song_title, self.font_title, max_text_width)
+        artist_y = margin - 8                  # Artist (no shift)
+        title_y  = (margin + 6) + line_shift   # Title (shift if no spectrum)
 
-        #
-        # 6) Progress bar + times (no shift)
-        #
-        progress_width = int(screen_width * 0.7)
+        progress_width = int(screen_width * self.progress_ratio)
         progress_x = (screen_width - progress_width) // 2
         progress_y = margin + 55
-
-        # Current time (left)
-        draw.text((progress_x - 30, progress_y - 9), current_time, 
-                font=self.font_info, fill="white")
-
-        # Total duration (right)
         dur_x = progress_x + progress_width + 12
         dur_y = progress_y - 9
-        draw.text((dur_x, dur_y), total_duration, 
-                font=self.font_info, fill="white")
-
-        # Draw main progress line
-        draw.line([progress_x, progress_y, progress_x + progress_width, progress_y],
-                fill="white", width=1)
-        # Progress indicator
-        indicator_x = progress_x + int(progress_width * progress)
-        draw.line([indicator_x, progress_y - 2, indicator_x, progress_y + 2],
-                fill="white", width=1)
 
         #
-        # 7) Volume icon & text
+        # 4) Static layer: rebuilt only when one of these changes
         #
-        volume_icon = self.display_manager.icons.get('volume', self.display_manager.default_icon)
-        if volume_icon:
-            volume_icon = volume_icon.resize((10, 10), Image.LANCZOS)
-        vol_icon_x = progress_x - 30
-        vol_icon_y = progress_y - 22
-        base_image.paste(volume_icon, (vol_icon_x, vol_icon_y))
+        static_key = (
+            service, line_shift, samplerate, bitdepth, total_duration, volume,
+            None if artist_scrolling else artist_disp,
+            None if title_scrolling else title_disp,
+        )
 
-        vol_text_x  = vol_icon_x + 12
-        vol_text_y  = vol_icon_y - 2
-        draw.text((vol_text_x, vol_text_y), str(volume), font=self.font_info, fill="white")
+        def draw_static(draw, layer):
+            # Centred (non-scrolling) artist/title never move
+            if not artist_scrolling:
+                text_w, _ = self.display_manager.text_size(self.font_artist, artist_disp)
+                draw.text(((screen_width - text_w) // 2, artist_y), artist_disp,
+                          font=self.font_artist, fill="white")
+            if not title_scrolling:
+                text_w, _ = self.display_manager.text_size(self.font_title, title_disp)
+                draw.text(((screen_width - text_w) // 2, title_y), title_disp,
+                          font=self.font_title, fill="white")
+
+            # Info text: e.g. "48kHz / 16bit" (also shifted if no spectrum)
+            info_text = f"{samplerate} / {bitdepth}"
+            info_w, info_h = self.display_manager.text_size(self.font_info, info_text)
+            info_x = (screen_width - info_w) // 2
+            info_y = (margin + 25) + line_shift
+            draw.text((info_x, info_y), info_text, font=self.font_info, fill="white")
+
+            # Total duration (right)
+            draw.text((dur_x, dur_y), total_duration,
+                    font=self.font_info, fill="white")
+
+            # Draw main progress line
+            draw.line([progress_x, progress_y, progress_x + progress_width, progress_y],
+                    fill="white", width=1)
+
+            # Volume icon & text
+            volume_icon = self.display_manager.get_icon('volume', (10, 10))
+            vol_icon_x = progress_x - 30
+            vol_icon_y = progress_y - 22
+            layer.paste(volume_icon, (vol_icon_x, vol_icon_y))
+
+            vol_text_x  = vol_icon_x + 12
+            vol_text_y  = vol_icon_y - 2
+            draw.text((vol_text_x, vol_text_y), str(volume), font=self.font_info, fill="white")
+
+            # Place a smaller service icon near total_duration
+            if self.display_manager.icons.get(service):
+                # Flattened & resized once by DisplayManager
+                icon = self.display_manager.get_icon(service, (20, 20))
+
+                # Measure total_duration text so we can figure out where to place the icon
+                dur_text_w, dur_text_h = draw.textsize(total_duration, font=self.font_info)
+
+                # Example offsets
+                manual_offset_x = -20
+                manual_offset_y = -20
+
+                icon_x = dur_x + dur_text_w + manual_offset_x
+                icon_y = dur_y + manual_offset_y
+                layer.paste(icon, (icon_x, icon_y))
+
+                self.logger.debug(
+                    f"ModernScreen: Pasted service icon '{service}' at ({icon_x}, {icon_y})."
+                )
+            else:
+                self.logger.debug(f"ModernScreen: No icon found for service='{service}' => skipping icon.")
 
         #
-        # 8) Place a smaller service icon near total_duration
+        # 5) Dynamic layer: scrolling text, elapsed time, progress indicator
         #
-        icon = self.display_manager.icons.get(service)
-        if icon:
-            # Flatten alpha if needed
-            if icon.mode == "RGBA":
-                bg = Image.new("RGB", icon.size, (0, 0, 0))
-                bg.paste(icon, mask=icon.split()[3])
-                icon = bg
-
-            # Resize the icon
-            icon = icon.resize((20, 20), Image.LANCZOS)
-
-            # Measure total_duration text so we can figure out where to place the icon
-            dur_text_w, dur_text_h = draw.textsize(total_duration, font=self.font_info)
-
-            # Example offsets
-            manual_offset_x = -20
-            manual_offset_y = -20
-
-            icon_x = dur_x + dur_text_w + manual_offset_x
-            icon_y = dur_y + manual_offset_y
-            base_image.paste(icon, (icon_x, icon_y))
-
-            self.logger.debug(
-                f"ModernScreen: Pasted service icon '{service}' at ({icon_x}, {icon_y})."
-            )
-        else:
-            self.logger.debug(f"ModernScreen: No icon found for service='{service}' => skipping icon.")
+        def draw_dynamic(draw, image):
+            # Scrolling text is just a window cut from its pre-rendered strip
+            if artist_scrolling:
+                self.get_marquee(artist_disp, self.font_artist).draw(
+                    image, 0, artist_y, self.scroll_offset_artist)
+            if title_scrolling:
+                self.get_marquee(title_disp, self.font_title).draw(
+                    image, 0, title_y, self.scroll_offset_title)
+
+            # Current time (left)
+            draw.text((progress_x - 30, progress_y - 9), current_time,
+                    font=self.font_info, fill="white")
+
+            # Progress indicator
+            indicator_x = progress_x + int(progress_width * progress)
+            draw.line([indicator_x, progress_y - 2, indicator_x, progress_y + 2],
+                    fill="white", width=1)
+
+        # Both sit under the static layer so icons still cover scrolling text as before
+        under = [self._draw_spectrum, draw_dynamic] if spectrum_enabled else [draw_dynamic]
+        base_image = self.compositor.compose(static_key, draw_static, under=under)
 
         #
         # Finally, display
         #
-        self.display_manager.oled.display(base_image)
+        self.display_manager.show(base_image)
         self.logger.debug("ModernScreen: Display updated with 'modern' playback UI.")
 
 
-    def _draw_spectrum(self, draw):
+    def _draw_spectrum(self, draw, image=None):
         """
         Draw vertical bar spectrum from self.spectrum_bars, 
         or a blank region if the user disabled CAVA.
+        Used as the compositor's "under" layer, behind the static layer.
         """
         width, height = self.display_manager.oled.size
         bar_region_height = height // 2
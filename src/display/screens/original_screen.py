@@ -15,6 +15,9 @@ class OriginalScreen(BaseManager):
     classic FM4-like screen).
     """
 
+    # Event-driven: only redrawn when a new state arrives
+    render_fps = 0
+
     def __init__(self, display_manager, volumio_listener, mode_manager):
         super().__init__(display_manager, volumio_listener, mode_manager)
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -25,18 +28,11 @@ class OriginalScreen(BaseManager):
 
         self.previous_service = None
 
-        # Thread-safe state handling
+        # Thread-safe state handling (rendered by display_manager.scheduler)
         self.latest_state = None
         self.state_lock = threading.Lock()
-        self.update_event = threading.Event()
-        self.stop_event = threading.Event()
         self.is_active = False
 
-        # Background update thread
-        self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-        self.update_thread.start()
-        self.logger.info("OriginalScreen: Started background update thread.")
-
         # Register a callback for Volumio state changes
         if self.volumio_listener:
             self.volumio_listener.state_changed.connect(self.on_volumio_state_change)
@@ -73,36 +69,32 @@ class OriginalScreen(BaseManager):
         self.logger.debug(f"OriginalScreen: Received volumio state => {state}")
         with self.state_lock:
             self.latest_state = state
-        self.update_event.set()
+        self.display_manager.scheduler.request_tick(self)
 
     # ------------------------------------------------------------------
-    #   Background Update Thread
+    #   Render Tick
     # ------------------------------------------------------------------
-    def update_display_loop(self):
+    def render_tick(self):
         """
-        Repeatedly waits for the update_event or times out. If signaled,
-        draws the updated display if active & mode == 'original'.
+        Called by the display's RenderScheduler when a new state has been
+        queued. Draws it if active & mode == 'original'.
         """
-        while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
-            if triggered:
-                with self.state_lock:
-                    state_to_process = self.latest_state
-                    self.latest_state = None
-                self.update_event.clear()
-
-                if self.is_active and self.mode_manager.get_mode() == 'original':
-                    if state_to_process:
-                        if self.mode_manager.is_state_change_suppressed():
-                            self.logger.debug(
-                                "OriginalScreen: State change suppressed during update loop."
-                            )
-                            continue
-                        self.draw_display(state_to_process)
-                else:
+        with self.state_lock:
+            state_to_process = self.latest_state
+            self.latest_state = None
+
+        if self.is_active and self.mode_manager.get_mode() == 'original':
+            if state_to_process:
+                if self.mode_manager.is_state_change_suppressed():
                     self.logger.debug(
-                        "OriginalScreen: No update => either not active or mode != 'original'."
+                        "OriginalScreen: State change suppressed during render tick."
                     )
+                    return
+                self.draw_display(state_to_process)
+        else:
+            self.logger.debug(
+                "OriginalScreen: No update => either not active or mode != 'original'."
+            )
 
     # ------------------------------------------------------------------
     #   Start/Stop Mode
@@ -121,20 +113,15 @@ class OriginalScreen(BaseManager):
         self.is_active = True
         self.logger.info("OriginalScreen: Activated 'original' screen mode.")
 
-        # 1) Force an immediate getState from Volumio
-        try:
-            if self.volumio_listener and self.volumio_listener.socketIO:
-                self.logger.debug("OriginalScreen: Forcing getState from Volumio.")
-                self.volumio_listener.socketIO.emit("getState", {})
-        except Exception as e:
-            self.logger.warning(f"OriginalScreen: Failed to emit 'getState'. => {e}")
-
-        # 2) Display current Volumio state if available
-        current_state = self.volumio_listener.get_current_state()
+        # Queue the current Volumio state and let the scheduler draw it
+        # (the listener only sends getState if it has none yet)
+        current_state = self.volumio_listener.get_or_request_state()
         if current_state:
-            self.draw_display(current_state)
+            with self.state_lock:
+                self.latest_state = current_state
         else:
             self.logger.warning("OriginalScreen: No current Volumio state to display.")
+        self.display_manager.scheduler.activate(self, self.render_fps)
 
 
     def stop_mode(self):
@@ -147,16 +134,7 @@ class OriginalScreen(BaseManager):
             return
 
         self.is_active = False
-        self.stop_event.set()
-        self.update_event.set()  # Unblock the thread if it's waiting
-
-        try:
-            if self.update_thread.is_alive():
-                self.update_thread.join(timeout=1)
-                if self.update_thread.is_alive():
-                    self.logger.warning("OriginalScreen: Timed out stopping update thread.")
-        except Exception as e:
-            self.logger.error(f"OriginalScreen: Error stopping update thread => {e}")
+        self.display_manager.scheduler.deactivate(self)
 
         self.display_manager.clear_screen()
         self.logger.info("OriginalScreen: Stopped and cleared display.")
@@ -193,8 +171,8 @@ class OriginalScreen(BaseManager):
             self.previous_service = service or self.previous_service or "default"
 
         # Create new image & draw object
-        base_image = Image.new("RGB", self.display_manager.oled.size, "black")
-        draw = ImageDraw.Draw(base_image)
+        base_image = self.display_manager.acquire_canvas()
+        draw = self.display_manager.get_draw(base_image)
 
         # Volume bars
         volume = max(0, min(int(data.get("volume", 0)), 100))
@@ -213,7 +191,7 @@ class OriginalScreen(BaseManager):
         self._draw_more_info(draw, base_image, data, service)
 
         # Finally update display
-        self.display_manager.oled.display(base_image)
+        self.display_manager.show(base_image)
         self.logger.info("OriginalScreen: Display updated.")
 
     def _draw_more_info(self, draw, base_image, data, service):
@@ -247,9 +225,9 @@ class OriginalScreen(BaseManager):
             sample_unit = "kHz"  # fallback if we can't parse
 
         # Load any fonts
-        sample_val_font  = self.display_manager.fonts.get('sample_rate', ImageFont.load_default())
-        sample_unit_font = self.display_manager.fonts.get('sample_rate_khz', ImageFont.load_default())
-        font_info        = self.display_manager.fonts.get('radio_bitrate', ImageFont.load_default())
+        sample_val_font  = self.display_manager.fonts.get('sample_rate')
+        sample_unit_font = self.display_manager.fonts.get('sample_rate_khz')
+        font_info        = self.display_manager.fonts.get('radio_bitrate')
 
         # Define X position for sample rate
         sample_right_x = self.display_manager.oled.width - 70
@@ -363,10 +341,9 @@ class OriginalScreen(BaseManager):
         Show a brief error message on the screen.
         """
         with self.display_manager.lock:
-            img = Image.new("RGB", self.display_manager.oled.size, "black")
-            draw = ImageDraw.Draw(img)
-            from PIL import ImageFont
-            font = self.display_manager.fonts.get('error_font', ImageFont.load_default())
+            img = self.display_manager.acquire_canvas()
+            draw = self.display_manager.get_draw(img)
+            font = self.display_manager.fonts.get('error_font')
 
             title_w, _ = draw.textsize(title, font=font)
             title_x = (self.display_manager.oled.width - title_w) // 2
@@ -378,8 +355,7 @@ class OriginalScreen(BaseManager):
             msg_y = title_y + 20
             draw.text((msg_x, msg_y), message, font=font, fill="white")
 
-            final_img = img.convert(self.display_manager.oled.mode)
-            self.display_manager.oled.display(final_img)
+            self.display_manager.show(img)
             self.logger.info(f"Displayed error => {title}: {message}")
             time.sleep(2)
             # Optionally redraw the normal display or just leave it cleared.
@@ -1,5 +1,4 @@
 
-import threading
 import time
 import logging
 import psutil
@@ -20,14 +19,15 @@ class SystemInfoScreen(BaseManager):
         CPU: 12.3%   MEM: 45%   WIFI: 78.9%   CPU temp: 39c
     """
 
+    # Refresh every 3 seconds while active
+    render_fps = 1 / 3
+
     def __init__(self, display_manager, volumio_listener, mode_manager):
         super().__init__(display_manager, volumio_listener, mode_manager)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.DEBUG)
 
         self.is_active = False
-        self.stop_event = threading.Event()
-        self.update_thread = None
 
         # Choose fonts/spacing to your taste:
         self.title_font_key = "menu_font_bold"       # e.g. a larger font for title
@@ -44,11 +44,9 @@ class SystemInfoScreen(BaseManager):
             return
         self.is_active = True
         self.logger.info("SystemInfoScreen: Starting system info display.")
-        self.stop_event.clear()
 
-        # Start the background thread that updates and draws
-        self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
-        self.update_thread.start()
+        # Let the render scheduler tick us
+        self.display_manager.scheduler.activate(self, self.render_fps)
 
     def stop_mode(self):
         if not self.is_active:
@@ -57,29 +55,21 @@ class SystemInfoScreen(BaseManager):
         self.is_active = False
         self.logger.info("SystemInfoScreen: Stopping system info display.")
 
-        self.stop_event.set()
-        if self.update_thread:
-            self.update_thread.join(timeout=1)
-            self.update_thread = None
-
+        self.display_manager.scheduler.deactivate(self)
         self.display_manager.clear_screen()
 
-    def _update_loop(self):
-        """Background loop: gather data -> draw -> sleep -> repeat."""
-        while not self.stop_event.is_set():
-            # 1) Gather system data
-            cpu_usage = psutil.cpu_percent(interval=None)  # e.g. 12.3
-            mem_info  = psutil.virtual_memory()            # e.g. total, used, percent
-            mem_usage = mem_info.percent                   # e.g. 45.6
-            cpu_temp  = self._get_cpu_temp()               # e.g. 39
-            wifi_signal = self._get_wifi_signal()          # e.g. 78.9 or None
-            ip_list   = self._get_ip_addresses()           # e.g. ["192.168.0.142"]
-
-            # 2) Draw the layout
-            self._draw_screen(cpu_usage, mem_usage, cpu_temp, wifi_signal, ip_list)
+    def render_tick(self):
+        """Called by the display's RenderScheduler every 3 seconds: gather data -> draw."""
+        # 1) Gather system data
+        cpu_usage = psutil.cpu_percent(interval=None)  # e.g. 12.3
+        mem_info  = psutil.virtual_memory()            # e.g. total, used, percent
+        mem_usage = mem_info.percent                   # e.g. 45.6
+        cpu_temp  = self._get_cpu_temp()               # e.g. 39
+        wifi_signal = self._get_wifi_signal()          # e.g. 78.9 or None
+        ip_list   = self._get_ip_addresses()           # e.g. ["192.168.0.142"]
 
-            # 3) Sleep for 3 seconds (or whatever interval you prefer)
-            time.sleep(3)
+        # 2) Draw the layout
+        self._draw_screen(cpu_usage, mem_usage, cpu_temp, wifi_signal, ip_list)
 
     def _draw_screen(self, cpu_usage, mem_usage, cpu_temp, wifi_signal, ip_list):
         """Render the 'System Information' layout shown in your mockup."""
@@ -87,16 +77,13 @@ class SystemInfoScreen(BaseManager):
         h = self.display_manager.oled.height
 
         # 1) Create black image
-        img  = Image.new("RGB", (w, h), "black")
-        draw = ImageDraw.Draw(img)
+        img  = self.display_manager.acquire_canvas()
+        draw = self.display_manager.get_draw(img)
 
         # 2) Load some fonts (fallback to default if not found):
-        title_font = self.display_manager.fonts.get(self.title_font_key) \
-                     or ImageFont.load_default()
-        info_font  = self.display_manager.fonts.get(self.info_font_key) \
-                     or ImageFont.load_default()
-        stats_font = self.display_manager.fonts.get(self.stats_font_key) \
-                     or ImageFont.load_default()
+        title_font = self.display_manager.fonts.get(self.title_font_key)
+        info_font  = self.display_manager.fonts.get(self.info_font_key)
+        stats_font = self.display_manager.fonts.get(self.stats_font_key)
 
         # 3) Title: "System Information" (centered at top)
         title_text = "System Information"
@@ -146,8 +133,7 @@ class SystemInfoScreen(BaseManager):
         self._draw_centered(draw, stats_line, stats_font, y_cursor, w)
 
         # 6) Finally, push image to OLED
-        final_img = img.convert(self.display_manager.oled.mode)
-        self.display_manager.oled.display(final_img)
+        self.display_manager.show(img)
 
     def _draw_centered(self, draw, text, font, y_pos, screen_width):
         """
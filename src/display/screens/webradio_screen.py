@@ -5,6 +5,7 @@ import threading
 import time
 import requests
 from io import BytesIO
+from display.compositor import LayerCompositor
 
 class WebRadioScreen:
     """
@@ -17,6 +18,9 @@ class WebRadioScreen:
     Additionally, if album art is available it is pasted in the upper-right corner.
     """
 
+    # Event-driven: only redrawn when a new state arrives
+    render_fps = 0
+
     def __init__(self, display_manager, volumio_listener, mode_manager):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.DEBUG)
@@ -30,18 +34,15 @@ class WebRadioScreen:
         self.latest_state = None
         self.current_state = None
         self.state_lock = threading.Lock()
-        self.update_event = threading.Event()
-        self.stop_event = threading.Event()
 
         # Fonts (ensure these exist in display_manager.fonts or use fallback)
-        self.font_title = display_manager.fonts.get('radio_title', ImageFont.load_default())
-        self.font_label = display_manager.fonts.get('radio_bitrate', ImageFont.load_default())
-        self.font_small = display_manager.fonts.get('radio_small', ImageFont.load_default())
+        self.font_title = display_manager.fonts.get('radio_title')
+        self.font_label = display_manager.fonts.get('radio_bitrate')
+        self.font_small = display_manager.fonts.get('radio_small')
 
-        # Display update thread
-        self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-        self.update_thread.start()
-        self.logger.info("WebRadioScreen: Started background update thread.")
+        # The whole layout is static between state changes; cache it
+        self.compositor = LayerCompositor(display_manager.oled.size, display_manager.oled.mode,
+                                          draw_factory=display_manager.get_draw)
 
         # Connect to Volumio listener
         if self.volumio_listener:
@@ -71,24 +72,22 @@ class WebRadioScreen:
         self.logger.debug(f"WebRadioScreen: state changed => {state}")
         with self.state_lock:
             self.latest_state = state
-        self.update_event.set()
+        self.display_manager.scheduler.request_tick(self)
 
     # ------------------------------------------------------------------
-    # Background Update Loop
+    # Render Tick
     # ------------------------------------------------------------------
-    def update_display_loop(self):
+    def render_tick(self):
         """
-        Wait for updates (or timeout periodically) and then refresh the display.
+        Called by the display's RenderScheduler on start and whenever a new
+        state is queued; refreshes the display.
         """
-        while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
-            with self.state_lock:
-                if triggered and self.latest_state:
-                    self.current_state = self.latest_state.copy()
-                    self.latest_state = None
-                    self.update_event.clear()
-            if self.is_active and self.mode_manager.get_mode() == 'webradio' and self.current_state:
-                self.draw_display(self.current_state)
+        with self.state_lock:
+            if self.latest_state:
+                self.current_state = self.latest_state.copy()
+                self.latest_state = None
+        if self.is_active and self.mode_manager.get_mode() == 'webradio' and self.current_state:
+            self.draw_display(self.current_state)
 
     # ------------------------------------------------------------------
     # Start/Stop
@@ -96,7 +95,7 @@ class WebRadioScreen:
     def start_mode(self):
         """
         Called when ModeManager transitions to 'webradio' mode.
-        Forces an immediate getState from Volumio.
+        Draws the listener's current state straight away.
         """
         if self.mode_manager.get_mode() != 'webradio':
             self.logger.warning("WebRadioScreen: Attempted start, but mode != 'webradio'.")
@@ -104,18 +103,13 @@ class WebRadioScreen:
 
         self.is_active = True
 
-        try:
-            if self.volumio_listener and self.volumio_listener.socketIO:
-                self.logger.debug("WebRadioScreen: Forcing getState from Volumio.")
-                self.volumio_listener.socketIO.emit("getState", {})
-        except Exception as e:
-            self.logger.warning(f"WebRadioScreen: Failed to emit 'getState'. Error => {e}")
+        # Draw from the state we already have (getState only if there is none yet)
+        if self.volumio_listener:
+            state = self.volumio_listener.get_or_request_state()
+            if state:
+                self.on_volumio_state_change(self.volumio_listener, state)
 
-        if not self.update_thread.is_alive():
-            self.stop_event.clear()
-            self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
-            self.update_thread.start()
-            self.logger.debug("WebRadioScreen: display update thread restarted.")
+        self.display_manager.scheduler.activate(self, self.render_fps)
 
     def stop_mode(self):
         """
@@ -126,12 +120,7 @@ class WebRadioScreen:
             return
 
         self.is_active = False
-        self.stop_event.set()
-        self.update_event.set()
-
-        if self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
-            self.logger.debug("WebRadioScreen: display update thread stopped.")
+        self.display_manager.scheduler.deactivate(self)
 
         self.display_manager.clear_screen()
         self.logger.info("WebRadioScreen: Stopped mode and cleared screen.")
@@ -232,10 +221,11 @@ class WebRadioScreen:
         - Line 3: Service (or stream)
         - Line 4: "Vol: {volume} | {quality}"
         Additionally, if album art is available it is pasted in the upper-right corner.
+
+        Nothing here animates, so the whole frame is the compositor's static
+        layer: it (and the album art download) is only redone when the text,
+        volume, quality or album art URL actually change.
         """
-        # Create a blank image with a black background.
-        base_image = Image.new("RGB", self.display_manager.oled.size, "black")
-        draw = ImageDraw.Draw(base_image)
         margin = 5
         line_height = 12  # Base line height
 
@@ -267,43 +257,49 @@ class WebRadioScreen:
         service_y = divider_y + 3          # Offset for Service (or stream)
         info_y = divider_y + line_height + 6  # Offset for Volume/Quality info
 
-        # Draw the Title.
-        draw.text((margin, title_y), title, font=self.font_title, fill="white")
-
-        # Draw the Artist only if it's not empty.
-        if artist:
-            draw.text((margin, artist_y), artist, font=self.font_small, fill="white")
-
-        # Draw a solid horizontal separator.
-        album_art_width = 60              # The width of your album art.
-        gap_between_line_and_art = 15     # Gap between the end of the line and the album art.
-        line_end_x = screen_width - margin - album_art_width - gap_between_line_and_art
-        draw.line((margin, divider_y, line_end_x, divider_y), fill="white")
-
-        # Draw the Service (or stream).
-        draw.text((margin, service_y), service, font=self.font_small, fill="white")
-
         # Prepare the Volume and Quality info.
         volume = str(data.get("volume") or "0")
         bitrate = data.get("bitrate")
         quality = bitrate if bitrate else "Live"
         info_line = f"Vol: {volume} | {quality}"
-        draw.text((margin, info_y), info_line, font=self.font_label, fill="white")
+        albumart_url = data.get("albumart")
 
+        def draw_static(draw, layer):
+            # Draw the Title.
+            draw.text((margin, title_y), title, font=self.font_title, fill="white")
 
-        # Display album art on the upper-right if available.
-        albumart_url = data.get("albumart")
-        if albumart_url:
-            albumart = self.get_albumart(albumart_url)
-            if albumart:
-                album_art_size = (album_art_width, album_art_width)
-                albumart = albumart.resize(album_art_size, Image.LANCZOS)
-                art_x = screen_width - album_art_size[0] - margin
-                art_y = margin
-                base_image.paste(albumart, (art_x, art_y))
+            # Draw the Artist only if it's not empty.
+            if artist:
+                draw.text((margin, artist_y), artist, font=self.font_small, fill="white")
+
+            # Draw a solid horizontal separator.
+            album_art_width = 60              # The width of your album art.
+            gap_between_line_and_art = 15     # Gap between the end of the line and the album art.
+            line_end_x = screen_width - margin - album_art_width - gap_between_line_and_art
+            draw.line((margin, divider_y, line_end_x, divider_y), fill="white")
+
+            # Draw the Service (or stream).
+            draw.text((margin, service_y), service, font=self.font_small, fill="white")
+
+            # Draw the Volume and Quality info.
+            draw.text((margin, info_y), info_line, font=self.font_label, fill="white")
+
+
+            # Display album art on the upper-right if available.
+            if albumart_url:
+                albumart = self.get_albumart(albumart_url)
+                if albumart:
+                    album_art_size = (album_art_width, album_art_width)
+                    albumart = albumart.resize(album_art_size, Image.LANCZOS)
+                    art_x = screen_width - album_art_size[0] - margin
+                    art_y = margin
+                    layer.paste(albumart, (art_x, art_y))
+
+        static_key = (title, artist, service, info_line, albumart_url)
+        base_image = self.compositor.compose(static_key, draw_static)
 
         # Send the composed image to the OLED display.
-        self.display_manager.oled.display(base_image)
+        self.display_manager.show(base_image)
         self.logger.debug("WebRadioScreen: Display updated with adjusted vertical offsets.")
 
     def toggle_play_pause(self):
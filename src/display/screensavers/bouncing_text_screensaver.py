@@ -8,18 +8,21 @@ class BouncingTextScreensaver:
     with a small x, y velocity.
     """
 
-    def __init__(self, display_manager, text="CyFi", font_key="radio_title", update_interval=0.06):
+    def __init__(self, display_manager, text="CyFi", font_key="radio_title", update_interval=0.06, speed=16):
         """
         :param display_manager:  DisplayManager instance
         :param text:             Which text to bounce
         :param font_key:         The key to retrieve the font from display_manager.fonts
         :param update_interval:  Delay (in seconds) between frames
+        :param speed:            Pixels per second along each axis (frame rate doesn't matter)
         """
         self.display_manager = display_manager
         self.width = display_manager.oled.width
         self.height = display_manager.oled.height
         self.text = text
         self.update_interval = update_interval
+        self.speed = speed
+        self.watch = display_manager.animation_clock.stopwatch()
 
         self.is_running = False
         self.thread = None
@@ -27,11 +30,16 @@ class BouncingTextScreensaver:
         # Position and velocity
         self.x = self.width // 2
         self.y = self.height // 2
-        self.vx = 1   # horizontal speed
-        self.vy = 1   # vertical speed
+        self.vx = 1   # horizontal direction
+        self.vy = 1   # vertical direction
 
         # Retrieve font from display_manager or fall back to default
-        self.font = display_manager.fonts.get(font_key, ImageFont.load_default())
+        self.font = display_manager.fonts.get(font_key)
+
+        # The text never changes, so measure it once (same box textbbox gives at (0, 0))
+        tx, ty, tx2, ty2 = self.font.getbbox(self.text)
+        self.text_w = tx2 - tx
+        self.text_h = ty2 - ty
 
     def start_screensaver(self):
         if self.is_running:
@@ -39,6 +47,7 @@ class BouncingTextScreensaver:
         self.is_running = True
         self.x = self.width // 2
         self.y = self.height // 2
+        self.watch.restart()
         self.thread = threading.Thread(target=self.run, daemon=True)
         self.thread.start()
 
@@ -54,16 +63,14 @@ class BouncingTextScreensaver:
             time.sleep(self.update_interval)
 
     def update_and_draw(self):
-        # 1) Move position
-        self.x += self.vx
-        self.y += self.vy
+        # 1) Move position by however far it travelled since the last frame
+        distance = self.speed * self.watch.step()
+        self.x += self.vx * distance
+        self.y += self.vy * distance
 
-        # 2) Measure text size
-        temp_img = Image.new("1", (self.width, self.height))
-        draw_temp = ImageDraw.Draw(temp_img)
-        tx, ty, tx2, ty2 = draw_temp.textbbox((0, 0), self.text, font=self.font)
-        text_w = tx2 - tx
-        text_h = ty2 - ty
+        # 2) Text size (measured once in __init__)
+        text_w = self.text_w
+        text_h = self.text_h
 
         # 3) Bounce if hitting edges
         if self.x < 0:
@@ -81,10 +88,8 @@ class BouncingTextScreensaver:
             self.vy = -self.vy
 
         # 4) Draw onto an image
-        img = Image.new("RGB", (self.width, self.height), "black")
+        img = self.display_manager.acquire_canvas()
         draw = ImageDraw.Draw(img)
-        draw.text((self.x, self.y), self.text, font=self.font, fill="white")
+        draw.text((int(self.x), int(self.y)), self.text, font=self.font, fill="white")
 
-        final_img = img.convert(self.display_manager.oled.mode)
-        with self.display_manager.lock:
-            self.display_manager.oled.display(final_img)
+        self.display_manager.show(img)
@@ -10,8 +10,8 @@ class GeoScreensaver:
 
     Basic idea:
       - A set of shapes is generated (circles, rectangles, triangles, etc.).
-      - Each shape has a position, velocity, colour, and possibly other attributes.
-      - Each update, the shapes move (bounce or wrap).
+      - Each shape has a position, velocity (pixels per second), colour, and possibly other attributes.
+      - Each update, the shapes move by velocity x elapsed time (bounce or wrap).
       - When resetting, all shapes are regenerated randomly.
     """
 
@@ -24,6 +24,7 @@ class GeoScreensaver:
         """
         self.display_manager = display_manager
         self.update_interval = update_interval
+        self.watch = display_manager.animation_clock.stopwatch()
 
         # Dimensions from the display
         self.width = display_manager.oled.width
@@ -43,8 +44,8 @@ class GeoScreensaver:
             shape_type = random.choice(["circle", "rectangle", "triangle"])
             x = random.randint(0, self.width - 1)
             y = random.randint(0, self.height - 1)
-            dx = random.choice([-1, 1]) * random.uniform(0.5, 2)
-            dy = random.choice([-1, 1]) * random.uniform(0.5, 2)
+            dx = random.choice([-1, 1]) * random.uniform(12.5, 50)
+            dy = random.choice([-1, 1]) * random.uniform(12.5, 50)
 
             # Random size (radius or side length)
             size = random.randint(5, 15)
@@ -65,6 +66,7 @@ class GeoScreensaver:
                 "size": size,
                 "colour": colour
             })
+        self.watch.restart()
 
     def start_screensaver(self):
         """Begin the main loop in a background thread."""
@@ -101,14 +103,15 @@ class GeoScreensaver:
         displays the image on the screen.
         """
         # 1) Prepare an empty image + draw
-        img = Image.new("RGB", (self.width, self.height), "black")
+        img = self.display_manager.acquire_canvas("RGB")
         draw = ImageDraw.Draw(img)
 
         # 2) Update and draw shapes
+        dt = self.watch.step()
         for shape in self.shapes:
             # Move the shape
-            shape["x"] += shape["dx"]
-            shape["y"] += shape["dy"]
+            shape["x"] += shape["dx"] * dt
+            shape["y"] += shape["dy"] * dt
 
             # Bounce shapes off edges
             if shape["x"] < 0 or shape["x"] > self.width:
@@ -150,5 +153,5 @@ class GeoScreensaver:
 
         # 3) Convert and display
         final_img = img.convert(self.display_manager.oled.mode)
-        with self.display_manager.lock:
-            self.display_manager.oled.display(final_img)
+        self.display_manager.release_canvas(img)
+        self.display_manager.show(final_img)
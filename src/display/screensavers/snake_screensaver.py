@@ -11,7 +11,8 @@ class SnakeScreensaver:
     A Python-based "snake" screensaver inspired by your JS code.
 
     Basic idea:
-      - A `count` increments each update.
+      - A `count` increments every update_interval of elapsed time (several
+        steps per frame if frames are late, so the snake never slows down).
       - A boolean `flip` toggles horizontal direction after traveling the screen width.
       - The snake’s position is (x, y).
       - There's a tail. Picking up 'random_pickups' extends it.
@@ -22,10 +23,11 @@ class SnakeScreensaver:
         """
         :param display_manager: An instance of your DisplayManager 
                                 (must have .oled.width, .oled.height, and .oled.display()).
-        :param update_interval: Seconds between frames (0.04 ~ 40ms).
+        :param update_interval: Seconds per snake step, and between frames (0.04 ~ 40ms).
         """
         self.display_manager = display_manager
         self.update_interval = update_interval
+        self.watch = display_manager.animation_clock.stopwatch()
 
         # Dimensions from the OLED
         self.width = display_manager.oled.width
@@ -47,6 +49,7 @@ class SnakeScreensaver:
         self.count = 0
         self.tail_length = 10
         self.random_pickups = []
+        self.watch.restart()
 
         # Create ~7 random pickups
         for _ in range(7):
@@ -87,18 +90,46 @@ class SnakeScreensaver:
     def refresh_action(self):
         """
         The main logic for the snake:
+          - Catch up on every step due by now (see step())
           - Clear background
-          - Determine (x, y)
-          - Extend tail
           - Draw tail + pickups
-          - If collision w/ pickup, increase tail length
-          - If off bottom, reset.
         """
-        # 1) Prepare an empty image + draw
-        img = Image.new("RGB", (self.width, self.height), "black")
+        # 1) Advance to where the snake should be by now
+        due = int(self.watch.elapsed() / self.update_interval) + 1
+        if due - self.count > self.width:
+            # Fell far behind (a long stall): carry on from here instead of replaying it
+            self.watch.start += (due - self.count - 1) * self.update_interval
+            due = self.count + 1
+        while self.count < due:
+            if self.step():
+                break
+
+        # 2) Prepare an empty image + draw
+        img = self.display_manager.acquire_canvas()
         draw = ImageDraw.Draw(img)
 
-        # 2) Determine 'count' transitions
+        # 3) Draw the tail
+        #    In JS, fillRect(i[0], i[1]-1, 2, 3, 1).
+        #    We'll just do 2x3 white rectangles:
+        for (tx, ty) in self.tail:
+            draw.rectangle([tx, ty - 1, tx + 1, ty + 1], fill="white")
+
+        # 4) Draw the pickups as a single pixel
+        for px, py in self.random_pickups:
+            draw.point((px, py), fill="white")
+
+        # 5) Show on the OLED display
+        self.display_manager.show(img)
+
+    def step(self):
+        """
+        One step of the snake:
+          - Determine (x, y)
+          - Extend tail
+          - If collision w/ pickup, increase tail length
+          - If off bottom, reset (returns True).
+        """
+        # 1) Determine 'count' transitions
         #    if count % width == 0, flip = !flip
         if (self.count % self.width) == 0:
             self.flip = not self.flip
@@ -112,18 +143,12 @@ class SnakeScreensaver:
         # y = (count // width) * 3
         y = (self.count // self.width) * 3
 
-        # 3) Add new head to tail, keep it at tail_length
+        # 2) Add new head to tail, keep it at tail_length
         self.tail.append([x, y])
         if len(self.tail) > self.tail_length:
             self.tail.pop(0)
 
-        # 4) Draw the tail
-        #    In JS, fillRect(i[0], i[1]-1, 2, 3, 1).
-        #    We'll just do 2x3 white rectangles:
-        for (tx, ty) in self.tail:
-            draw.rectangle([tx, ty - 1, tx + 1, ty + 1], fill="white")
-
-        # 5) Loop pickups, check collision => tail_length += 5
+        # 3) Loop pickups, check collision => tail_length += 5
         for pickup in self.random_pickups[:]:
             px, py = pickup
             # The JS collision logic:
@@ -132,17 +157,10 @@ class SnakeScreensaver:
                 self.tail_length += 5
                 self.random_pickups.remove(pickup)
 
-            # Draw the pickup as a single pixel or small square
-            # We'll do 1x1 pixel in white
-            draw.point((px, py), fill="white")
-
         self.count += 1
 
         # If y > height => reset
         if y > self.height:
             self.reset_animation()
-
-        # 6) Show on the OLED display
-        final_img = img.convert(self.display_manager.oled.mode)
-        with self.display_manager.lock:
-            self.display_manager.oled.display(final_img)
\ No newline at end of file
+            return True
+        return False
\ No newline at end of file
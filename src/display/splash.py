@@ -0,0 +1,87 @@
+# src/display/splash.py
+
+import os
+import struct
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Shared with scripts/early_splash.py, which reads the file without any of
+# this package: keep the two in sync.
+SPLASH_MAGIC = b"CYSPLSH1"
+SPLASH_HEADER = struct.Struct("<8sHHH")  # magic, width, height, column offset
+HANDOVER_PATH = "/tmp/cyfi_splash_shown"
+
+
+def _boot_id():
+    try:
+        with open("/proc/sys/kernel/random/boot_id", "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def write_splash(path, device, frame):
+    """
+    Pack `frame` (an "L" image or uint8 array, logical orientation) for
+    `device` and write it as the early splash file. The data is stored
+    exactly as it goes over SPI, so the early script only has to send it.
+    Returns False if NumPy (needed for packing) isn't available.
+    """
+    if np is None:
+        return False
+    packed = device.pack(frame)
+    header = SPLASH_HEADER.pack(SPLASH_MAGIC, device.width, device.height, device._column_offset)
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(packed.tobytes())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def read_splash(path, width, height):
+    """The packed panel data in splash file `path` as a (height, width / 2) array, or None."""
+    if np is None or not path:
+        return None
+    try:
+        with open(path, "rb") as f:
+            magic, file_width, file_height, _ = SPLASH_HEADER.unpack(f.read(SPLASH_HEADER.size))
+            data = f.read()
+    except (OSError, struct.error):
+        return None
+    if magic != SPLASH_MAGIC or (file_width, file_height) != (width, height):
+        return None
+    if len(data) != width * height // 2:
+        return None
+    return np.frombuffer(data, dtype=np.uint8).reshape(height, width // 2)
+
+
+def take_handover():
+    """
+    True if scripts/early_splash.py lit the panel during this boot and
+    nobody has taken it over yet. The marker is emptied rather than
+    removed: early_splash runs as root and /tmp is sticky.
+    """
+    try:
+        with open(HANDOVER_PATH, "r+") as f:
+            shown = f.read().strip()
+            if not shown or shown != _boot_id():
+                return False
+            f.seek(0)
+            f.truncate()
+        return True
+    except OSError:
+        return False
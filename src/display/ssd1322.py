@@ -0,0 +1,96 @@
+# src/display/ssd1322.py
+
+from luma.oled.device import ssd1322
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class GreyscaleSSD1322(ssd1322):
+    """
+    SSD1322 driver that accepts 8-bit "L" frames natively.
+
+    luma's ssd1322 only takes "1" or "RGB" frames and turns every RGB pixel
+    into a 4-bit grey level in Python. Screens already think in greys, so
+    this subclass lets them draw straight into an "L" canvas (a third of the
+    RGB buffer) and only drops each byte to its top nibble when packing.
+
+    If NumPy is installed, display() also skips luma's per-pixel loop
+    altogether: the frame is rotated, quantised and packed two pixels per
+    byte as array operations, and the packed window goes straight to SPI.
+    It then accepts a (height, width) uint8 array as well as an "L" image.
+
+    `initial_packed` (panel data as returned by pack()) replaces the blank
+    frame luma draws while initialising, so a panel taken over from the
+    early splash never goes dark.
+    """
+
+    def __init__(self, serial_interface=None, width=256, height=64, rotate=0,
+                 framebuffer=None, initial_packed=None, **kwargs):
+        self._initial_packed = initial_packed if np is not None else None
+        # luma's capability check only knows "1"/"RGB"/"RGBA", so initialise
+        # (and clear the panel) as RGB, then switch over to "L".
+        super().__init__(serial_interface, width=width, height=height, rotate=rotate,
+                         mode="RGB", framebuffer=framebuffer, **kwargs)
+        self.mode = "L"
+        self._populate = self._render_luminance
+
+    def clear(self):
+        packed, self._initial_packed = self._initial_packed, None
+        if packed is not None:
+            self._display_packed(packed)
+        else:
+            super().clear()
+
+    def _render_luminance(self, buf, pixel_data):
+        i = 0
+        nibble_order = self._nibble_order
+        for pix in pixel_data:
+            grey = pix >> 4
+            if grey > 0:
+                if i % 2 == nibble_order:
+                    buf[i // 2] |= (grey << 4)
+                else:
+                    buf[i // 2] |= grey
+            i += 1
+
+    # ------------------------------------------------------------------
+    #   NumPy fast path
+    # ------------------------------------------------------------------
+    def pack(self, frame):
+        """
+        Return the frame (an "L" image or uint8 array in logical orientation)
+        as a packed 4bpp array of shape (height, width / 2) in panel order.
+        """
+        pixels = np.asarray(frame, dtype=np.uint8)
+        if self.rotate == 2:
+            pixels = pixels[::-1, ::-1]
+
+        even = pixels[:, 0::2] & 0xF0
+        odd = pixels[:, 1::2] >> 4
+        if self._nibble_order == 0:
+            return even | odd
+        return (odd << 4) | (even >> 4)
+
+    def display(self, image):
+        # RGB frames (e.g. luma's own clear() during __init__) take luma's path
+        if np is None or self.rotate not in (0, 2) or getattr(image, "mode", "L") != "L":
+            return super().display(image)
+
+        self._display_packed(self.pack(image))
+
+    def _display_packed(self, packed):
+        assert packed.shape == (self._h, self._w // 2)
+
+        redraw_packed = getattr(self.framebuffer, "redraw_packed", None)
+        if redraw_packed is None:
+            # luma's own framebuffers only understand PIL images: send it all
+            windows = [(packed, (0, 0, self._w, self._h))]
+        else:
+            windows = redraw_packed(packed)
+
+        for window, (left, top, right, bottom) in windows:
+            self._set_position(top, right, bottom, left)
+            self.data(window.ravel().tolist())
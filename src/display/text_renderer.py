@@ -0,0 +1,129 @@
+# src/display/text_renderer.py
+
+import logging
+import threading
+from collections import OrderedDict
+from PIL import Image, ImageDraw, ImageFont
+
+
+class _LRU:
+    """Tiny thread-safe bounded LRU (OrderedDict based) with hit/miss counters."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TextRenderer:
+    """
+    Rasterise-once text for the OLED.
+
+    Every text run drawn through this (font, text, anchor) is rendered by
+    FreeType once into an 8-bit coverage mask, kept in a bounded LRU atlas,
+    and afterwards just blitted with Image.paste(ink, pos, mask). Text sizes
+    are memoised the same way. Screens redraw the same labels, titles and
+    times many times a second, so nearly every call is a cache hit.
+
+    Whole runs are cached rather than single glyphs so kerning and glyph
+    positioning are exactly what FreeType would have produced.
+    """
+
+    def __init__(self, max_runs=512, max_sizes=2048):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.WARNING)
+        self._runs = _LRU(max_runs)
+        self._sizes = _LRU(max_sizes)
+
+    # ------------------------------------------------------------------
+    #   Measurement
+    # ------------------------------------------------------------------
+    def text_size(self, font, text):
+        """Memoised font.getsize(text)."""
+        key = (font, text)
+        size = self._sizes.get(key)
+        if size is None:
+            size = font.getsize(text)
+            self._sizes.put(key, size)
+        return size
+
+    # ------------------------------------------------------------------
+    #   Drawing
+    # ------------------------------------------------------------------
+    def _get_run(self, font, text, anchor):
+        key = (font, text, anchor)
+        run = self._runs.get(key)
+        if run is None:
+            left, top, right, bottom = font.getbbox(text, anchor=anchor)
+            mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+            ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255, anchor=anchor)
+            run = (mask, left, top)
+            self._runs.put(key, run)
+        return run
+
+    def draw_text(self, image, xy, text, font, fill, anchor=None):
+        """Blit `text` at integer position `xy` onto `image` using the run atlas."""
+        mask, left, top = self._get_run(font, text, anchor)
+        image.paste(fill, (xy[0] + left, xy[1] + top), mask)
+
+    def get_draw(self, image):
+        """Return an ImageDraw for `image` whose text()/textsize() go through this renderer."""
+        return CachedImageDraw(image, self)
+
+    def get_stats(self):
+        return {
+            "runs": len(self._runs),
+            "run_hits": self._runs.hits,
+            "run_misses": self._runs.misses,
+            "size_hits": self._sizes.hits,
+            "size_misses": self._sizes.misses,
+        }
+
+
+class CachedImageDraw(ImageDraw.ImageDraw):
+    """
+    Drop-in ImageDraw whose simple text()/textsize() calls use a TextRenderer.
+    Anything the atlas doesn't cover (multiline, strokes, bitmap fonts,
+    fractional positions, extra layout options, non L/RGB images) goes to
+    Pillow as usual.
+    """
+
+    def __init__(self, im, renderer):
+        super().__init__(im)
+        self._renderer = renderer
+
+    def text(self, xy, text, fill=None, font=None, anchor=None, *args, **kwargs):
+        # Alpha-aware (LA/RGBA) and 1-bit targets blend differently; leave those to Pillow
+        if (args or kwargs or fill is None or not isinstance(font, ImageFont.FreeTypeFont)
+                or not isinstance(text, str) or "\n" in text
+                or not isinstance(xy[0], int) or not isinstance(xy[1], int)
+                or self._image.mode not in ("L", "RGB")):
+            return super().text(xy, text, fill, font, anchor, *args, **kwargs)
+        self._renderer.draw_text(self._image, xy, text, font, fill, anchor)
+
+    def textsize(self, text, font=None, *args, **kwargs):
+        if args or kwargs or not isinstance(font, ImageFont.FreeTypeFont) or "\n" in text:
+            return super().textsize(text, font, *args, **kwargs)
+        return self._renderer.text_size(font, text)
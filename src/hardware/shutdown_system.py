@@ -24,26 +24,27 @@ def display_shutdown_text(display_manager):
     """
     Renders and displays a "Shutting Down..." message using a custom font.
     """
-    with display_manager.lock:
-        width, height = display_manager.oled.width, display_manager.oled.height
-        image = Image.new("RGB", (width, height), "black")
-        draw = ImageDraw.Draw(image)
-        
-        try:
-            # Adjust the font path and size as needed.
-            font = ImageFont.truetype("/home/volumio/CyFi/src/assets/fonts/OpenSans-Regular.ttf", 22)
-        except Exception as e:
-            display_manager.logger.error(f"Error loading custom font: {e}")
-            font = ImageFont.load_default()
-        
-        text = "Shutting Down..."
-        text_width, text_height = draw.textsize(text, font=font)
-        x = (width - text_width) // 2
-        y = (height - text_height) // 2
-        draw.text((x, y), text, font=font, fill="white")
-        
-        display_manager.oled.display(image)
-        display_manager.logger.info("Shutdown text displayed on OLED.")
+    width, height = display_manager.oled.width, display_manager.oled.height
+    image = Image.new(display_manager.oled.mode, (width, height), "black")
+    draw = ImageDraw.Draw(image)
+    
+    try:
+        # Adjust the font path and size as needed.
+        font = ImageFont.truetype("/home/volumio/CyFi/src/assets/fonts/OpenSans-Regular.ttf", 22)
+    except Exception as e:
+        display_manager.logger.error(f"Error loading custom font: {e}")
+        font = ImageFont.load_default()
+    
+    text = "Shutting Down..."
+    text_width, text_height = draw.textsize(text, font=font)
+    x = (width - text_width) // 2
+    y = (height - text_height) // 2
+    draw.text((x, y), text, font=font, fill="white")
+    
+    # Wait for the writer so the message is on the panel before the OLED is reset
+    display_manager.show(image)
+    display_manager.flush()
+    display_manager.logger.info("Shutdown text displayed on OLED.")
 
 
 def shutdown_system(display_manager, buttons_leds, mode_manager=None):
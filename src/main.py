@@ -1,8 +1,29 @@
 #!/usr/bin/env python3
 # src/main.py
 
-import RPi.GPIO as GPIO
-GPIO.setwarnings(False)
+import sys
+
+# The supervisor only needs the standard library: keep it out of the heavy imports below
+if __name__ == "__main__" and "--supervise" in sys.argv:
+    import logging
+    import os
+    from boot.supervisor import Supervisor
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    script = os.path.abspath(__file__)
+    config_path = os.path.join(os.path.dirname(script), '..', 'config.yaml')
+    sys.exit(Supervisor(script, sys.argv[1:], config_path=config_path).run())
+
+# Must be installed before anything heavy is imported to see it
+if "--profile-imports" in sys.argv:
+    from boot.import_profiler import ImportProfiler
+    IMPORT_PROFILER = ImportProfiler.install()
+else:
+    IMPORT_PROFILER = None
+
 import time
 import threading
 import logging
@@ -11,23 +32,38 @@ import socket
 import subprocess
 import os
 import glob
-import sys
-from PIL import Image, ImageSequence
-
-from display.screens.clock import Clock
-from hardware.shutdown_system import shutdown_system
-from display.screens.original_screen import OriginalScreen
-from display.screens.modern_screen import ModernScreen
-from display.screens.minimal_screen import MinimalScreen
-from display.screens.system_info_screen import SystemInfoScreen
-from display.screensavers.snake_screensaver import SnakeScreensaver
-from display.screensavers.geo_screensaver import GeoScreensaver
-from display.screensavers.bouncing_text_screensaver import BouncingTextScreensaver
+
+# Only what the first boot frame needs is imported up front; the rest
+# (GPIO, socketio/requests, transitions, screens) is preloaded in the
+# background while the logo plays and imported for real where it is used.
 from display.display_manager import DisplayManager
-from managers.menu_manager import MenuManager
-from managers.mode_manager import ModeManager
-from managers.manager_factory import ManagerFactory
-from network.volumio_listener import VolumioListener
+from boot.preload import BackgroundImporter
+from boot.orchestrator import BootOrchestrator
+from boot.timeline import BootTimeline
+from boot.snapshot import BootSnapshot, SnapshotWriter
+from network.command_server import CommandServer
+
+PRELOAD_MODULES = (
+    "RPi.GPIO",
+    "network.volumio_listener",
+    "managers.mode_manager",
+    "managers.manager_factory",
+    "managers.menu_manager",
+    "display.screens.clock",
+    "display.screens.original_screen",
+    "display.screens.modern_screen",
+    "display.screens.minimal_screen",
+)
+
+# A --spare process (see boot/supervisor.py) also has these parked, ready for takeover
+SPARE_MODULES = PRELOAD_MODULES + (
+    "display.screens.webradio_screen",
+    "display.screens.airplay_screen",
+)
+
+# Stamps every boot step relative to process start; the file path is set once config is read
+TIMELINE = BootTimeline()
+TIMELINE.mark("main_imported")
 
 def load_config(config_path='/config.yaml'):
     abs_path = os.path.abspath(config_path)
@@ -73,38 +109,23 @@ def is_network_online(host="8.8.8.8", port=53, timeout=3):
         return False
 
 def show_gif_loop(gif_path, stop_condition, display_manager, logger):
-    try:
-        image = Image.open(gif_path)
-        if not getattr(image, "is_animated", False):
-            logger.warning(f"GIF '{gif_path}' is not animated.")
-            return
-    except Exception as e:
-        logger.error(f"Failed to load GIF '{gif_path}': {e}")
+    animation = display_manager.load_animation(gif_path, fit="crop")
+    if animation is None:
+        logger.error(f"Failed to load GIF '{gif_path}'.")
+        return
+    if not animation.is_animated:
+        logger.warning(f"GIF '{gif_path}' is not animated.")
         return
     logger.info(f"Displaying GIF: {gif_path}")
-    required_size = display_manager.oled.size
-    while not stop_condition():
-        for frame in ImageSequence.Iterator(image):
-            if stop_condition():
-                return
-            background = Image.new(display_manager.oled.mode, required_size)
-            frame_converted = frame.convert(display_manager.oled.mode)
-            background.paste(frame_converted, (0,0))
-            display_manager.oled.display(background)
-            frame_duration = frame.info.get('duration', 100) / 1000.0
-            time.sleep(frame_duration)
-
-def cyfi_command_server(mode_manager, volumio_listener, display_manager, ready_stop_event):
-    sock_path = "/tmp/cyfi.sock"
-    try:
-        os.remove(sock_path)
-    except OSError:
-        pass
+    display_manager.play_animation(gif_path, stop_condition, fit="crop")
 
-    server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    server_socket.bind(sock_path)
-    server_socket.listen(1)
-    print(f"CyFi command server listening on {sock_path}")
+def register_remote_commands(command_server, mode_manager, volumio_listener, display_manager):
+    """
+    The IR remote's commands (hardware/ir_listener.py), dispatched on the
+    current mode. Registered at handover, once ModeManager exists; before
+    that the command server's fallback only exits the ready screen.
+    """
+    logger = logging.getLogger("RemoteCommands")
 
     select_mapping = {
         "menu": lambda: mode_manager.menu_manager.select_item(),
@@ -125,128 +146,77 @@ def cyfi_command_server(mode_manager, volumio_listener, display_manager, ready_s
         "systeminfo": lambda: mode_manager.system_info_screen.select_item(),
     }
 
-    scroll_mapping = {
-        "scroll_up": {
-            "tidal": lambda: mode_manager.tidal_manager.scroll_selection(-1),
-            "qobuz": lambda: mode_manager.qobuz_manager.scroll_selection(-1),
-            "spotify": lambda: mode_manager.spotify_manager.scroll_selection(-1),
-            "library": lambda: mode_manager.library_manager.scroll_selection(-1),
-            "radiomanager": lambda: mode_manager.radio_manager.scroll_selection(-1),
-            "motherearthradio": lambda: mode_manager.motherearth_manager.scroll_selection(-1),
-            "radioparadise": lambda: mode_manager.radioparadise_manager.scroll_selection(-1),
-            "playlists": lambda: mode_manager.playlist_manager.scroll_selection(-1),
-            "configmenu": lambda: mode_manager.config_menu.scroll_selection(-1),
-            "remotemenu": lambda: mode_manager.remote_menu.scroll_selection(-1),
-            "displaymenu": lambda: mode_manager.display_menu.scroll_selection(-1),
-            "clockmenu": lambda: mode_manager.clock_menu.scroll_selection(-1),
-            "systemupdate": lambda: mode_manager.system_update_menu.scroll_selection(-1),
-            "screensavermenu": lambda: mode_manager.screensaver_menu.scroll_selection(-1),
-            "systeminfo": lambda: mode_manager.system_info_screen.scroll_selection(-1),
-        },
-        "scroll_down": {
-            "tidal": lambda: mode_manager.tidal_manager.scroll_selection(1),
-            "qobuz": lambda: mode_manager.qobuz_manager.scroll_selection(1),
-            "spotify": lambda: mode_manager.spotify_manager.scroll_selection(1),
-            "library": lambda: mode_manager.library_manager.scroll_selection(1),
-            "radiomanager": lambda: mode_manager.radio_manager.scroll_selection(1),
-            "motherearthradio": lambda: mode_manager.motherearth_manager.scroll_selection(1),
-            "radioparadise": lambda: mode_manager.radioparadise_manager.scroll_selection(1),
-            "playlists": lambda: mode_manager.playlist_manager.scroll_selection(1),
-            "configmenu": lambda: mode_manager.config_menu.scroll_selection(1),
-            "remotemenu": lambda: mode_manager.remote_menu.scroll_selection(1),
-            "displaymenu": lambda: mode_manager.display_menu.scroll_selection(1),
-            "clockmenu": lambda: mode_manager.clock_menu.scroll_selection(1),
-            "systemupdate": lambda: mode_manager.system_update_menu.scroll_selection(1),
-            "screensavermenu": lambda: mode_manager.screensaver_menu.scroll_selection(1),
-            "systeminfo": lambda: mode_manager.system_info_screen.scroll_selection(1),
-        }
+    # Modes whose manager scrolls with scroll_up/scroll_down
+    scroll_targets = {
+        "tidal": lambda: mode_manager.tidal_manager,
+        "qobuz": lambda: mode_manager.qobuz_manager,
+        "spotify": lambda: mode_manager.spotify_manager,
+        "library": lambda: mode_manager.library_manager,
+        "radiomanager": lambda: mode_manager.radio_manager,
+        "motherearthradio": lambda: mode_manager.motherearth_manager,
+        "radioparadise": lambda: mode_manager.radioparadise_manager,
+        "playlists": lambda: mode_manager.playlist_manager,
+        "configmenu": lambda: mode_manager.config_menu,
+        "remotemenu": lambda: mode_manager.remote_menu,
+        "displaymenu": lambda: mode_manager.display_menu,
+        "clockmenu": lambda: mode_manager.clock_menu,
+        "systemupdate": lambda: mode_manager.system_update_menu,
+        "screensavermenu": lambda: mode_manager.screensaver_menu,
+        "systeminfo": lambda: mode_manager.system_info_screen,
     }
 
-    while True:
-        try:
-            conn, _ = server_socket.accept()
-            with conn:
-                data = conn.recv(1024)
-                if not data:
-                    continue
-                command = data.decode("utf-8").strip()
-                print(f"Command received: {command}")
-                current_mode = mode_manager.get_mode()
-                print(f"Current mode: {current_mode}")  # DEBUG: see the mode
-
-                # Exit ready GIF if any "menu/select/toggle/ok" arrives during boot
-                if not ready_stop_event.is_set() and command in ["menu", "select", "ok", "toggle"]:
-                    print("Exiting ready GIF due to remote control command.")
-                    ready_stop_event.set()
-                    continue
-
-                if command == "home":
-                    mode_manager.trigger("to_clock")
-                elif command == "shutdown":
-                    shutdown_system(display_manager, None, mode_manager)
-                elif command == "menu":
-                    if current_mode == "clock":
-                        mode_manager.trigger("to_menu")
-                elif command == "toggle":
-                    mode_manager.toggle_play_pause()
-                elif command == "repeat":
-                    print("Repeat command received. (Implement as needed)")
-                elif command == "select":
-                    if current_mode in select_mapping:
-                        print(f"Selecting item in mode: {current_mode}")  # DEBUG
-                        select_mapping[current_mode]()
-                    else:
-                        print(f"No select mapping for mode: {current_mode}")
-
-                # **Replace the scroll command handlers with this debug and forced scroll:**
-
-                elif command == "scroll_left":
-                    print(f"Scroll left command received in mode: {current_mode}")  # DEBUG
-                    mode_manager.menu_manager.scroll_selection(-1)
-                    print("Called menu_manager.scroll_selection(-1) [LEFT]")
-
-                elif command == "scroll_right":
-                    print(f"Scroll right command received in mode: {current_mode}")  # DEBUG
-                    mode_manager.menu_manager.scroll_selection(1)
-                    print("Called menu_manager.scroll_selection(1) [RIGHT]")
-                    
-                    
-                elif command == "scroll_up":
-                    print(f"Scroll up command received in mode: {current_mode}")  # DEBUG
-                    # General-purpose scroll (menu or submenus)
-                    if current_mode in scroll_mapping["scroll_up"]:
-                        scroll_mapping["scroll_up"][current_mode]()
-                        print(f"Called scroll_selection(-1) for {current_mode}")
-                    else:
-                        print("No scroll_up mapping for this mode.")
-
-                elif command == "scroll_down":
-                    print(f"Scroll down command received in mode: {current_mode}")  # DEBUG
-                    if current_mode in scroll_mapping["scroll_down"]:
-                        scroll_mapping["scroll_down"][current_mode]()
-                        print(f"Called scroll_selection(1) for {current_mode}")
-                    else:
-                        print("No scroll_down mapping for this mode.")
-
-
-                elif command == "volume_plus":
-                    volumio_listener.increase_volume()
-                elif command == "volume_minus":
-                    volumio_listener.decrease_volume()
-                elif command == "back":
-                    mode_manager.trigger("back")
-                else:
-                    print(f"No mapping for command: {command}")
-        except Exception as e:
-            print(f"Error in command server: {e}")
+    def select():
+        current_mode = mode_manager.get_mode()
+        if current_mode in select_mapping:
+            logger.debug(f"Selecting item in mode: {current_mode}")
+            select_mapping[current_mode]()
+        else:
+            logger.info(f"No select mapping for mode: {current_mode}")
+
+    def scroll(direction):
+        current_mode = mode_manager.get_mode()
+        target = scroll_targets.get(current_mode)
+        if target is None:
+            logger.info(f"No scroll mapping for mode: {current_mode}")
+            return
+        target().scroll_selection(direction)
+
+    def menu():
+        if mode_manager.get_mode() == "clock":
+            mode_manager.trigger("to_menu")
+
+    def shutdown():
+        from hardware.shutdown_system import shutdown_system
+        shutdown_system(display_manager, None, mode_manager)
+
+    handlers = {
+        "home": lambda: mode_manager.trigger("to_clock"),
+        "shutdown": shutdown,
+        "menu": menu,
+        "toggle": mode_manager.toggle_play_pause,
+        "repeat": lambda: logger.info("Repeat command received. (Implement as needed)"),
+        "select": select,
+        "scroll_left": lambda: mode_manager.menu_manager.scroll_selection(-1),
+        "scroll_right": lambda: mode_manager.menu_manager.scroll_selection(1),
+        "scroll_up": lambda: scroll(-1),
+        "scroll_down": lambda: scroll(1),
+        "volume_plus": volumio_listener.increase_volume,
+        "volume_minus": volumio_listener.decrease_volume,
+        "back": lambda: mode_manager.trigger("back"),
+    }
+    for command, handler in handlers.items():
+        command_server.register(command, handler)
 
-def main():
-    # --- Logging ---
+def configure_logging():
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[logging.StreamHandler(sys.stdout)]
     )
+
+def main():
+    # --- Logging ---
+    configure_logging()
     logger = logging.getLogger("CyFiMain")
 
     # --- Config ---
@@ -254,61 +224,33 @@ def main():
     config_path = os.path.join(script_dir, '..', 'config.yaml')
     config = load_config(config_path)
     display_config = config.get('display', {})
-
-    # --- DisplayManager ---
-    display_manager = DisplayManager(display_config)
-
-    # --- First Run: Show Network Setup GIFs ---
-    if is_first_run():
-        connecting_gif = display_config.get('connecting_path', 'connecting.gif')
-        connected_gif = display_config.get('connected_path', 'connected.gif')
-        logger.info("First run detected. Showing 'connecting' GIF until network is up.")
-        show_gif_loop(
-            connecting_gif,
-            lambda: is_network_online(),
-            display_manager,
-            logger
-        )
-        logger.info("Network connected! Showing 'connected' GIF for 2 seconds.")
-        show_gif_loop(
-            connected_gif,
-            lambda: True,
-            display_manager,
-            logger
-        )
-        time.sleep(2)
-        
-    # --- Determine which ready GIF to show first ---
-    if not has_seen_ready():
-        first_ready_path = display_config.get('ready_new_path', 'ready_new.gif')
-        logger.info("Showing 'ready_new.gif' for new user.")
-        is_first_time_user = True
-    else:
-        first_ready_path = display_config.get('ready_gif_path', 'ready.gif')
-        logger.info("Showing 'ready.gif' for returning user.")
-        is_first_time_user = False
-
-    # --- Startup Logo ---
-    logger.info("Displaying startup logo...")
-    display_manager.show_logo(duration=12)
-    logger.info("Startup logo display complete.")
-    display_manager.clear_screen()
-    logger.info("Screen cleared after logo display.")
-
-    # --- Readiness GIF Threads/Events ---
+    boot_config = config.get('boot', {})
+    TIMELINE.path = boot_config.get('timeline_path', '/tmp/cyfi_boot_timeline.json')
+    TIMELINE.mark("config_loaded")
+
+    # --- DisplayManager (the only thing the first frame waits for) ---
+    boot = BootOrchestrator(timeline=TIMELINE)
+    with boot.stage("display"):
+        display_manager = DisplayManager(display_config)
+
+    # --- Warm restart: a recent snapshot means the service was just restarted ---
+    snapshot_path = boot_config.get('snapshot_path', '/tmp/cyfi_snapshot')
+    warm_restart_window = boot_config.get('warm_restart_window', 300)  # seconds, 0 = always cold
+    snapshot = None
+    if warm_restart_window and not is_first_run():
+        snapshot = BootSnapshot.load(snapshot_path, max_age=warm_restart_window)
+
+    LOGO_MIN_DURATION = boot_config.get('logo_min_duration', 3)        # seconds
+    LOGO_MAX_DURATION = boot_config.get('logo_max_duration', 12)       # seconds
+    MIN_LOADING_DURATION = boot_config.get('min_loading_duration', 0)  # seconds
+
+    # --- Readiness Events ---
     volumio_ready_event = threading.Event()
-    min_loading_event = threading.Event()
     ready_stop_event = threading.Event()
-    MIN_LOADING_DURATION = 6  # seconds
-
-    # --- VolumioListener ---
-    volumio_cfg = config.get('volumio', {})
-    volumio_host = volumio_cfg.get('host', 'localhost')
-    volumio_port = volumio_cfg.get('port', 3000)
-    volumio_listener = VolumioListener(host=volumio_host, port=volumio_port)
 
     # On Volumio state change: set events, also handle ready_stop_event if playing
     def on_state_changed(sender, state):
+        TIMELINE.mark_once("first_push_state")
         logger.info(f"Volumio state changed: {state}")
         if state.get('status') == 'play' and not ready_stop_event.is_set():
             logger.info("Detected playback start! Exiting ready screen.")
@@ -316,131 +258,240 @@ def main():
         if state.get('status') in ['play', 'stop', 'pause', 'unknown']:
             logger.info("Volumio is considered ready now.")
             volumio_ready_event.set()
-            
-    volumio_listener.state_changed.connect(on_state_changed)
-
-    # --- Command server must start early so IR remote works for GIF loop exit ---
-    class DummyModeManager:
-        def get_mode(self):
-            return None
-        def trigger(self, event):
-            pass
 
-    dummy_mode_manager = DummyModeManager()
-    threading.Thread(
-        target=cyfi_command_server,
-        args=(dummy_mode_manager, volumio_listener, display_manager, ready_stop_event),
-        daemon=True
-    ).start()
-    print("CyFi command server thread started.")
-
-    # Loading GIF thread
-    def show_loading():
-        loading_gif_path = display_config.get('loading_gif_path', 'loading.gif')
-        try:
-            image = Image.open(loading_gif_path)
-            if not getattr(image, "is_animated", False):
-                logger.warning(f"Loading GIF '{loading_gif_path}' is not animated.")
-                return
-        except IOError:
-            logger.error(f"Failed to load loading GIF '{loading_gif_path}'.")
-            return
-        logger.info("Displaying loading GIF during startup.")
-        display_manager.clear_screen()
-        time.sleep(0.1)
-        while not (volumio_ready_event.is_set() and min_loading_event.is_set()):
-            for frame in ImageSequence.Iterator(image):
-                if volumio_ready_event.is_set() and min_loading_event.is_set():
-                    logger.info("Volumio ready & min load done, stopping loading GIF.")
-                    return
-                display_manager.oled.display(frame.convert(display_manager.oled.mode))
-                frame_duration = frame.info.get('duration', 100) / 1000.0
-                time.sleep(frame_duration)
-        logger.info("Exiting loading GIF display thread.")
-
-    threading.Thread(target=show_loading, daemon=True).start()
-
-    # Minimum loading duration
-    def set_min_loading_event():
-        time.sleep(MIN_LOADING_DURATION)
-        min_loading_event.set()
-        logger.info("Minimum loading duration has elapsed.")
-
-    threading.Thread(target=set_min_loading_event, daemon=True).start()
-
-    # --- Wait for both loading events then run Ready GIF ---
-    logger.info("Waiting for Volumio readiness & min load time.")
-    volumio_ready_event.wait()
-    min_loading_event.wait()
-    logger.info("Volumio is ready & min loading time passed, proceeding to ready GIF.")
-
-    show_gif_loop(first_ready_path, lambda: True, display_manager, logger)
-
-    # Now show "looping ready" GIF until remote/IR event or playback/other ready_stop_event
-    def show_ready_gif_until_event(stop_event, gif_path):
-        try:
-            image = Image.open(gif_path)
-            if not getattr(image, "is_animated", False):
-                display_manager.oled.display(image.convert(display_manager.oled.mode))
-                return
-            while not stop_event.is_set():
-                for frame in ImageSequence.Iterator(image):
-                    if stop_event.is_set():
-                        return
-                    display_manager.oled.display(frame.convert(display_manager.oled.mode))
-                    frame_duration = frame.info.get('duration', 100) / 1000.0
-                    time.sleep(frame_duration)
-        except Exception as e:
-            logger.error(f"Failed to loop GIF {gif_path}: {e}")
-
-    ready_loop_path = display_config.get('ready_loop_path', 'ready_loop.gif')
-    threading.Thread(
-        target=show_ready_gif_until_event,
-        args=(ready_stop_event, ready_loop_path),
-        daemon=True
-    ).start()
-    ready_stop_event.wait()
-    logger.info("Ready GIF exited, continuing to UI startup.")
-
-    if is_first_time_user:
-        set_has_seen_ready()
-
-    # --- Now the main UI, ModeManager, screens, etc ---
-    clock_config = config.get('clock', {})
-    clock = Clock(display_manager, clock_config, volumio_listener)
-    clock.logger = logging.getLogger("Clock")
-    clock.logger.setLevel(logging.INFO)
-
-    mode_manager = ModeManager(
-        display_manager=display_manager,
-        clock=clock,
-        volumio_listener=volumio_listener,
-        preference_file_path="../preference.json",
-        config=config
-    )
+    # --- Boot phases: run alongside the animations below ---
+    def preload_phase():
+        return BackgroundImporter(PRELOAD_MODULES).start().wait()
+
+    def volumio_phase():
+        import RPi.GPIO as GPIO
+        GPIO.setwarnings(False)
+        from network.volumio_listener import VolumioListener
+
+        volumio_cfg = config.get('volumio', {})
+        volumio_host = volumio_cfg.get('host', 'localhost')
+        volumio_port = volumio_cfg.get('port', 3000)
+        volumio_listener = VolumioListener(host=volumio_host, port=volumio_port)
+        # Usually connected by now; otherwise the first (re)connect is stamped
+        volumio_listener.connected.connect(
+            lambda sender: TIMELINE.mark_once("listener_connected"), weak=False)
+        if volumio_listener.is_connected():
+            TIMELINE.mark_once("listener_connected")
+        volumio_listener.state_changed.connect(on_state_changed)
+        # The first pushState may already have arrived while connecting
+        current_state = volumio_listener.get_current_state()
+        if current_state and current_state.get('status'):
+            on_state_changed(volumio_listener, current_state)
+        return volumio_listener
+
+    def assets_phase():
+        # Pre-decode the remaining boot animations while the logo plays
+        for key, default in (('loading_gif_path', 'loading.gif'),
+                             ('ready_gif_path', 'ready.gif'),
+                             ('ready_new_path', 'ready_new.gif'),
+                             ('ready_loop_path', 'ready_loop.gif')):
+            display_manager.load_animation(display_config.get(key, default), fit="crop")
+        # Keep the early splash (scripts/early_splash.py) in step with the logo
+        display_manager.update_splash()
+
+    def managers_phase():
+        from display.screens.clock import Clock
+        from managers.mode_manager import ModeManager
+        from managers.manager_factory import ManagerFactory
+
+        volumio_listener = boot.wait("volumio")
+
+        clock_config = config.get('clock', {})
+        clock = Clock(display_manager, clock_config, volumio_listener)
+        clock.logger = logging.getLogger("Clock")
+        clock.logger.setLevel(logging.INFO)
+
+        # Volumio states are connected at handover, so nothing can draw over the boot animations
+        mode_manager = ModeManager(
+            display_manager=display_manager,
+            clock=clock,
+            volumio_listener=None,
+            preference_file_path="../preference.json",
+            config=config
+        )
+        mode_manager.volumio_listener = volumio_listener
 
-    manager_factory = ManagerFactory(
-        display_manager=display_manager,
-        volumio_listener=volumio_listener,
-        mode_manager=mode_manager,
-        config=config
-    )
-    manager_factory.setup_mode_manager()
-    volumio_listener.mode_manager = mode_manager
+        manager_factory = ManagerFactory(
+            display_manager=display_manager,
+            volumio_listener=volumio_listener,
+            mode_manager=mode_manager,
+            config=config
+        )
+        manager_factory.setup_mode_manager()
+
+        # Build whatever the first real screen will be now rather than after the ready GIF
+        mode_manager.registry.get("menu_manager")
+        display_mode = mode_manager.config.get("display_mode", "original")
+        mode_manager.registry.get(f"{display_mode}_screen")
+        return clock, mode_manager
+
+    boot.add("preload", preload_phase)
+    boot.add("volumio", volumio_phase)
+    if snapshot is None:
+        boot.add("assets", assets_phase)
+    boot.add("managers", managers_phase, after=("preload",))
+    boot.start()
+
+    # --- Command server: up early so the IR remote can exit the ready GIF ---
+    # The remote's own commands are registered at handover (register_remote_commands)
+    def handle_command(command):
+        if not ready_stop_event.is_set() and command in ["menu", "select", "ok", "toggle"]:
+            logger.info(f"Command '{command}' received during boot, exiting ready screen.")
+            ready_stop_event.set()
+        else:
+            logger.warning(f"No mapping for command: {command}")
 
-    current_state = volumio_listener.get_current_state()
-    if current_state and current_state.get("status") == "play":
-        mode_manager.process_state_change(volumio_listener, current_state)
+    command_server = CommandServer(
+        fallback=handle_command,
+        on_first_command=lambda command: TIMELINE.mark_once("first_command_served"),
+    )
+    command_server.register("boot_timeline", TIMELINE.to_json)
+    try:
+        command_server.start()
+    except OSError as e:
+        logger.error(f"Could not start command server => {e}")
+
+    # --- Cold boot: network setup, logo, loading and ready GIFs ---
+    def play_boot_sequence():
+        # --- First Run: Show Network Setup GIFs ---
+        if is_first_run():
+            connecting_gif = display_config.get('connecting_path', 'connecting.gif')
+            connected_gif = display_config.get('connected_path', 'connected.gif')
+            logger.info("First run detected. Showing 'connecting' GIF until network is up.")
+            with boot.stage("network"):
+                show_gif_loop(
+                    connecting_gif,
+                    lambda: is_network_online(),
+                    display_manager,
+                    logger
+                )
+            logger.info("Network connected! Showing 'connected' GIF for 2 seconds.")
+            show_gif_loop(
+                connected_gif,
+                lambda: True,
+                display_manager,
+                logger
+            )
+            time.sleep(2)
+
+        # --- Determine which ready GIF to show first ---
+        if not has_seen_ready():
+            first_ready_path = display_config.get('ready_new_path', 'ready_new.gif')
+            logger.info("Showing 'ready_new.gif' for new user.")
+            is_first_time_user = True
+        else:
+            first_ready_path = display_config.get('ready_gif_path', 'ready.gif')
+            logger.info("Showing 'ready.gif' for returning user.")
+            is_first_time_user = False
+
+        # --- Startup Logo: cosmetic, ends as soon as boot work is done (within min/max) ---
+        logger.info("Displaying startup logo...")
+        with boot.stage("logo"):
+            logo_start = time.monotonic()
+            display_manager.show_logo(
+                duration=LOGO_MAX_DURATION,
+                stop_condition=lambda: (time.monotonic() - logo_start >= LOGO_MIN_DURATION
+                                        and boot.all_done())
+            )
+        logger.info("Startup logo display complete.")
+        if display_manager.writer.first_write_time is not None:
+            TIMELINE.mark_once("first_frame", at=display_manager.writer.first_write_time)
+        display_manager.clear_screen()
+        logger.info("Screen cleared after logo display.")
+
+        # --- Loading GIF: only while Volumio still isn't ready ---
+        loading_start = time.monotonic()
+        def loading_done():
+            return (volumio_ready_event.is_set()
+                    and time.monotonic() - loading_start >= MIN_LOADING_DURATION)
+
+        if not loading_done():
+            loading_gif_path = display_config.get('loading_gif_path', 'loading.gif')
+            logger.info("Displaying loading GIF until Volumio is ready.")
+            with boot.stage("loading"):
+                show_gif_loop(loading_gif_path, loading_done, display_manager, logger)
+            logger.info("Volumio ready & min load done, stopping loading GIF.")
+        volumio_ready_event.wait()
+        logger.info("Volumio is ready, proceeding to ready GIF.")
+
+        show_gif_loop(first_ready_path, lambda: True, display_manager, logger)
+
+        # Now show "looping ready" GIF until remote/IR event or playback/other ready_stop_event
+        def show_ready_gif_until_event(stop_event, gif_path):
+            animation = display_manager.load_animation(gif_path, fit="crop")
+            if animation is None:
+                logger.error(f"Failed to loop GIF {gif_path}.")
+                return
+            if not animation.is_animated:
+                # A still image is shown once and left up
+                display_manager.play_animation(gif_path, fit="crop")
+                return
+            display_manager.play_animation(gif_path, stop_event.is_set, fit="crop")
+
+        ready_loop_path = display_config.get('ready_loop_path', 'ready_loop.gif')
+        threading.Thread(
+            target=show_ready_gif_until_event,
+            args=(ready_stop_event, ready_loop_path),
+            daemon=True
+        ).start()
+        with boot.stage("ready"):
+            ready_stop_event.wait()
+        logger.info("Ready GIF exited, continuing to UI startup.")
+
+        if is_first_time_user:
+            set_has_seen_ready()
+
+    # --- Warm restart: redraw the last frame and go straight to the UI ---
+    if snapshot is not None:
+        TIMELINE.mark("warm_restart")
+        ready_stop_event.set()
+        if snapshot.frame is not None:
+            display_manager.show(snapshot.frame)
+            display_manager.flush()
+            TIMELINE.mark_once("first_frame", at=display_manager.writer.first_write_time)
+        logger.info(f"Warm restart: resuming '{snapshot.mode}' without boot animations.")
     else:
-        mode_manager.trigger("to_menu")
+        play_boot_sequence()
+
+    volumio_listener = boot.wait("volumio")
+
+    # --- Handover: the main UI, ModeManager, screens were built during boot ---
+    with boot.stage("handover"):
+        clock, mode_manager = boot.wait("managers")
+        volumio_listener.state_changed.connect(mode_manager.process_state_change)
+        volumio_listener.mode_manager = mode_manager
+        register_remote_commands(command_server, mode_manager, volumio_listener, display_manager)
+
+        current_state = volumio_listener.get_current_state()
+        if not current_state and snapshot is not None:
+            # No pushState yet: go by what was playing before the restart
+            current_state = snapshot.volumio_state
+        if current_state and current_state.get("status") == "play":
+            mode_manager.process_state_change(volumio_listener, current_state)
+        elif snapshot is None or not mode_manager.resume_mode(snapshot.mode):
+            mode_manager.trigger("to_menu")
     logger.info("Startup mode determined from current Volumio state.")
-
-    # Restart the command server with real mode_manager (optional, but safe)
-    threading.Thread(
-        target=cyfi_command_server,
-        args=(mode_manager, volumio_listener, display_manager, ready_stop_event),
-        daemon=True
-    ).start()
+    TIMELINE.mark("interactive")
+    boot.log_summary()
+
+    # --- Keep a snapshot for the next (warm) restart ---
+    snapshot_writer = None
+    if warm_restart_window:
+        snapshot_writer = SnapshotWriter(
+            snapshot_path,
+            lambda: (mode_manager.get_mode(), volumio_listener.get_current_state(),
+                     mode_manager.get_preferences()),
+            display_manager.writer,
+            interval=boot_config.get('snapshot_interval', 5),
+        ).start()
+
+    if IMPORT_PROFILER is not None:
+        IMPORT_PROFILER.log_report()
 
     # --- Main loop ---
     try:
@@ -448,16 +499,41 @@ def main():
             time.sleep(1)
     except KeyboardInterrupt:
         logger.info("Shutting down CyFi via KeyboardInterrupt.")
+        # A deliberate stop: the next start should be a normal boot
+        if snapshot_writer is not None:
+            snapshot_writer.stop()
+        BootSnapshot.discard(snapshot_path)
     finally:
         try:
             volumio_listener.stop_listener()
         except Exception:
             pass
+        command_server.stop()
         clock.stop()
         display_manager.clear_screen()
+        display_manager.flush()
         logger.info("CyFi shut down gracefully.")
 
+def spare_warm_paths(config):
+    """Fonts and boot images a spare reads ahead so takeover doesn't wait on the SD card."""
+    display_config = config.get('display', {})
+    paths = [font.get('path') for font in display_config.get('fonts', {}).values()
+             if isinstance(font, dict)]
+    paths += [value for key, value in display_config.items()
+              if key.endswith('_path') and isinstance(value, str)]
+    return [path for path in paths if path and os.path.isfile(path)]
+
 if __name__ == "__main__":
+    if "--spare" in sys.argv:
+        from boot.supervisor import park_as_spare
+        configure_logging()
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        spare_config = load_config(os.path.join(script_dir, '..', 'config.yaml'))
+        if not park_as_spare(SPARE_MODULES, spare_warm_paths(spare_config)):
+            sys.exit(0)
+        # The timeline started when the spare did; count from the takeover instead
+        TIMELINE.reset()
+        TIMELINE.mark("spare_activated")
     main()
 
 
@@ -26,67 +26,43 @@ class ManagerFactory:
 
     def setup_mode_manager(self):
         """
-        Create and configure all managers/screens, then assign them to ModeManager (or other places).
+        Register how to build every manager/screen with ModeManager's registry.
+        Nothing is constructed here: each object is created the first time
+        its state is entered (see ManagerRegistry), and idle ones can be
+        released again.
         """
-        # ----- Create each object -----
-
-        # CyFi "menu" managers
-        menu_manager         = self.create_menu_manager()
-        tidal_manager        = self.create_tidal_manager()
-        qobuz_manager        = self.create_qobuz_manager()
-        playlist_manager     = self.create_playlist_manager()
-        motherearth_manager  = self.create_motherearth_manager()
-        radioparadise_manager = self.create_radioparadise_manager()
-        radio_manager        = self.create_radio_manager()
-        spotify_manager      = self.create_spotify_manager()
-        library_manager      = self.create_library_manager()
-        usb_library_manager  = self.create_usb_library_manager()
-
-        # Quoode/CyFi common screens
-        webradio_screen      = self.create_webradio_screen()
-        modern_screen        = self.create_modern_screen()
-        minimal_screen        = self.create_minimal_screen()
-        original_screen      = self.create_original_screen()
-        airplay_screen      = self.create_airplay_screen()
+        registry = self.mode_manager.registry
+
+        # CyFi "menu" managers (the main menu is kept once built)
+        registry.register("menu_manager",          self.create_menu_manager, keep=True)
+        registry.register("tidal_manager",         self.create_tidal_manager)
+        registry.register("qobuz_manager",         self.create_qobuz_manager)
+        registry.register("playlist_manager",      self.create_playlist_manager)
+        registry.register("motherearth_manager",   self.create_motherearth_manager)
+        registry.register("radioparadise_manager", self.create_radioparadise_manager)
+        registry.register("radio_manager",         self.create_radio_manager)
+        registry.register("spotify_manager",       self.create_spotify_manager)
+        registry.register("library_manager",       self.create_library_manager)
+        registry.register("usb_library_manager",   self.create_usb_library_manager)
+
+        # Quoode/CyFi common screens (entered on every playback, so kept once built)
+        registry.register("webradio_screen",       self.create_webradio_screen, keep=True)
+        registry.register("modern_screen",         self.create_modern_screen, keep=True)
+        registry.register("minimal_screen",        self.create_minimal_screen, keep=True)
+        registry.register("original_screen",       self.create_original_screen, keep=True)
+        registry.register("airplay_screen",        self.create_airplay_screen, keep=True)
 
         # Additional items referenced by new ModeManager states
-        config_menu          = self.create_config_menu()
-        clock_menu           = self.create_clock_menu()
-        remote_menu           = self.create_remote_menu()
-        display_menu         = self.create_display_menu()
-        screensaver_menu     = self.create_screensaver_menu()
-        screensaver          = self.create_screensaver()
-        system_info_screen   = self.create_system_info_screen()
-        system_update_menu   = self.create_system_update_menu()
-
-        # ----- Assign them to ModeManager via the set_* methods -----
-        self.mode_manager.set_menu_manager(menu_manager)
-        self.mode_manager.set_config_menu(config_menu)
-        self.mode_manager.set_tidal_manager(tidal_manager)
-        self.mode_manager.set_qobuz_manager(qobuz_manager)
-        self.mode_manager.set_playlist_manager(playlist_manager)
-        self.mode_manager.set_radio_manager(radio_manager)
-        self.mode_manager.set_motherearth_manager(motherearth_manager)
-        self.mode_manager.set_radioparadise_manager(radioparadise_manager)
-        self.mode_manager.set_spotify_manager(spotify_manager)
-        self.mode_manager.set_library_manager(library_manager)
-        self.mode_manager.set_usb_library_manager(usb_library_manager)
-
-        self.mode_manager.set_webradio_screen(webradio_screen)
-        self.mode_manager.set_modern_screen(modern_screen)
-        self.mode_manager.set_minimal_screen(minimal_screen)
-        self.mode_manager.set_original_screen(original_screen)
-        self.mode_manager.set_airplay_screen(airplay_screen)
-
-        self.mode_manager.set_clock_menu(clock_menu)
-        self.mode_manager.set_remote_menu(remote_menu)
-        self.mode_manager.set_display_menu(display_menu)
-        self.mode_manager.set_screensaver_menu(screensaver_menu)
-        self.mode_manager.set_screensaver(screensaver)
-        self.mode_manager.set_system_info_screen(system_info_screen)
-        self.mode_manager.set_system_update_menu(system_update_menu)
-
-        self.logger.info("ManagerFactory: ModeManager fully configured with managers & screens.")
+        registry.register("config_menu",           self.create_config_menu)
+        registry.register("clock_menu",            self.create_clock_menu)
+        registry.register("remote_menu",           self.create_remote_menu)
+        registry.register("display_menu",          self.create_display_menu)
+        registry.register("screensaver_menu",      self.create_screensaver_menu)
+        registry.register("screensaver",           self.create_screensaver, keep=True)
+        registry.register("system_info_screen",    self.create_system_info_screen)
+        registry.register("system_update_menu",    self.create_system_update_menu)
+
+        self.logger.info("ManagerFactory: ModeManager registry configured; managers are built on first use.")
 
     # ----------------------------------------------------------------
     #  Create Methods for each manager/screen
@@ -0,0 +1,139 @@
+# src/managers/manager_registry.py
+
+import logging
+import threading
+import time
+
+
+class ManagerRegistry:
+    """
+    Builds managers/screens on first use instead of all at startup.
+
+    ManagerFactory registers a factory per name ("menu_manager",
+    "modern_screen", ...); ModeManager reads those names through
+    ManagedAttribute descriptors, so nothing is constructed (no threads,
+    signal connections or HTTP sessions) until a state actually needs it.
+
+    peek() returns an instance only if it already exists, which is what
+    anything sweeping over "all" managers (stop_all_screens) should use.
+    release_idle() drops instances that haven't been used for a while so
+    memory is returned on small boards; the next get() just rebuilds them.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        # RLock: a factory may itself touch another registered manager
+        self._lock = threading.RLock()
+        self._factories = {}
+        self._keep = set()
+        self._instances = {}
+        self._last_used = {}
+
+        # Stats
+        self.build_times = {}
+        self.releases = 0
+
+    def register(self, name, factory, keep=False):
+        """
+        Register `factory()` as the way to build `name`. keep=True exempts
+        it from release_idle() (e.g. screens entered on every playback).
+        """
+        with self._lock:
+            self._factories[name] = factory
+            if keep:
+                self._keep.add(name)
+            else:
+                self._keep.discard(name)
+
+    def get(self, name):
+        """Return the instance for `name`, building it now if needed (None if unknown)."""
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                factory = self._factories.get(name)
+                if factory is None:
+                    return None
+                start = time.perf_counter()
+                instance = factory()
+                elapsed = time.perf_counter() - start
+                self._instances[name] = instance
+                self.build_times[name] = elapsed
+                self.logger.info(f"ManagerRegistry: built '{name}' in {elapsed * 1000:.1f} ms.")
+            self._last_used[name] = time.monotonic()
+            return instance
+
+    def peek(self, name):
+        """Return the instance for `name` only if it has already been built."""
+        return self._instances.get(name)
+
+    def set(self, name, instance):
+        """Install (or with None, forget) a ready-made instance for `name`."""
+        with self._lock:
+            if instance is None:
+                self._instances.pop(name, None)
+                self._last_used.pop(name, None)
+            else:
+                self._instances[name] = instance
+                self._last_used[name] = time.monotonic()
+
+    def constructed(self):
+        """Names of the instances that currently exist."""
+        with self._lock:
+            return list(self._instances)
+
+    def release_idle(self, max_idle):
+        """
+        Drop instances that are not active, not kept, and unused for at
+        least `max_idle` seconds. Returns the released names.
+        """
+        if not max_idle or max_idle <= 0:
+            return []
+        now = time.monotonic()
+        released = []
+        with self._lock:
+            for name, instance in list(self._instances.items()):
+                if name in self._keep or name not in self._factories:
+                    continue
+                if getattr(instance, "is_active", False):
+                    continue
+                if now - self._last_used.get(name, now) < max_idle:
+                    continue
+                del self._instances[name]
+                self._last_used.pop(name, None)
+                released.append(name)
+            self.releases += len(released)
+        if released:
+            self.logger.info(f"ManagerRegistry: released idle {released}.")
+        return released
+
+    def get_stats(self):
+        """Return which managers exist and how long each took to build (ms)."""
+        with self._lock:
+            return {
+                "registered": len(self._factories),
+                "constructed": sorted(self._instances),
+                "build_ms": {name: round(t * 1000, 1) for name, t in self.build_times.items()},
+                "releases": self.releases,
+            }
+
+
+class ManagedAttribute:
+    """
+    Descriptor that exposes a ManagerRegistry entry as a plain attribute of
+    the owner (which must have a `registry`). Reading it builds the manager
+    on first use; assigning installs an instance, and assigning None
+    forgets it.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.registry.get(self.name)
+
+    def __set__(self, obj, value):
+        obj.registry.set(self.name, value)
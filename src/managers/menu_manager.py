@@ -20,21 +20,22 @@ class MenuManager:
         self.stream_menu_items = ["Tidal", "Qobuz", "Spotify", "MotherE", "RadioP"]
         self.library_menu_items = ["NAS", "USB"]
         self.display_menu_items = ["Display", "Screensavers", "Clock", "Contrast"]
+        # Menu label => DisplayManager icon name (sized variants come from get_icon)
         self.icons = {
-            "Stream": self.display_manager.icons.get("stream"),
-            "Library": self.display_manager.icons.get("library"),
-            "Radio": self.display_manager.icons.get("webradio"),
-            "RadioP": self.display_manager.icons.get("radio_paradise"),
-            "MotherE": self.display_manager.icons.get("motherearthradio"),
-            "Playlists": self.display_manager.icons.get("playlists"),
-            "Tidal": self.display_manager.icons.get("tidal"),
-            "Qobuz": self.display_manager.icons.get("qobuz"),
-            "Spotify": self.display_manager.icons.get("spop"),
-            "NAS": self.display_manager.icons.get("nas"), 
-            "USB": self.display_manager.icons.get("usb"),
-            "Config": self.display_manager.icons.get("config"),
-            "Original": self.display_manager.icons.get("display"),
-            "Modern": self.display_manager.icons.get("display")
+            "Stream": "stream",
+            "Library": "library",
+            "Radio": "webradio",
+            "RadioP": "radio_paradise",
+            "MotherE": "motherearthradio",
+            "Playlists": "playlists",
+            "Tidal": "tidal",
+            "Qobuz": "qobuz",
+            "Spotify": "spop",
+            "NAS": "nas",
+            "USB": "usb",
+            "Config": "config",
+            "Original": "display",
+            "Modern": "display"
         }
         self.current_selection_index = 0
         self.is_active = False
@@ -85,39 +86,31 @@ class MenuManager:
             x_offset = (total_width - total_icons_width) // 2 + offset_x
             y_position = (total_height - icon_size) // 2 - 10
 
-            base_image = Image.new("RGB", self.display_manager.oled.size, "black")
-            draw_obj = ImageDraw.Draw(base_image)
+            base_image = self.display_manager.acquire_canvas()
+            draw_obj = self.display_manager.get_draw(base_image)
 
             for i, item in enumerate(visible_items):
                 actual_index = self.window_start_index + i
-                icon = self.icons.get(item, self.display_manager.default_icon)
-                if icon.mode == "RGBA":
-                    background = Image.new("RGB", icon.size, (0, 0, 0))
-                    background.paste(icon, mask=icon.split()[3])
-                    icon = background
-                icon = icon.resize((icon_size, icon_size), Image.ANTIALIAS)
+                icon = self.display_manager.get_icon(self.icons.get(item), (icon_size, icon_size))
                 x = x_offset + i * (icon_size + spacing)
                 y_adjustment = -5 if actual_index == self.current_selection_index else 0
                 base_image.paste(icon, (x, y_position + y_adjustment))
                 label = item
                 font = self.display_manager.fonts.get(
-                    self.bold_font_key if actual_index == self.current_selection_index else self.font_key, ImageFont.load_default())
+                    self.bold_font_key if actual_index == self.current_selection_index else self.font_key)
                 text_color = "white" if actual_index == self.current_selection_index else "black"
                 text_width, text_height = draw_obj.textsize(label, font=font)
                 text_x = x + (icon_size - text_width) // 2
                 text_y = y_position + icon_size + 2
                 draw_obj.text((text_x, text_y), label, font=font, fill=text_color)
 
-            base_image = base_image.convert(self.display_manager.oled.mode)
-            self.display_manager.oled.display(base_image)
+            # Already in the display mode: show the pooled canvas itself so it gets released
+            self.display_manager.show(base_image)
 
     def slide_in_right(self, duration=0.5, fps=30):
         w = self.display_manager.oled.width
-        frames = int(duration * fps)
-        for step in range(frames + 1):
-            offset = int(w - (w * step) / frames)
-            self.draw_menu(offset_x=offset)
-            time.sleep(duration / frames)
+        self.display_manager.animation_clock.transition(
+            duration, lambda progress: self.draw_menu(offset_x=int(w - w * progress)), fps)
         self.display_menu()  # Ensure menu lands at offset 0
 
     def display_menu(self):
@@ -233,22 +226,17 @@ class MenuManager:
         y_position = (total_height - icon_size) // 2 - 10
 
         base_image = Image.new("RGBA", self.display_manager.oled.size, (0, 0, 0, 0))
-        draw_obj = ImageDraw.Draw(base_image)
+        draw_obj = self.display_manager.get_draw(base_image)
 
         for i, item in enumerate(visible_items):
             actual_index = self.window_start_index + i
-            icon = self.icons.get(item, self.display_manager.default_icon)
-            if icon.mode == "RGBA":
-                background = Image.new("RGB", icon.size, (0, 0, 0))
-                background.paste(icon, mask=icon.split()[3])
-                icon = background
-            icon = icon.resize((icon_size, icon_size), Image.ANTIALIAS)
+            icon = self.display_manager.get_icon(self.icons.get(item), (icon_size, icon_size))
             x = x_offset + i * (icon_size + spacing)
             y_adjustment = -5 if actual_index == self.current_selection_index else 0
             base_image.paste(icon, (x, y_position + y_adjustment))
             # Draw label
             label = item
-            font = self.display_manager.fonts.get(self.bold_font_key if actual_index == self.current_selection_index else self.font_key, ImageFont.load_default())
+            font = self.display_manager.fonts.get(self.bold_font_key if actual_index == self.current_selection_index else self.font_key)
             text_color = "white" if actual_index == self.current_selection_index else "black"
             text_width, text_height = draw_obj.textsize(label, font=font)
             text_x = x + (icon_size - text_width) // 2
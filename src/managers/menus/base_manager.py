@@ -54,6 +54,16 @@ class BaseManager(ABC):
             except Exception as e:
                 self.logger.error(f"Error in callback {callback}: {e}")
 
+    def playback_seek_ms(self, state):
+        """
+        Playback position to show, in ms: projected by the listener's shared
+        PlaybackClock, or the state's own seek if there is no listener.
+        """
+        clock = getattr(self.volumio_listener, "playback_clock", None)
+        if clock is not None:
+            return clock.position_ms()
+        return state.get("seek") or 0
+
     def clear_display(self):
         self.display_manager.clear_screen()
         self.logger.info("Cleared the display screen.")
@@ -44,7 +44,7 @@ class ClockMenu(BaseMenu):
 
         # Font
         self.font_key = "menu_font"
-        self.font = display_manager.fonts.get(self.font_key, ImageFont.load_default())
+        self.font = display_manager.fonts.get(self.font_key)
 
         # Main menu
         self.main_items = self.ensure_back_item([
@@ -36,12 +36,12 @@ class ConfigMenu(BaseMenu):
         # Map each menu item to an icon.
         # The keys for display_manager.icons should match your asset names.
         self.icons = {
-            "Display": self.display_manager.icons.get("displaysettings"),
-            "Clock": self.display_manager.icons.get("clocksettings"),
-            "Screen+": self.display_manager.icons.get("screensaversettings"),
-            "System": self.display_manager.icons.get("systeminfo"),
-            "Update": self.display_manager.icons.get("systemupdate"),
-            "Back": self.display_manager.icons.get("back")  # Use an appropriate icon
+            "Display": "displaysettings",
+            "Clock": "clocksettings",
+            "Screen+": "screensaversettings",
+            "System": "systeminfo",
+            "Update": "systemupdate",
+            "Back": "back"  # Use an appropriate icon
         }
 
     def get_visible_window(self, items, window_size):
@@ -89,22 +89,14 @@ class ConfigMenu(BaseMenu):
             y_position = (total_height - icon_size) // 2 - 10
 
             # Create an image to draw on
-            base_image = Image.new("RGB", (total_width, total_height), "black")
-            draw_obj = ImageDraw.Draw(base_image)
+            base_image = Image.new(self.display_manager.oled.mode, (total_width, total_height), "black")
+            draw_obj = self.display_manager.get_draw(base_image)
 
             # Iterate over visible items and draw icons with labels
             for i, item in enumerate(visible_items):
                 actual_index = self.window_start_index + i
-                icon = self.icons.get(item, self.display_manager.default_icon)
-
-                # Handle transparency if the icon is RGBA
-                if icon.mode == "RGBA":
-                    background = Image.new("RGB", icon.size, (0, 0, 0))
-                    background.paste(icon, mask=icon.split()[3])
-                    icon = background
-
-                # Resize the icon
-                icon = icon.resize((icon_size, icon_size), Image.ANTIALIAS)
+                # Flattened, resized & mode-converted once by DisplayManager
+                icon = self.display_manager.get_icon(self.icons.get(item), (icon_size, icon_size))
 
                 # Calculate the x-coordinate for this icon
                 x = x_offset + i * (icon_size + spacing)
@@ -116,8 +108,7 @@ class ConfigMenu(BaseMenu):
                 # Draw the label below the icon using bold font for selected items
                 label = item
                 font = self.display_manager.fonts.get(
-                    self.bold_font_key if actual_index == self.current_index else self.font_key,
-                    ImageFont.load_default()
+                    self.bold_font_key if actual_index == self.current_index else self.font_key
                 )
                 text_color = "white" if actual_index == self.current_index else "black"
 
@@ -128,7 +119,7 @@ class ConfigMenu(BaseMenu):
 
             # Convert and display the image on the OLED
             base_image = base_image.convert(self.display_manager.oled.mode)
-            self.display_manager.oled.display(base_image)
+            self.display_manager.show(base_image)
             self.logger.info("ConfigMenu: Icon row menu displayed.")
 
     def scroll_selection(self, direction):
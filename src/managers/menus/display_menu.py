@@ -49,7 +49,7 @@ class DisplayMenu(BaseMenu):
 
         # Font
         self.font_key = "menu_font"
-        self.font = display_manager.fonts.get(self.font_key, ImageFont.load_default())
+        self.font = display_manager.fonts.get(self.font_key)
 
         # MAIN menu items
         self.main_items = self.ensure_back_item([
@@ -342,7 +342,7 @@ class DisplayMenu(BaseMenu):
             # Attempt to call .contrast() if available
             if hasattr(self.display_manager.oled, "contrast"):
                 try:
-                    self.display_manager.oled.contrast(val)
+                    self.display_manager.set_contrast(val)
                     self.logger.info(f"DisplayMenu: Brightness => {level} ({val})")
                 except Exception as e:
                     self.logger.error(f"DisplayMenu: Failed to set brightness => {e}")
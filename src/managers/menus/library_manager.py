@@ -120,13 +120,13 @@ class LibraryManager(BaseMenu):
                 draw_obj.text(
                     (10, self.y_offset),
                     "Your library is not loading...",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
                 draw_obj.text(
                     (10, self.y_offset + self.line_spacing),
                     "Have you enabled it via Volumio?",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
 
@@ -382,7 +382,7 @@ class LibraryManager(BaseMenu):
             draw_obj.text(
                 (0, self.y_offset),
                 "Loading...",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -410,7 +410,7 @@ class LibraryManager(BaseMenu):
             draw_obj.text(
                 (0, y_position),
                 menu_title[:20],  # Ensure the title fits the width
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="yellow"
             )
             y_position += self.line_spacing
@@ -429,7 +429,7 @@ class LibraryManager(BaseMenu):
                 draw_obj.text(
                     (0, y_position + i * self.line_spacing),
                     f"{arrow}{item_title}",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill=fill_color
                 )
 
@@ -506,7 +506,7 @@ class LibraryManager(BaseMenu):
             draw_obj.text(
                 (0, self.y_offset),
                 "No Items Available",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -521,14 +521,14 @@ class LibraryManager(BaseMenu):
             draw_obj.text(
                 (0, self.y_offset),
                 f"Error: {title}",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="red"
             )
             # Display message
             draw_obj.text(
                 (0, self.y_offset + self.line_spacing),
                 message[:20],  # Truncate to fit
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -543,14 +543,14 @@ class LibraryManager(BaseMenu):
             draw_obj.text(
                 (0, self.y_offset),
                 f"{title}",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="green"
             )
             # Display message
             draw_obj.text(
                 (0, self.y_offset + self.line_spacing),
                 message[:20],  # Truncate to fit
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
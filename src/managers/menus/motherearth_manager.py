@@ -30,8 +30,8 @@ class MotherEarthManager(BaseManager):
         # Font settings (keys defined in your config)
         self.font_key = 'menu_font'
         self.bold_font_key = 'menu_font_bold'
-        self.font = self.display_manager.fonts.get(self.font_key, ImageFont.load_default())
-        self.font_bold = self.display_manager.fonts.get(self.bold_font_key, ImageFont.load_default())
+        self.font = self.display_manager.fonts.get(self.font_key)
+        self.font_bold = self.display_manager.fonts.get(self.bold_font_key)
 
         # Tracking the last requested URI (for browseLibrary calls)
         self.last_requested_uri = None
@@ -168,13 +168,13 @@ class PlaylistManager(BaseMenu):
                 draw_obj.text(
                     (10, self.y_offset),
                     "Playlists are not loading...",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
                 draw_obj.text(
                     (10, self.y_offset + self.line_spacing),
                     "Have you created your playlists on Volumio?",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
             self.display_manager.draw_custom(draw)
@@ -188,7 +188,7 @@ class PlaylistManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 "Loading Playlists...",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
         self.display_manager.draw_custom(draw)
@@ -205,7 +205,7 @@ class PlaylistManager(BaseMenu):
                 draw_obj.text(
                     (10, self.y_offset + i * self.line_spacing),
                     f"{arrow}{item_title}",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white" if actual_index == self.current_selection_index else "gray"
                 )
         self.display_manager.draw_custom(draw)
@@ -274,7 +274,7 @@ class PlaylistManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 "No Playlists Available",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
         self.display_manager.draw_custom(draw)
@@ -299,13 +299,13 @@ class PlaylistManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 f"Error: {title}",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="red"
             )
             draw_obj.text(
                 (10, self.y_offset + self.line_spacing),
                 message,
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
         self.display_manager.draw_custom(draw)
@@ -66,13 +66,13 @@ class QobuzManager(BaseMenu):
                 draw_obj.text(
                     (10, self.y_offset),
                     "Qobuz is not loading...",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
                 draw_obj.text(
                     (10, self.y_offset + self.line_spacing),
                     "Have you logged in via Volumio?",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
             self.display_manager.draw_custom(draw)
@@ -164,7 +164,7 @@ class QobuzManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 "Loading Qobuz...",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -216,7 +216,7 @@ class QobuzManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 "No Qobuz Items Available",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -236,7 +236,7 @@ class QobuzManager(BaseMenu):
                 draw_obj.text(
                     (10, self.y_offset + i * self.line_spacing),
                     f"{arrow}{title}",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white" if actual_index == self.current_selection_index else "gray"
                 )
 
@@ -370,14 +370,14 @@ class QobuzManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 f"Error: {title}",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
             # Draw error message in white
             draw_obj.text(
                 (10, self.y_offset + self.line_spacing),
                 message,
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
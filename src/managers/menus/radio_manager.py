@@ -28,7 +28,7 @@ class RadioManager(BaseMenu):
         self.current_selection_index = 0
         self.current_menu = "categories"  # Start in the categories menu
         self.font_key = 'menu_font'
-        self.font = self.display_manager.fonts.get(self.font_key, ImageFont.load_default())
+        self.font = self.display_manager.fonts.get(self.font_key)
         self.menu_stack = []  # Stack for back navigation
         self.is_active = False
         self.window_start_index = 0  # Initialize window_start_index
@@ -41,7 +41,7 @@ class RemoteMenu(BaseMenu):
 
         # Font for the menu
         self.font_key = "menu_font"
-        self.font = display_manager.fonts.get(self.font_key, ImageFont.load_default())
+        self.font = display_manager.fonts.get(self.font_key)
 
         # Define the remote configuration options (folder names).
         self.remote_options = [
@@ -48,7 +48,7 @@ class ScreensaverMenu(BaseMenu):
 
         # Font
         self.font_key = "menu_font"
-        self.font = display_manager.fonts.get(self.font_key) or ImageFont.load_default()
+        self.font = display_manager.fonts.get(self.font_key)
 
         # Main menu items
         self.main_items = self.ensure_back_item([
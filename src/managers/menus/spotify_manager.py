@@ -65,13 +65,13 @@ class SpotifyManager(BaseMenu):
                 draw_obj.text(
                     (10, self.y_offset),
                     "Spotify is not loading...",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
                 draw_obj.text(
                     (10, self.y_offset + self.line_spacing),
                     "Have you logged in via Volumio?",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
             self.display_manager.draw_custom(draw)
@@ -160,7 +160,7 @@ class SpotifyManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 "Loading Spotify...",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -221,7 +221,7 @@ class SpotifyManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 "No Spotify Items Available",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -241,7 +241,7 @@ class SpotifyManager(BaseMenu):
                 draw_obj.text(
                     (10, self.y_offset + i * self.line_spacing),
                     f"{arrow}{title}",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white" if actual_index == self.current_selection_index else "gray"
                 )
 
@@ -364,14 +364,14 @@ class SpotifyManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 f"Error: {title}",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="red"
             )
             # Display message
             draw_obj.text(
                 (10, self.y_offset + self.line_spacing),
                 message,
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
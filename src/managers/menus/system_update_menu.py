@@ -41,7 +41,7 @@ class SystemUpdateMenu(BaseMenu):
 
         # Font
         self.font_key = "menu_font"
-        self.font = display_manager.fonts.get(self.font_key, ImageFont.load_default())
+        self.font = display_manager.fonts.get(self.font_key)
 
         # MAIN menu items
         self.main_items = self.ensure_back_item([
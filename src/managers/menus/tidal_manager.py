@@ -75,13 +75,13 @@ class TidalManager(BaseMenu):
                 draw_obj.text(
                     (10, self.y_offset),
                     "Tidal is not loading...",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
                 draw_obj.text(
                     (10, self.y_offset + self.line_spacing),
                     "Have you logged in via Volumio?",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
 
@@ -175,7 +175,7 @@ class TidalManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 "Loading Tidal...",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -236,7 +236,7 @@ class TidalManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 "No Tidal Items Available",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -256,7 +256,7 @@ class TidalManager(BaseMenu):
                 draw_obj.text(
                     (10, self.y_offset + i * self.line_spacing),
                     f"{arrow}{title}",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white" if actual_index == self.current_selection_index else "gray"
                 )
 
@@ -392,14 +392,14 @@ class TidalManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 f"Error: {title}",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
             # Display message in white
             draw_obj.text(
                 (10, self.y_offset + self.line_spacing),
                 message,
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -66,13 +66,13 @@ class USBLibraryManager(BaseMenu):
                 draw_obj.text(
                     (10, self.y_offset),
                     "Your library is not loading...",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
                 draw_obj.text(
                     (10, self.y_offset + self.line_spacing),
                     "Have you enabled it via Volumio?",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white"
                 )
 
@@ -163,7 +163,7 @@ class USBLibraryManager(BaseMenu):
                 draw_obj.text(
                     (10, self.y_offset + i * self.line_spacing),
                     f"{arrow}{item_title}",
-                    font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                    font=self.display_manager.fonts.get(self.font_key),
                     fill="white" if actual_index == self.current_selection_index else "gray"
                 )
 
@@ -229,7 +229,7 @@ class USBLibraryManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 "Loading USB Library...",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -243,7 +243,7 @@ class USBLibraryManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 "No USB Items Available",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -258,14 +258,14 @@ class USBLibraryManager(BaseMenu):
             draw_obj.text(
                 (10, self.y_offset),
                 f"Error: {title}",
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="red"
             )
             # Display message
             draw_obj.text(
                 (10, self.y_offset + self.line_spacing),
                 message,
-                font=self.display_manager.fonts.get(self.font_key, ImageFont.load_default()),
+                font=self.display_manager.fonts.get(self.font_key),
                 fill="white"
             )
 
@@ -5,6 +5,7 @@ import threading
 import time
 import subprocess
 from transitions import Machine
+from managers.manager_registry import ManagerRegistry, ManagedAttribute
 
 class ModeManager:
     """
@@ -43,6 +44,41 @@ class ModeManager:
         {'name': 'airplay',          'on_enter': 'enter_airplay'},
     ]
 
+    # Managers/screens are built on first use by self.registry (see ManagerFactory)
+    menu_manager = ManagedAttribute()
+    config_menu = ManagedAttribute()
+    playlist_manager = ManagedAttribute()
+    radio_manager = ManagedAttribute()
+    tidal_manager = ManagedAttribute()
+    qobuz_manager = ManagedAttribute()
+    motherearth_manager = ManagedAttribute()
+    radioparadise_manager = ManagedAttribute()
+    spotify_manager = ManagedAttribute()
+    library_manager = ManagedAttribute()
+    usb_library_manager = ManagedAttribute()
+    original_screen = ManagedAttribute()
+    modern_screen = ManagedAttribute()
+    minimal_screen = ManagedAttribute()
+    webradio_screen = ManagedAttribute()
+    airplay_screen = ManagedAttribute()
+    screensaver = ManagedAttribute()
+    screensaver_menu = ManagedAttribute()
+    display_menu = ManagedAttribute()
+    clock_menu = ManagedAttribute()
+    remote_menu = ManagedAttribute()
+    system_info_screen = ManagedAttribute()
+    system_update_menu = ManagedAttribute()
+
+    # Keys persisted in preference.json
+    PREFERENCE_KEYS = (
+        "display_mode", "clock_font_key", "show_seconds", "show_date",
+        "screensaver_enabled", "screensaver_type", "screensaver_timeout",
+        "oled_brightness", "cava_enabled"
+    )
+
+    # States whose transition isn't simply "to_<state>"
+    _STATE_TRIGGERS = {"usblibrary": "to_usb_library"}
+
     def __init__(self, display_manager, clock, volumio_listener,
                  preference_file_path="../preference.json", config=None):
         """
@@ -71,37 +107,13 @@ class ModeManager:
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.preference_file_path = os.path.join(script_dir, preference_file_path)
         preferences = self._load_preferences()
-        for key in (
-            "display_mode", "clock_font_key", "show_seconds", "show_date",
-            "screensaver_enabled", "screensaver_type", "screensaver_timeout",
-            "oled_brightness", "cava_enabled"
-        ):
+        for key in self.PREFERENCE_KEYS:
             self.config[key] = preferences[key]
 
-        # References to other managers/screens (set via ManagerFactory or manually)
-        self.menu_manager = None
-        self.config_menu = None
-        self.playlist_manager = None
-        self.radio_manager = None
-        self.tidal_manager = None
-        self.qobuz_manager = None
-        self.motherearth_manager = None
-        self.radioparadise_manager = None
-        self.spotify_manager = None
-        self.library_manager = None
-        self.usb_library_manager = None
-        self.original_screen = None
-        self.modern_screen = None
-        self.minimal_screen = None
-        self.webradio_screen = None
-        self.airplay_screen = None
-        self.screensaver = None
-        self.screensaver_menu = None
-        self.display_menu = None
-        self.clock_menu = None
-        self.remote_menu = None
-        self.system_info_screen = None
-        self.system_update_menu = None
+        # Other managers/screens: registered with the registry by ManagerFactory
+        # (or set manually) and only constructed when a state first needs them
+        self.registry = ManagerRegistry()
+        self.idle_release_after = self.config.get("manager_idle_release", 600)
 
         # Idle/Screensaver logic
         self.idle_timer = None
@@ -130,7 +142,7 @@ class ModeManager:
             self.volumio_listener.state_changed.connect(self.process_state_change)
             self.logger.debug("ModeManager: Connected to volumio_listener.state_changed signal.")
         else:
-            self.logger.warning("ModeManager: volumio_listener is None, no state_changed signal linked.")
+            self.logger.info("ModeManager: no volumio_listener given; state_changed must be connected by the caller.")
 
         self.lock = threading.Lock()
         
@@ -176,11 +188,7 @@ class ModeManager:
                     data = {}
         else:
             data = {}
-        for key in (
-            "display_mode", "clock_font_key", "show_seconds", "show_date",
-            "screensaver_enabled", "screensaver_type", "screensaver_timeout",
-            "oled_brightness", "cava_enabled"
-        ):
+        for key in self.PREFERENCE_KEYS:
             if key in self.config:
                 data[key] = self.config[key]
         try:
@@ -190,6 +198,9 @@ class ModeManager:
         except IOError as e:
             self.logger.warning(f"ModeManager: Could not write to {self.preference_file_path}. Error: {e}")
 
+    def get_preferences(self):
+        return {key: self.config.get(key) for key in self.PREFERENCE_KEYS}
+
     def set_display_mode(self, mode_name):
         if mode_name in ("original", "modern", "minimal"):
             self.config["display_mode"] = mode_name
@@ -383,59 +394,28 @@ class ModeManager:
     def get_mode(self):
         return self.state
 
+    def resume_mode(self, mode):
+        """Enter `mode` directly, e.g. after a warm restart. Returns False for unknown/boot modes."""
+        if not mode or mode == "boot" or mode not in self.machine.states:
+            return False
+        self.trigger(self._STATE_TRIGGERS.get(mode, f"to_{mode}"))
+        return True
+
     def stop_all_screens(self):
         self.logger.debug("ModeManager: stop_all_screens called.")
         if self.clock:
             self.clock.stop()
-        if self.screensaver:
-            self.screensaver.stop_screensaver()
-        if self.screensaver_menu and self.screensaver_menu.is_active:
-            self.screensaver_menu.stop_mode()
-        if self.menu_manager and self.menu_manager.is_active:
-            self.menu_manager.stop_mode()
-        if self.config_menu and self.config_menu.is_active:
-            self.config_menu.stop_mode()
-        if self.clock_menu and self.clock_menu.is_active:
-            self.clock_menu.stop_mode()
-        if self.remote_menu and self.remote_menu.is_active:
-            self.remote_menu.stop_mode()
-        if self.display_menu and self.display_menu.is_active:
-            self.display_menu.stop_mode()
-        if self.radio_manager and self.radio_manager.is_active:
-            self.radio_manager.stop_mode()
-        if self.motherearth_manager and self.motherearth_manager.is_active:
-            self.motherearth_manager.stop_mode()
-        if self.radioparadise_manager and self.radioparadise_manager.is_active:
-            self.radioparadise_manager.stop_mode()
-        if self.playlist_manager and self.playlist_manager.is_active:
-            self.playlist_manager.stop_mode()
-        if self.tidal_manager and self.tidal_manager.is_active:
-            self.tidal_manager.stop_mode()
-        if self.qobuz_manager and self.qobuz_manager.is_active:
-            self.qobuz_manager.stop_mode()
-        if self.spotify_manager and self.spotify_manager.is_active:
-            self.spotify_manager.stop_mode()
-        if self.library_manager and self.library_manager.is_active:
-            self.library_manager.stop_mode()
-        if self.usb_library_manager and self.usb_library_manager.is_active:
-            self.usb_library_manager.stop_mode()
-        if self.original_screen and self.original_screen.is_active:
-            self.original_screen.stop_mode()
-        if self.modern_screen and self.modern_screen.is_active:
-            self.modern_screen.stop_mode()
-        if self.minimal_screen and self.minimal_screen.is_active:
-            self.minimal_screen.stop_mode()
-        if self.webradio_screen and self.webradio_screen.is_active:
-            self.webradio_screen.stop_mode()
-        if self.airplay_screen and self.airplay_screen.is_active:
-            self.airplay_screen.stop_mode()
-        if self.webradio_screen and self.webradio_screen.is_active:
-            self.webradio_screen.stop_mode()
-        if self.system_info_screen and self.system_info_screen.is_active:
-            self.system_info_screen.stop_mode()
-        if self.system_update_menu and self.system_update_menu.is_active:
-            self.system_update_menu.stop_mode()
-            
+        # Only managers that have actually been built can be running
+        screensaver = self.registry.peek("screensaver")
+        if screensaver:
+            screensaver.stop_screensaver()
+        for name in self.registry.constructed():
+            if name == "screensaver":
+                continue
+            manager = self.registry.peek(name)
+            if manager and getattr(manager, "is_active", False):
+                manager.stop_mode()
+
     def start_menu_inactivity_timer(self):
         self.cancel_menu_inactivity_timer()
         self.menu_inactivity_timer = threading.Timer(
@@ -482,6 +462,8 @@ class ModeManager:
         self.reset_idle_timer()
         self.update_current_mode()
         self.cancel_menu_inactivity_timer()  # No timeout on clock
+        # Back at rest: give memory held by long-unused menus/screens back
+        self.registry.release_idle(self.idle_release_after)
         
     # --- Screens ---
 
@@ -758,8 +740,9 @@ class ModeManager:
 
     def exit_screensaver(self):
         self.logger.info("ModeManager: Exiting screensaver mode.")
-        if self.screensaver:
-            self.screensaver.stop_screensaver()
+        screensaver = self.registry.peek("screensaver")
+        if screensaver:
+            screensaver.stop_screensaver()
         self.to_clock()
 
     # --- Playback / Volumio State Handling ---
@@ -889,7 +872,7 @@ class ModeManager:
                 self.minimal_screen.toggle_play_pause()
             elif current_mode == 'webradio' and self.webradio_screen:
                 self.webradio_screen.toggle_play_pause()
-            elif current_mode == 'airplay' and self.webradio_screen:
+            elif current_mode == 'airplay' and self.airplay_screen:
                 self.airplay_screen.toggle_play_pause()
             else:
                 self.logger.warning(f"No screen available to toggle play/pause in mode: {current_mode}")
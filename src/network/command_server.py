@@ -0,0 +1,101 @@
+# src/network/command_server.py
+
+import logging
+import os
+import socket
+import threading
+
+
+class CommandServer:
+    """
+    The unix socket that hardware/ir_listener.py (and anything else local)
+    sends commands to.
+
+    A client connects and writes one short UTF-8 command. The command is
+    looked up in the handlers added with register(); anything else goes to
+    the fallback handler. A handler may return a
+    string, which is sent back before the connection is closed (the IR
+    listener never reads it, so plain commands can just return None):
+
+        $ echo -n boot_timeline | socat - UNIX-CONNECT:/tmp/cyfi.sock
+    """
+
+    def __init__(self, sock_path="/tmp/cyfi.sock", fallback=None, on_first_command=None):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.sock_path = sock_path
+        self.fallback = fallback
+        self.on_first_command = on_first_command
+        self._handlers = {}
+        self._sock = None
+        self._thread = None
+        self._served = 0
+
+    def register(self, command, handler):
+        """Call handler() for `command`; its return value (if any) is the reply."""
+        self._handlers[command] = handler
+        return self
+
+    def start(self):
+        try:
+            os.unlink(self.sock_path)
+        except FileNotFoundError:
+            pass
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(self.sock_path)
+        self._sock.listen(4)
+        self._thread = threading.Thread(target=self._serve, name="CommandServer", daemon=True)
+        self._thread.start()
+        self.logger.info(f"CommandServer: listening on {self.sock_path}.")
+        return self
+
+    def stop(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        try:
+            os.unlink(self.sock_path)
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    #   Serving
+    # ------------------------------------------------------------------
+    def _serve(self):
+        while self._sock is not None:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                break
+            with conn:
+                try:
+                    self._handle(conn)
+                except Exception as e:
+                    self.logger.error(f"CommandServer: error handling command => {e}")
+
+    def _handle(self, conn):
+        conn.settimeout(2.0)
+        # Commands are a single short word, so one recv() holds all of it
+        command = conn.recv(1024).decode("utf-8", errors="replace").strip()
+        if not command:
+            return
+
+        self._served += 1
+        if self._served == 1 and self.on_first_command is not None:
+            self.on_first_command(command)
+
+        handler = self._handlers.get(command)
+        if handler is not None:
+            reply = handler()
+        elif self.fallback is not None:
+            reply = self.fallback(command)
+        else:
+            self.logger.warning(f"CommandServer: no handler for '{command}'.")
+            reply = None
+
+        if reply is not None:
+            try:
+                conn.sendall(reply.encode("utf-8"))
+            except OSError:
+                pass
@@ -0,0 +1,77 @@
+# src/network/playback_clock.py
+
+import time
+
+
+class PlaybackClock:
+    """
+    Where playback is right now, projected from the last pushState.
+
+    VolumioListener re-anchors the clock on every pushState: the reported
+    seek (ms), the monotonic time it arrived, status and duration (s). While
+    status is "play" the position advances with the monotonic clock from
+    that anchor; otherwise it stays put. Screens query position_ms() /
+    progress() instead of each keeping (and mutating) their own copy of
+    the state dict.
+
+    The anchor is one tuple swapped in a single assignment, so readers need
+    no lock and every query is O(1).
+    """
+
+    def __init__(self, time_source=time.monotonic):
+        self._time = time_source
+        # (seek_ms, anchored_at, status, duration_s)
+        self._anchor = (0, time_source(), "stop", 0)
+
+    def update(self, state):
+        """Re-anchor from a Volumio state dict (pushState / getState reply)."""
+        now = self._time()
+        seek_ms, _, status, duration_s = self._anchor
+        if "seek" in state:
+            # Web radio reports seek as None
+            seek_ms = state.get("seek") or 0
+        elif status == "play":
+            # No seek in this push: carry the projection forward
+            seek_ms = self.position_ms(now)
+        self._anchor = (
+            max(0, int(seek_ms)),
+            now,
+            state.get("status", status) or "stop",
+            state.get("duration", duration_s) or 0,
+        )
+
+    # ------------------------------------------------------------------
+    #   Queries
+    # ------------------------------------------------------------------
+    @property
+    def status(self):
+        return self._anchor[2]
+
+    @property
+    def duration(self):
+        """Track length in seconds (0 if unknown, e.g. web radio)."""
+        return self._anchor[3]
+
+    def is_playing(self):
+        return self._anchor[2] == "play"
+
+    def position_ms(self, now=None):
+        """Projected seek in milliseconds, clamped to the track's duration."""
+        seek_ms, anchored_at, status, duration_s = self._anchor
+        if status == "play":
+            now = self._time() if now is None else now
+            seek_ms += int((now - anchored_at) * 1000)
+        if duration_s:
+            seek_ms = min(seek_ms, int(duration_s * 1000))
+        return seek_ms
+
+    def position(self):
+        """Projected seek in seconds."""
+        return self.position_ms() / 1000.0
+
+    def progress(self):
+        """Fraction of the track played, 0.0 when the duration is unknown."""
+        duration_s = self._anchor[3]
+        if not duration_s:
+            return 0.0
+        return max(0.0, min(self.position_ms() / (duration_s * 1000.0), 1.0))
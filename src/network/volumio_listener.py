@@ -5,6 +5,7 @@ import logging
 import time
 import threading
 from blinker import Signal
+from network.playback_clock import PlaybackClock
 
 class VolumioListener:
     def __init__(self, host='localhost', port=3000, reconnect_delay=5):
@@ -42,6 +43,7 @@ class VolumioListener:
         # Internal state
         self.current_state = {}
         self.state_lock = threading.Lock()
+        self.playback_clock = PlaybackClock()  # projected seek between pushStates
         self._running = True
         self._reconnect_attempt = 1
 
@@ -171,6 +173,8 @@ class VolumioListener:
             self.current_state = data  # Store the current state
             if "volume" in data:
                 self.current_volume = data["volume"]
+        # Re-anchor before notifying, so listeners already see the new position
+        self.playback_clock.update(data)
         self.state_changed.send(self, state=data)
 
     def on_push_browse_library(self, data):
@@ -224,6 +228,22 @@ class VolumioListener:
         with self.state_lock:
             return self.current_state.copy()  # Return a copy to prevent external modifications
 
+    def get_or_request_state(self):
+        """
+        Return a copy of the last pushState if we have one. Otherwise ask
+        Volumio for it (the reply arrives as a normal pushState) and return
+        an empty dict. Every pushState is kept, and getState is already sent
+        on connect, so screens don't need their own getState round trip.
+        """
+        state = self.get_current_state()
+        if not state:
+            try:
+                self.logger.debug("[VolumioListener] No state yet; requesting getState.")
+                self.socketIO.emit("getState", {})
+            except Exception as e:
+                self.logger.warning(f"[VolumioListener] Failed to emit 'getState' => {e}")
+        return state
+
     def stop(self):
         """Stop the VolumioListener."""
         self._running = False